@@ -0,0 +1,32 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+# H₂ (H2) — especificação para o benchmark FCI.
+# Geometria em angstroms (aproximada, só para medir desempenho).
+
+MOLECULE = {
+    "name": "H₂",
+    "formula": "H2",
+    "atom": "H 0 0 0; H 0 0 0.74",
+    "scan": "H 0 0 0; H 0 0 {r}",  # geometria da varredura de PES (pes_scan.py)
+    "basis": "sto-3g",
+    "charge": 0,
+    "spin": 0,
+    "active": None,
+    "integrals": "h2_integrals.npz",
+}
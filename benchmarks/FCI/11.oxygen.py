@@ -0,0 +1,30 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+# Oxigênio (tripleto) (O2) — especificação para o benchmark FCI.
+# Geometria em angstroms (aproximada, só para medir desempenho).
+
+MOLECULE = {
+    "name": "Oxigênio (tripleto)",
+    "formula": "O2",
+    "atom": "O 0 0 0; O 0 0 1.2075",
+    "basis": "sto-3g",
+    "charge": 0,
+    "spin": 2,
+    "active": (8, 12),
+}
@@ -0,0 +1,377 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+"""Varredura de superfície de energia potencial (PES) com RBM.
+
+Para cada distância de ligação da lista, os integrais são gerados (PySCF
+ou, para moléculas só de hidrogênio em STO-3G, um RHF em numpy) e
+guardados em ``integrals/scan``; a RBM é treinada com SR no setor
+S_z = 0 do Hamiltoniano em spin-orbitais partindo dos parâmetros
+convergidos do ponto vizinho. A curva é cortada em segmentos contíguos
+que rodam em paralelo num pool de processos.
+
+A geometria vem da chave ``scan`` do ``MOLECULE`` (ex.: ``"H 0 0 0; H 0
+0 {r}"``) ou de ``--template``.
+
+Uso:
+    python pes_scan.py H2 --range 0.4 3.0 50 --segments 4
+    python pes_scan.py LiH --points 1.2 1.6 2.0 --optimizer adam
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import platform
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.special import erf
+
+from run_benchmarks import HERE, RBM_DIR, CHEMICAL_ACCURACY, INTEGRALS_DIR, RESULTS_DIR, load_specs, git_commit
+
+from config_index import rank_ranges
+from symmetry import spin_orbital_integrals, infer_orbsym, SymmetrySector
+from slater_condon import SlaterCondonHamiltonian
+from integral_store import IntegralStore, save_integrals
+from exact_diag import symmetry_ground_state
+from rbm_3 import RBM, train_rbm_sr
+from sampler import MetropolisSampler
+from sr_solver import SRSolver
+from optimizers import OPTIMIZERS, SCHEDULES
+
+SCAN_DIR = os.path.join(INTEGRALS_DIR, "scan")
+ANGSTROM_TO_BOHR = 1.0 / 0.52917721092
+
+# STO-3G do hidrogênio (ζ = 1.24)
+STO3G_H_EXPONENTS = np.array([3.42525091, 0.62391373, 0.16885540])
+STO3G_H_COEFFS = np.array([0.15432897, 0.53532814, 0.44463454])
+
+
+# ----------------- Integrais STO-3G do hidrogênio -----------------
+def _boys0(t):
+    """Função de Boys F₀(t) = ½ √(π/t) erf(√t), com F₀(0) = 1.
+    """
+    t = np.asarray(t, dtype=float)
+    safe = np.where(t > 1e-12, t, 1.0)
+    return np.where(t > 1e-12, 0.5 * np.sqrt(np.pi / safe) * erf(np.sqrt(safe)), 1.0 - t / 3.0)
+
+
+def hydrogen_sto3g_integrals(atom, charge=0, max_iter=100, tol=1e-10):
+    """RHF em numpy para moléculas só de hidrogênio na base STO-3G.
+
+    Todas as funções de base são gaussianas s contraídas, então
+    sobreposição, energia cinética, atração nuclear e ERIs têm forma
+    fechada (F₀ de Boys). O SCF é o de Roothaan a partir do Hamiltoniano
+    de caroço.
+
+    Args:
+        atom (str): Geometria no formato do PySCF, em angstroms.
+        charge (int, optional): Carga total (a camada tem de ser fechada).
+
+    Returns:
+        dict: h1, eri (notação química, base de MOs), n_orb, nelec, e_core, e_hf,
+        mo_energy, mo_coeff, mo_occ.
+    """
+    entries = [item.split() for item in atom.split(";") if item.strip()]
+    if any(entry[0].upper() != "H" for entry in entries):
+        raise ValueError("O backend numpy só trata moléculas de hidrogênio; instale o PySCF")
+    centers = np.array([[float(x) for x in entry[1:4]] for entry in entries]) * ANGSTROM_TO_BOHR
+    n = len(centers)
+    nelec = n - charge
+    if nelec % 2:
+        raise ValueError(f"RHF precisa de camada fechada (recebeu {nelec} elétrons)")
+
+    # primitivas: (centro, expoente, coeficiente normalizado)
+    alpha = np.tile(STO3G_H_EXPONENTS, n)
+    coeff = np.tile(STO3G_H_COEFFS * (2 * STO3G_H_EXPONENTS / np.pi) ** 0.75, n)
+    owner = np.repeat(np.arange(n), len(STO3G_H_EXPONENTS))
+    pos = centers[owner]
+
+    a, b = alpha[:, None], alpha[None, :]
+    p = a + b
+    ab2 = np.sum((pos[:, None] - pos[None, :]) ** 2, axis=-1)
+    K = np.exp(-a * b / p * ab2)
+    P = (a[..., None] * pos[:, None] + b[..., None] * pos[None, :]) / p[..., None]
+    S_prim = (np.pi / p) ** 1.5 * K
+    T_prim = a * b / p * (3 - 2 * a * b / p * ab2) * S_prim
+    V_prim = np.zeros_like(S_prim)
+    for center in centers:
+        V_prim -= 2 * np.pi / p * K * _boys0(p * np.sum((P - center) ** 2, axis=-1))
+    pq = p[:, :, None, None] * p[None, None]
+    sum_pq = p[:, :, None, None] + p[None, None]
+    PQ2 = np.sum((P[:, :, None, None] - P[None, None]) ** 2, axis=-1)
+    eri_prim = (2 * np.pi ** 2.5 / (pq * np.sqrt(sum_pq)) * K[:, :, None, None] * K[None, None]
+                * _boys0(pq / sum_pq * PQ2))
+
+    # contração primitivas → funções de base
+    C = np.zeros((len(alpha), n))
+    C[np.arange(len(alpha)), owner] = coeff
+    S = C.T @ S_prim @ C
+    H_core = C.T @ (T_prim + V_prim) @ C
+    eri_ao = np.einsum("ip,jq,ijkl,kr,ls->pqrs", C, C, eri_prim, C, C, optimize=True)
+    e_core = sum(1.0 / np.linalg.norm(centers[i] - centers[j]) for i in range(n) for j in range(i))
+
+    # SCF de Roothaan
+    s_val, s_vec = np.linalg.eigh(S)
+    X = s_vec @ np.diag(s_val ** -0.5) @ s_vec.T
+    n_occ = nelec // 2
+    F = H_core
+    e_hf = None
+    for _ in range(max_iter):
+        mo_energy, C_orth = np.linalg.eigh(X.T @ F @ X)
+        mo = X @ C_orth
+        D = mo[:, :n_occ] @ mo[:, :n_occ].T
+        F = H_core + 2 * np.einsum("pqrs,rs->pq", eri_ao, D) - np.einsum("prqs,rs->pq", eri_ao, D)
+        energy = np.sum(D * (H_core + F)) + e_core
+        if e_hf is not None and abs(energy - e_hf) < tol:
+            e_hf = energy
+            break
+        e_hf = energy
+
+    h1 = mo.T @ H_core @ mo
+    eri = np.einsum("pi,qj,pqrs,rk,sl->ijkl", mo, mo, eri_ao, mo, mo, optimize=True)
+    mo_occ = np.where(np.arange(n) < n_occ, 2.0, 0.0)
+    return {"h1": h1, "eri": eri, "n_orb": n, "nelec": nelec, "e_core": e_core, "e_hf": float(e_hf),
+            "mo_energy": mo_energy, "mo_coeff": mo, "mo_occ": mo_occ}
+
+
+def pyscf_integrals(atom, basis, charge=0, spin=0):
+    """Integrais RHF/ROHF do PySCF na base de MOs (mesmas chaves de hydrogen_sto3g_integrals).
+
+    ``eri`` já vem empacotado com simetria 8 (``ao2mo.restore(8, ...)``).
+    """
+    from pyscf import gto, scf, ao2mo
+
+    mol = gto.M(atom=atom, basis=basis, charge=charge, spin=spin, verbose=0)
+    mf = scf.RHF(mol) if spin == 0 else scf.ROHF(mol)
+    e_hf = mf.kernel()
+    C = mf.mo_coeff
+    n_orb = C.shape[1]
+    return {"h1": C.T @ mf.get_hcore() @ C, "eri": ao2mo.restore(8, ao2mo.kernel(mol, C), n_orb),
+            "n_orb": n_orb, "nelec": mol.nelectron, "e_core": mol.energy_nuc(), "e_hf": float(e_hf),
+            "mo_energy": mf.mo_energy, "mo_coeff": C, "mo_occ": mf.mo_occ}
+
+
+def point_integrals(molecule, atom, cache_dir=SCAN_DIR):
+    """Integrais de uma geometria, do cache em disco ou calculados e gravados.
+
+    A chave do cache é o hash de (geometria, base, carga, spin), então
+    pontos repetidos entre varreduras não são recalculados. Os arquivos
+    usam o formato empacotado de integral_store, com a geometria e a base
+    nos metadados.
+    """
+    key = json.dumps([atom, molecule["basis"], molecule["charge"], molecule["spin"]])
+    path = os.path.join(cache_dir, f"{molecule['formula']}_{hashlib.sha1(key.encode()).hexdigest()[:16]}.npz")
+    if not os.path.exists(path):
+        try:
+            data = pyscf_integrals(atom, molecule["basis"], molecule["charge"], molecule["spin"])
+        except ImportError:
+            if molecule["basis"].lower() != "sto-3g":
+                raise ImportError(f"PySCF indisponível para a base {molecule['basis']}")
+            data = hydrogen_sto3g_integrals(atom, molecule["charge"])
+        save_integrals(path, data["h1"], data["eri"], data["nelec"], data["e_core"], basis=molecule["basis"],
+                       geometry=atom, e_nuc=data["e_core"], e_hf=data["e_hf"], mo_energy=data["mo_energy"],
+                       mo_coeff=data["mo_coeff"], mo_occ=data["mo_occ"], charge=molecule["charge"],
+                       spin=molecule["spin"])
+
+    store = IntegralStore(path)
+    return dict(store.meta, h1=store.h1, eri=store.full_eri())
+
+
+# ----------------- Um ponto da curva -----------------
+def run_point(molecule, r, args, warm_start=None):
+    """Integrais, FCI e treino da RBM numa distância ``r``.
+
+    Args:
+        warm_start (tuple, optional): (a, b, W) convergidos no ponto vizinho.
+
+    Returns:
+        tuple: (registro do ponto, parâmetros finais (a, b, W)).
+    """
+    record = {"r": float(r), "status": "ok", "warm_start": warm_start is not None, "timings": {}}
+    start = time.perf_counter()
+    atom = args.template.format(r=r)
+    data = point_integrals(molecule, atom)
+    record["timings"]["integrals"] = time.perf_counter() - start
+    n_orb, nelec, e_core = int(data["n_orb"]), int(data["nelec"]), float(data["e_core"])
+    record.update(atom=atom, n_orb=n_orb, nelec=nelec, e_core=e_core, e_hf=float(data.get("e_hf", np.nan)))
+
+    start = time.perf_counter()
+    h1_so, eri_so = spin_orbital_integrals(data["h1"], data["eri"])
+    H = SlaterCondonHamiltonian(h1_so, eri_so, constant=e_core)
+    orbsym = infer_orbsym(data["h1"], data["eri"]) if args.point_group else None
+    n_alpha = (nelec + molecule["spin"]) // 2
+    sector = SymmetrySector(n_orb, n_alpha, nelec - n_alpha, orbsym=orbsym)
+    record["n_determinants"] = len(sector)
+    if len(sector) <= args.max_determinants:
+        record["e_fci"] = float(symmetry_ground_state(H, sector)[0][0])
+    record["timings"]["exact"] = time.perf_counter() - start
+
+    n_sites = 2 * n_orb
+    np.random.seed(args.seed)
+    rbm = RBM(n_visible=n_sites, n_hidden=max(1, int(args.alpha * n_sites)))
+    if warm_start is not None:
+        rbm.a, rbm.b, rbm.W = (np.array(p, dtype=float) for p in warm_start)
+    epochs = args.warm_epochs if warm_start is not None else args.epochs
+    sampler = None
+    if len(sector) > args.max_exact_sum:
+        sampler = MetropolisSampler(rbm, nelec, seed=args.seed, spin_conserving=True, n_alpha=n_alpha,
+                                    orbsym=orbsym)
+    optimizer = OPTIMIZERS[args.optimizer](args.lr, schedule=args.schedule, epochs=epochs)
+
+    start = time.perf_counter()
+    energies = train_rbm_sr(rbm, None if sampler else sector, H, epochs=epochs, tol=args.tol, sampler=sampler,
+                            n_samples=args.n_samples, sr_solver=SRSolver(args.solver, diag_shift=args.diag_shift),
+                            optimizer=optimizer, callbacks=[])
+    record["timings"]["rbm"] = time.perf_counter() - start
+    record.update(energies=[float(e) for e in energies], epochs=len(energies), e_rbm=float(energies[-1]),
+                  estimator="sampled" if sampler else "exact")
+    if "e_fci" in record:
+        record["energy_error"] = abs(record["e_rbm"] - record["e_fci"])
+    return record, (rbm.a.copy(), rbm.b.copy(), rbm.W.copy())
+
+
+def run_segment(molecule, bonds, args):
+    """Percorre um trecho contíguo da curva, cada ponto partindo do anterior.
+    """
+    records, params = [], None
+    for r in bonds:
+        try:
+            record, final = run_point(molecule, r, args, params if args.warm_start else None)
+            params = final
+        except Exception as error:  # um ponto ruim não derruba o segmento
+            record = {"r": float(r), "status": "error", "message": f"{type(error).__name__}: {error}"}
+            params = None
+        records.append(record)
+        print(f"   r = {r:.4f} Å | {_summary(record)}", flush=True)
+    return records
+
+
+def _summary(record):
+    """Linha de progresso de um ponto.
+    """
+    if record["status"] != "ok":
+        return f"⚠️ {record['message']}"
+    line = f"E_RBM = {record['e_rbm']:.6f} Ha | {record['epochs']} épocas"
+    if "e_fci" in record:
+        line += f" | erro = {record['energy_error']:.2e} Ha"
+    return line + (" | warm start" if record["warm_start"] else "")
+
+
+def scan(molecule, bonds, args):
+    """Curva completa: ``args.segments`` trechos contíguos num pool de processos.
+
+    Returns:
+        list: Registros dos pontos na ordem de ``bonds``.
+    """
+    segments = [bonds[lo:hi] for lo, hi in rank_ranges(len(bonds), max(1, min(args.segments, len(bonds))))]
+    segments = [segment for segment in segments if len(segment)]
+    if args.workers <= 1 or len(segments) == 1:
+        return [record for segment in segments for record in run_segment(molecule, segment, args)]
+    with ProcessPoolExecutor(max_workers=min(args.workers, len(segments))) as pool:
+        futures = [pool.submit(run_segment, molecule, segment, args) for segment in segments]
+        return [record for future in futures for record in future.result()]
+
+
+# ----------------- CLI -----------------
+def parse_args(argv=None):
+    """Summary
+    """
+    parser = argparse.ArgumentParser(description="Varredura de PES com RBM (warm start entre geometrias).")
+    parser.add_argument("molecule", help="número, id ou fórmula de uma molécula de benchmarks/FCI")
+    bonds = parser.add_mutually_exclusive_group(required=True)
+    bonds.add_argument("--range", nargs=3, metavar=("INÍCIO", "FIM", "N"), help="N distâncias igualmente espaçadas (Å)")
+    bonds.add_argument("--points", nargs="+", type=float, help="distâncias explícitas (Å)")
+    parser.add_argument("--template", default=None, help="geometria com {r} (padrão: chave 'scan' do MOLECULE)")
+    parser.add_argument("--segments", type=int, default=os.cpu_count() or 1, help="trechos independentes da curva")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processos do pool")
+    parser.add_argument("--no-warm-start", dest="warm_start", action="store_false",
+                        help="cada ponto parte de parâmetros aleatórios")
+    parser.add_argument("--epochs", type=int, default=300, help="épocas do primeiro ponto de cada trecho")
+    parser.add_argument("--warm-epochs", type=int, default=100, help="épocas máximas dos pontos com warm start")
+    parser.add_argument("--tol", type=float, default=1e-6, help="ΔE entre épocas para parar")
+    parser.add_argument("--lr", type=float, default=0.05)
+    parser.add_argument("--optimizer", default="sgd", choices=sorted(OPTIMIZERS))
+    parser.add_argument("--schedule", default="constant", choices=sorted(SCHEDULES))
+    parser.add_argument("--solver", default="cg", choices=["cg", "minres", "dense"])
+    parser.add_argument("--diag-shift", type=float, default=1e-4)
+    parser.add_argument("--alpha", type=float, default=1.0, help="densidade n_hidden / n_visible")
+    parser.add_argument("--point-group", action="store_true", help="restringe ao irrep da referência")
+    parser.add_argument("--max-determinants", type=int, default=200_000, help="limite para o FCI de referência")
+    parser.add_argument("--max-exact-sum", type=int, default=20_000)
+    parser.add_argument("--n-samples", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="arquivo JSON (padrão: results/pes_<fórmula>_<data>.json)")
+    args = parser.parse_args(argv)
+    if args.range:
+        args.bonds = np.linspace(float(args.range[0]), float(args.range[1]), int(args.range[2])).tolist()
+    else:
+        args.bonds = list(args.points)
+    return args
+
+
+def main(argv=None):
+    """Summary
+    """
+    args = parse_args(argv)
+    specs = load_specs([args.molecule])
+    if len(specs) != 1:
+        raise SystemExit(f"⚠️ '{args.molecule}' deve selecionar exatamente uma molécula ({len(specs)} encontradas)")
+    stem, molecule = specs[0]
+    args.template = args.template or molecule.get("scan")
+    if not args.template or "{r}" not in args.template:
+        raise SystemExit(f"⚠️ {stem} não tem geometria de varredura: use --template com {{r}}")
+
+    started = datetime.now(timezone.utc)
+    print(f"⏳ {stem}: {len(args.bonds)} pontos em {min(args.segments, len(args.bonds))} trechos", flush=True)
+    t0 = time.perf_counter()
+    points = scan(molecule, args.bonds, args)
+    report = {
+        "commit": git_commit(),
+        "timestamp": started.isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "molecule": {"id": stem, "formula": molecule["formula"], "basis": molecule["basis"],
+                     "template": args.template},
+        "config": {k: v for k, v in vars(args).items() if k not in ("molecule", "output", "range", "points")},
+        "wall_time": time.perf_counter() - t0,
+        "points": points,
+    }
+    ok = [p for p in points if p["status"] == "ok"]
+    if ok:
+        errors = [p["energy_error"] for p in ok if "energy_error" in p]
+        print(f"   {len(ok)}/{len(points)} pontos | {np.mean([p['epochs'] for p in ok]):.1f} épocas/ponto"
+              + (f" | erro máximo = {max(errors):.2e} Ha (precisão química: {CHEMICAL_ACCURACY:.1e})" if errors else ""))
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"pes_{molecule['formula']}_{started.strftime('%Y%m%dT%H%M%SZ')}.json")
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"💾 Resultados salvos em {output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+"""Benchmark FCI × RBM para as moléculas de ``benchmarks/FCI``.
+
+Cada arquivo ``N.nome.py`` desta pasta define um dicionário ``MOLECULE``
+(geometria, base, carga, spin e espaço ativo). Para cada molécula o
+benchmark obtém os integrais, monta o Hamiltoniano do setor, roda a
+referência exata e o treino da RBM com SR, medindo o tempo de cada fase.
+O resultado vai para um JSON, para comparar o desempenho entre commits.
+
+Uso:
+    python run_benchmarks.py                    # todas as moléculas
+    python run_benchmarks.py H2 LiH --epochs 50 # filtra por fórmula ou número
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import platform
+import subprocess
+import importlib.util
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RBM_DIR = os.path.normpath(os.path.join(HERE, "..", "..", "cálculo energia fundamental rbm"))
+sys.path.insert(0, RBM_DIR)
+
+from config_index import ConfigIndex
+from hamiltonian_builder import build_qubit_hamiltonian
+from slater_condon import SlaterCondonHamiltonian
+from symmetry import spin_orbital_integrals
+from integral_store import IntegralStore, save_integrals
+from exact_diag import projected_hamiltonian, lowest_eigenpairs
+from estimators import born_probabilities, local_energies, connected_indices, sampled_local_energies, energy_gradient
+from rbm_3 import RBM
+from sampler import MetropolisSampler
+from sr_solver import SRSolver
+from parallel import ParallelEstimator
+from profiling import Profiler
+from optimizers import OPTIMIZERS, SCHEDULES
+
+CHEMICAL_ACCURACY = 1.6e-3  # Ha
+INTEGRALS_DIR = os.path.join(HERE, "integrals")
+RESULTS_DIR = os.path.join(HERE, "results")
+
+
+# ----------------- Medidas -----------------
+@contextmanager
+def timed(timings, phase):
+    """Acumula em ``timings[phase]`` o tempo de parede do bloco.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - start
+
+
+def peak_rss_mb():
+    """Pico de memória residente do processo em MB (None se indisponível).
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta em KB, macOS em bytes
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def git_commit():
+    """Hash do commit atual (None fora de um repositório git).
+    """
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], cwd=HERE, capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ----------------- Moléculas -----------------
+def load_specs(selection=None):
+    """Especificações ``MOLECULE`` dos arquivos ``N.nome.py``, em ordem numérica.
+
+    Args:
+        selection (list, optional): Números, nomes de arquivo ou fórmulas a manter.
+
+    Returns:
+        list: Pares (id, MOLECULE).
+    """
+    paths = glob.glob(os.path.join(HERE, "[0-9]*.py"))
+    paths.sort(key=lambda p: int(os.path.basename(p).split(".")[0]))
+    specs = []
+    for path in paths:
+        stem = os.path.basename(path)[:-3]
+        module_spec = importlib.util.spec_from_file_location(f"fci_{stem.replace('.', '_')}", path)
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+        molecule = module.MOLECULE
+        if selection:
+            keys = {stem.lower(), stem.split(".")[0], molecule["formula"].lower()}
+            if not keys & {str(s).lower() for s in selection}:
+                continue
+        specs.append((stem, molecule))
+    return specs
+
+
+def molecular_integrals(stem, molecule):
+    """Integrais (h1, eri, nelec, e_core) da molécula, do disco ou via PySCF.
+
+    Usa, nesta ordem: o arquivo de ``molecule["integrals"]`` (na pasta da
+    RBM), o cache em ``integrals/<id>.npz`` ou um cálculo RHF/ROHF do
+    PySCF (com CASCI quando há espaço ativo), que é então gravado no cache
+    no formato empacotado de integral_store. Nesse formato ``eri`` é o
+    próprio IntegralStore, desempacotado só na expansão em spin-orbitais.
+    """
+    if molecule.get("integrals"):
+        path = os.path.join(RBM_DIR, molecule["integrals"])
+    else:
+        path = os.path.join(INTEGRALS_DIR, f"{stem}.npz")
+
+    if os.path.exists(path):
+        store = IntegralStore(path)
+        return store.h1, store.full_eri() if store.legacy else store, int(store.nelec), float(store.e_core)
+
+    try:
+        from pyscf import gto, scf, mcscf, ao2mo
+    except ImportError:
+        raise ImportError(f"PySCF indisponível e não há integrais em cache ({path})")
+
+    mol = gto.M(atom=molecule["atom"], basis=molecule["basis"], charge=molecule["charge"],
+                spin=molecule["spin"], verbose=0)
+    mf = scf.RHF(mol) if molecule["spin"] == 0 else scf.ROHF(mol)
+    e_hf = mf.kernel()
+    if molecule.get("active"):
+        n_orb, nelec = molecule["active"]
+        mc = mcscf.CASCI(mf, n_orb, nelec)
+        h1, e_core = mc.get_h1eff()
+        eri8 = ao2mo.restore(8, mc.get_h2eff(), n_orb)
+    else:
+        C = mf.mo_coeff
+        n_orb = C.shape[1]
+        h1 = C.T @ mf.get_hcore() @ C
+        eri8 = ao2mo.restore(8, ao2mo.kernel(mol, C), n_orb)
+        nelec = mol.nelectron
+        e_core = mol.energy_nuc()
+
+    save_integrals(path, h1, eri8, nelec, e_core, basis=molecule["basis"], geometry=molecule["atom"],
+                   e_nuc=mol.energy_nuc(), e_hf=e_hf, mo_energy=mf.mo_energy, mo_coeff=mf.mo_coeff,
+                   mo_occ=mf.mo_occ, charge=molecule["charge"], spin=molecule["spin"], active=molecule.get("active"))
+    store = IntegralStore(path)
+    return store.h1, store, int(nelec), float(e_core)
+
+
+# ----------------- RBM -----------------
+def run_rbm(H, index, n_sites, nelec, e_exact, args, record):
+    """Treina a RBM com SR e registra energia e tempos por época.
+
+    Soma exata sobre o setor quando ele tem até ``args.max_exact_sum``
+    estados; acima disso usa o amostrador de Metropolis. Com
+    ``args.workers`` E_loc, gradiente e S·v são distribuídos entre processos.
+    Com ``args.profile`` os contadores do código quente (termos aplicados,
+    conexões, buscas no índice) e um cProfile da primeira época vão para o registro.
+    """
+    np.random.seed(args.seed)
+    rbm = RBM(n_visible=n_sites, n_hidden=max(1, int(args.alpha * n_sites)))
+    solver = SRSolver(args.solver, diag_shift=args.diag_shift)
+    optimizer = OPTIMIZERS[args.optimizer](args.lr, schedule=args.schedule, epochs=args.epochs)
+    theta_vec = rbm.parameter_vector()  # a, b e W são views: passos in-place
+    record["n_params"] = len(theta_vec)
+
+    exact_sum = len(index) <= args.max_exact_sum
+    record["estimator"] = "exact" if exact_sum else "sampled"
+    record["workers"] = args.workers
+    pool = None
+    profiler = Profiler(enabled=args.profile, profile_every=max(args.epochs, 1), top=25).start()
+    with timed(record["timings"], "rbm_setup"):
+        if exact_sum:
+            configs = index.codes  # códigos empacotados, desempacotados por bloco no GEMM
+            if not args.workers:
+                j, mels = connected_indices(H, index)
+        else:
+            sampler = MetropolisSampler(rbm, nelec, seed=args.seed)
+        if args.workers:
+            pool = ParallelEstimator(rbm, H, configs if exact_sum else None, n_workers=args.workers,
+                                     max_samples=args.n_samples)
+
+    energies = []
+    epoch_timings = {"energy_gradient": [], "solve": []}
+    try:
+        for epoch in range(args.epochs):
+            profiler.begin_epoch(epoch)
+            step = {}
+            with timed(step, "energy_gradient"):
+                if pool is not None:
+                    batch = None if exact_sum else sampler.sample(args.n_samples, packed=True)
+                    grads, E_mean, _, _ = pool.gradient(rbm, batch)
+                else:
+                    if exact_sum:
+                        batch = configs
+                        log_psi = rbm.log_psi_batch(batch)
+                        probs = born_probabilities(log_psi)
+                        E_locals = local_energies(log_psi, log_psi[j], mels, H.constant).real
+                    else:
+                        batch = sampler.sample(args.n_samples, packed=True)
+                        probs = np.full(len(batch), 1.0 / len(batch))
+                        E_locals = sampled_local_energies(rbm, H, batch).real
+                    Oks = rbm.log_derivatives_batch(batch)
+                    grads, E_mean, _ = energy_gradient(E_locals, Oks, probs)
+
+            with timed(step, "solve"):
+                if pool is not None:
+                    delta = solver.solve_matvec(pool.s_matvec, grads, pool.s_matrix)
+                else:
+                    delta = solver.solve(Oks, grads, probs, E_locals)
+                optimizer.step(theta_vec, delta, epoch)
+                optimizer.observe(E_mean)
+
+            profiler.end_epoch(epoch)
+            energies.append(float(E_mean))
+            for phase, seconds in step.items():
+                epoch_timings[phase].append(seconds)
+    finally:
+        if pool is not None:
+            pool.close()
+        profiler.stop()
+    if args.profile:
+        record["profile"] = profiler.as_dict()
+        record["profile"]["cprofile"] = [text for _, kind, text in profiler.captures if kind == "cprofile"]
+
+    errors = np.abs(np.array(energies) - e_exact)
+    reached = np.flatnonzero(errors < CHEMICAL_ACCURACY)
+    record["energies"] = energies
+    record["epoch_timings"] = epoch_timings
+    record["mean_epoch_time"] = float(np.mean(np.add(*epoch_timings.values()))) if energies else None
+    record["e_rbm"] = energies[-1] if energies else None
+    record["energy_error"] = float(errors[-1]) if energies else None
+    record["epochs_to_chemical_accuracy"] = int(reached[0]) + 1 if len(reached) else None
+
+
+# ----------------- Uma molécula -----------------
+def run_molecule(stem, molecule, args):
+    """Roda todas as fases para uma molécula e devolve o registro do JSON.
+    """
+    record = {"id": stem, "formula": molecule["formula"], "name": molecule["name"],
+              "basis": molecule["basis"], "active": molecule.get("active"),
+              "status": "ok", "timings": {}}
+    timings = record["timings"]
+    try:
+        with timed(timings, "integrals"):
+            h1, eri, nelec, e_core = molecular_integrals(stem, molecule)
+        n_orb = h1.shape[0]
+        n_sites = 2 * n_orb
+        record.update(n_orb=n_orb, nelec=nelec, n_sites=n_sites, e_core=e_core)
+        n_det = int(np.prod([n_sites - k for k in range(nelec)]) // np.prod(np.arange(1, nelec + 1)))
+        record["n_determinants"] = n_det
+        if n_sites > 64 or n_det > args.max_determinants:
+            record["status"] = "skipped"
+            record["message"] = f"setor grande demais ({n_sites} sítios, {n_det} determinantes)"
+            return record
+
+        # as integrais são de orbitais espaciais: os dois backends precisam
+        # delas expandidas em spin-orbitais (2p = α, 2p+1 = β).
+        # build_qubit_hamiltonian faz a segunda quantização e o Jordan–Wigner juntos;
+        # o backend Slater–Condon dispensa o Jordan–Wigner
+        with timed(timings, "hamiltonian"):
+            h1_so, eri_so = spin_orbital_integrals(h1, eri)
+            if args.backend == "slater-condon":
+                H = SlaterCondonHamiltonian(h1_so, eri_so, n_qubits=n_sites, constant=e_core)
+            else:
+                H = build_qubit_hamiltonian(h1_so, eri_so, n_qubits=n_sites, constant=e_core)
+        record["backend"] = args.backend
+        record["n_pauli_terms"] = getattr(H, "n_terms", None)
+
+        with timed(timings, "sector"):
+            index = ConfigIndex.sector(n_sites, nelec)
+            H_proj = projected_hamiltonian(H, index)
+        record["nnz"] = int(H_proj.nnz)
+
+        with timed(timings, "exact"):
+            eigvals, _ = lowest_eigenpairs(H_proj, k=1)
+        record["e_fci"] = float(eigvals[0])
+
+        with timed(timings, "rbm_total"):
+            run_rbm(H, index, n_sites, nelec, record["e_fci"], args, record)
+    except ImportError as error:
+        record["status"] = "skipped"
+        record["message"] = str(error)
+    except Exception as error:  # o benchmark segue para a próxima molécula
+        record["status"] = "error"
+        record["message"] = f"{type(error).__name__}: {error}"
+    finally:
+        record["peak_rss_mb"] = peak_rss_mb()
+    return record
+
+
+# ----------------- Entrada -----------------
+def parse_args(argv=None):
+    """Summary
+    """
+    parser = argparse.ArgumentParser(description="Benchmark FCI × RBM (tempos por fase em JSON).")
+    parser.add_argument("molecules", nargs="*", help="números, ids ou fórmulas (padrão: todas)")
+    parser.add_argument("--epochs", type=int, default=100)
+    parser.add_argument("--lr", type=float, default=0.05)
+    parser.add_argument("--optimizer", default="sgd", choices=sorted(OPTIMIZERS),
+                        help="otimizador aplicado à direção SR")
+    parser.add_argument("--schedule", default="constant", choices=sorted(SCHEDULES),
+                        help="cronograma do passo de aprendizado")
+    parser.add_argument("--alpha", type=float, default=1.0, help="densidade n_hidden / n_visible")
+    parser.add_argument("--solver", default="cg", choices=["cg", "minres", "minsr", "dense"])
+    parser.add_argument("--backend", default="pauli", choices=["pauli", "slater-condon"],
+                        help="Hamiltoniano em strings de Pauli ou por regras de Slater–Condon")
+    parser.add_argument("--diag-shift", type=float, default=1e-4)
+    parser.add_argument("--max-determinants", type=int, default=200_000)
+    parser.add_argument("--max-exact-sum", type=int, default=20_000)
+    parser.add_argument("--n-samples", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=0,
+                        help="processos para E_loc/gradiente/S·v (0: serial)")
+    parser.add_argument("--profile", action="store_true",
+                        help="grava contadores do código quente e um cProfile por molécula")
+    parser.add_argument("--output", default=None, help="arquivo JSON (padrão: results/fci_<data>.json)")
+    args = parser.parse_args(argv)
+    if args.workers and args.solver == "minsr":
+        parser.error("--solver minsr não é suportado com --workers (precisa das O_k por amostra)")
+    return args
+
+
+def main(argv=None):
+    """Summary
+    """
+    args = parse_args(argv)
+    started = datetime.now(timezone.utc)
+    report = {
+        "commit": git_commit(),
+        "timestamp": started.isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("molecules", "output")},
+        "results": [],
+    }
+
+    for stem, molecule in load_specs(args.molecules):
+        print(f"⏳ {stem} ({molecule['formula']})", flush=True)
+        record = run_molecule(stem, molecule, args)
+        report["results"].append(record)
+        if record["status"] == "ok":
+            acc = record["epochs_to_chemical_accuracy"]
+            print(f"   E_FCI = {record['e_fci']:.6f} Ha | E_RBM = {record['e_rbm']:.6f} Ha | "
+                  f"erro = {record['energy_error']:.2e} Ha | precisão química: {acc if acc else '—'} | "
+                  f"{record['mean_epoch_time'] * 1e3:.2f} ms/época")
+        else:
+            print(f"   ⚠️ {record['status']}: {record['message']}")
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"fci_{started.strftime('%Y%m%dT%H%M%SZ')}.json")
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"💾 Resultados salvos em {output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
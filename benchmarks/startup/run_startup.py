@@ -0,0 +1,159 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+"""Tempo de importação dos módulos do solver RBM.
+
+Cada módulo é importado num interpretador novo (``python -X importtime``),
+algumas vezes, e fica o menor tempo. O benchmark falha (código de saída
+1) se um módulo do núcleo puxar OpenFermion, PySCF ou matplotlib na
+importação, ou se passar do orçamento de tempo; assim regressões de
+startup aparecem antes de chegarem às varreduras com centenas de jobs.
+
+Uso:
+    python run_startup.py                        # todos os módulos do núcleo
+    python run_startup.py rbm_3 sampler --repeat 10 --budget 0.5
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+from datetime import datetime, timezone
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RBM_DIR = os.path.normpath(os.path.join(HERE, "..", "..", "cálculo energia fundamental rbm"))
+RESULTS_DIR = os.path.join(HERE, "results")
+
+# Módulos que só podem depender de NumPy/SciPy na importação
+CORE_MODULES = ("config_index", "pauli_hamiltonian", "hamiltonian_builder", "hamiltonian_cache", "integral_store",
+                "slater_condon", "symmetry", "estimators", "rbm_batch", "sampler", "sr_solver", "optimizers",
+                "parallel", "checkpoint", "telemetry", "profiling", "exact_diag", "rbm_h2", "rbm_3")
+# Dependências pesadas que devem ser carregadas só quando usadas
+HEAVY_MODULES = ("openfermion", "pyscf", "matplotlib", "cirq", "sympy", "pandas")
+
+PROBE = ("import sys, json\n"
+         "import {module}\n"
+         "print(json.dumps(sorted(m for m in {heavy!r} if m in sys.modules)))")
+
+
+# ----------------- Medidas -----------------
+def parse_importtime(stderr, module):
+    """Tempo cumulativo (s) de ``module`` na saída de ``-X importtime``.
+    """
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = [field.strip() for field in line[len("import time:"):].split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) * 1e-6
+    return None
+
+
+def measure(module, repeat):
+    """Importa ``module`` ``repeat`` vezes em processos novos.
+
+    Returns:
+        dict: menor tempo de parede do processo, menor tempo cumulativo da
+        importação e dependências pesadas carregadas.
+    """
+    code = "pass" if module is None else PROBE.format(module=module, heavy=HEAVY_MODULES)
+    wall, cumulative, leaked = [], [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=RBM_DIR,
+                             capture_output=True, text=True)
+        wall.append(time.perf_counter() - start)
+        if out.returncode != 0:
+            message = out.stderr.strip().splitlines()[-1] if out.stderr.strip() else "erro desconhecido"
+            return {"module": module, "status": "error", "message": message}
+        if module is not None:
+            cumulative.append(parse_importtime(out.stderr, module))
+            leaked = json.loads(out.stdout.strip().splitlines()[-1])
+    record = {"module": module, "status": "ok", "wall_time": min(wall)}
+    if module is not None:
+        record.update(import_time=min(cumulative), heavy_imports=leaked)
+    return record
+
+
+# ----------------- Linha de comando -----------------
+def parse_args(argv=None):
+    """Summary
+    """
+    parser = argparse.ArgumentParser(description="Tempo de importação dos módulos do solver RBM.")
+    parser.add_argument("modules", nargs="*", help="módulos (padrão: núcleo do solver)")
+    parser.add_argument("--repeat", type=int, default=5, help="processos por módulo (fica o menor tempo)")
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="tempo máximo de importação por módulo em segundos")
+    parser.add_argument("--output", default=None, help="arquivo JSON (padrão: results/startup_<data>.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Summary
+    """
+    args = parse_args(argv)
+    started = datetime.now(timezone.utc)
+    interpreter = measure(None, args.repeat)
+    report = {
+        "timestamp": started.isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("modules", "output")},
+        "interpreter_time": interpreter["wall_time"],
+        "results": [],
+    }
+    print(f"⏳ interpretador vazio: {interpreter['wall_time'] * 1e3:.0f} ms", flush=True)
+
+    failures = []
+    for module in args.modules or CORE_MODULES:
+        record = measure(module, args.repeat)
+        report["results"].append(record)
+        if record["status"] != "ok":
+            failures.append(module)
+            print(f"   ⚠️ {module}: {record['message']}")
+            continue
+        problems = []
+        if record["heavy_imports"]:
+            problems.append(f"importa {', '.join(record['heavy_imports'])}")
+        if record["import_time"] is not None and record["import_time"] > args.budget:
+            problems.append(f"acima do orçamento de {args.budget:.2f} s")
+        record["status"] = "regression" if problems else "ok"
+        if problems:
+            failures.append(module)
+        print(f"   {module:<20} {record['import_time'] * 1e3:7.1f} ms | processo {record['wall_time'] * 1e3:7.1f} ms"
+              + (f" | ⚠️ {'; '.join(problems)}" if problems else ""), flush=True)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"startup_{started.strftime('%Y%m%dT%H%M%SZ')}.json")
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"💾 Resultados salvos em {output}")
+    if failures:
+        print(f"❌ Regressão de startup em: {', '.join(failures)}")
+        sys.exit(1)
+    print("✅ Nenhum módulo do núcleo importa dependências pesadas")
+    return report
+
+
+if __name__ == "__main__":
+    main()
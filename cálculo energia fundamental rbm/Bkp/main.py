@@ -16,16 +16,21 @@
 ====================================================================================================================================================
 """
 
+import os
+import sys
 import numpy as np
 from openfermion import FermionOperator, jordan_wigner
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 from rbm_h2 import RBM, generate_configurations, train_rbm_variacional, plot_energia
+from integral_store import IntegralStore
 
 # ----------------- Etapa 1: Carregar integrals do PySCF -----------------
-data = np.load("h2_integrals.npz")
-h1 = data["h1"]
-eri = data["eri"]
-n_orb = int(data["n_orb"])
-nelec = int(data["nelec"])
+store = IntegralStore("h2_integrals.npz")
+h1 = store.h1
+eri = store.full_eri()
+n_orb = store.n_orb
+nelec = store.nelec
 
 # ----------------- Etapa 2: Construir Hamiltoniano em segunda quantização -----------------
 H = FermionOperator()
@@ -15,17 +15,23 @@
 **                                                  For licensing inquiries: contact@chanah.dev                                                   **
 ====================================================================================================================================================
 """
+import os
+import sys
 import numpy as np
 
 from openfermion import FermionOperator, jordan_wigner, hermitian_conjugated, load_operator
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from config_index import ConfigIndex
+from integral_store import IntegralStore
+
 # Carrega os dados do PySCF
-data = np.load("h2_integrals.npz")
-h1 = data["h1"]
-eri = data["eri"]
-n_orb = int(data["n_orb"])
-nelec = int(data["nelec"])
+store = IntegralStore("h2_integrals.npz")
+h1 = store.h1
+eri = store.full_eri()
+n_orb = store.n_orb
+nelec = store.nelec
 
 # Cria Hamiltoniano em segunda quantização
 H = FermionOperator()
@@ -181,6 +187,7 @@ def apply_pauli_term(term, config):
 import numpy as np
 
 def expectation_rbm_openfermion(H, rbm, configs):
+    index = ConfigIndex(configs)
     psi_vals = np.array([rbm.psi(cfg) for cfg in configs])
     norm = np.sum(np.abs(psi_vals) ** 2)
     E_total = 0
@@ -206,21 +213,21 @@ def expectation_rbm_openfermion(H, rbm, configs):
                     if op == 'Y':
                         phase *= (1j if sigma[qubit] == 0 else -1j)
 
-            try:
-                j = configs.tolist().index(new_sigma.tolist())
-                psi_sp = psi_vals[j]
-                E_total += coeff * phase * np.conj(psi_sigma) * psi_sp
-            except ValueError:
+            j = index.find(new_sigma)
+            if j < 0:  # fora do setor
                 continue
+            psi_sp = psi_vals[j]
+            E_total += coeff * phase * np.conj(psi_sigma) * psi_sp
 
     return (E_total / norm).real
 
 
 
 def energia_local_rbm_factory(H_jw, rbm, configs):
+    index = ConfigIndex(configs)
     psi_vals = np.array([rbm.psi(cfg) for cfg in configs])
     def energia_local(cfg):
-        idx = configs.tolist().index(cfg.tolist())
+        idx = index.find(cfg)
         psi_sigma = psi_vals[idx]
         E = 0
         for term, coeff in H_jw.terms.items():
@@ -233,21 +240,21 @@ def energia_local_rbm_factory(H_jw, rbm, configs):
                     new_cfg[qubit] = 1 - new_cfg[qubit]
                     if op == 'Y':
                         phase *= (1j if cfg[qubit] == 0 else -1j)
-            try:
-                j = configs.tolist().index(new_cfg.tolist())
-                psi_sp = psi_vals[j]
-                if term == ():
-                    E += coeff * np.abs(psi_sigma) ** 2
-                else:
-                    E += coeff * phase * np.conj(psi_sigma) * psi_sp
-            except ValueError:
+            j = index.find(new_cfg)
+            if j < 0:  # fora do setor
                 continue
+            psi_sp = psi_vals[j]
+            if term == ():
+                E += coeff * np.abs(psi_sigma) ** 2
+            else:
+                E += coeff * phase * np.conj(psi_sigma) * psi_sp
         return E.real
     return energia_local
 
 
 def train_rbm_openfermion(rbm, configs, H, lr=0.05, epochs=100):
     energia_por_epoca = []
+    index = ConfigIndex(configs)
 
     for epoch in range(epochs):
         psi_vals = np.array([rbm.psi(cfg) for cfg in configs])
@@ -275,14 +282,13 @@ def train_rbm_openfermion(rbm, configs, H, lr=0.05, epochs=100):
                         new_sigma[qubit] = 1 - new_sigma[qubit]
                         if op == 'Y':
                             phase *= (1j if sigma[qubit] == 0 else -1j)
-                try:
-                    j = configs.tolist().index(new_sigma.tolist())
-                    psi_sp = psi_vals[j]
-                    contrib = coeff * phase * np.conj(psi_sigma) * psi_sp
-                    E_total += contrib
-                    E_loc += contrib
-                except ValueError:
+                j = index.find(new_sigma)
+                if j < 0:  # fora do setor
                     continue
+                psi_sp = psi_vals[j]
+                contrib = coeff * phase * np.conj(psi_sigma) * psi_sp
+                E_total += contrib
+                E_loc += contrib
 
             E_locals.append(E_loc.real)
 
@@ -17,8 +17,11 @@
 """
 
 import numpy as np
-from openfermion import FermionOperator, jordan_wigner
-from scipy.linalg import eigh
+from hamiltonian_cache import cached_qubit_hamiltonian
+from integral_store import IntegralStore
+from symmetry import spin_orbital_integrals
+from config_index import ConfigIndex
+from exact_diag import projected_hamiltonian, lowest_eigenpairs
 from itertools import combinations
 
 # ------------------ Função para gerar configurações binárias ------------------
@@ -35,58 +38,24 @@ def generate_binary_configs(n, k):
     return np.array(configs)
 
 # ------------------ Carrega os integrais ------------------
-data = np.load("h2_integrals.npz")
-h1 = data["h1"]
-eri = data["eri"]
-n_orb = int(data["n_orb"])
-nelec = int(data["nelec"])
+store = IntegralStore("h2_integrals.npz")
+h1 = store.h1
+eri = store.full_eri()
+n_orb = store.n_orb
+nelec = store.nelec
 
-# ------------------ Cria Hamiltoniano ------------------
-H = FermionOperator()
-
-# Termos de 1 elétron
-for p in range(n_orb):
-    for q in range(n_orb):
-        coef = h1[p, q]
-        if abs(coef) > 1e-12:
-            H += FermionOperator(f"{p}^ {q}", coef)
-
-# Termos de 2 elétrons
-for p in range(n_orb):
-    for q in range(n_orb):
-        for r in range(n_orb):
-            for s in range(n_orb):
-                coef = 0.5 * eri[p, q, r, s]
-                if abs(coef) > 1e-12:
-                    H += FermionOperator(f"{p}^ {q}^ {s} {r}", coef)
-
-# ------------------ Aplica Jordan-Wigner ------------------
-H_jw = jordan_wigner(H)
+# ------------------ Cria Hamiltoniano (Jordan–Wigner, em spin-orbitais) ------------------
+h1_so, eri_so = spin_orbital_integrals(h1, eri)
+H_jw = cached_qubit_hamiltonian(h1_so, eri_so, n_qubits=2 * n_orb, nelec=nelec)
 
 # ------------------ Gera configurações ------------------
 configs = generate_binary_configs(4, 2)
-H_proj = np.zeros((len(configs), len(configs)), dtype=complex)
 
-# ------------------ Monta Hamiltoniano projetado ------------------
-for i, sigma in enumerate(configs):
-    for j, sigma_p in enumerate(configs):
-        contrib = 0
-        for term, coeff in H_jw.terms.items():
-            new_sigma = sigma_p.copy()
-            phase = 1.0 + 0j
-            for qubit, op in term:
-                if op == 'Z':
-                    phase *= (-1)**int(new_sigma[qubit])
-                elif op in ('X', 'Y'):
-                    new_sigma[qubit] = 1 - new_sigma[qubit]
-                    if op == 'Y':
-                        phase *= 1j if sigma_p[qubit] == 0 else -1j
-            if np.array_equal(new_sigma, sigma):
-                contrib += coeff * phase
-        H_proj[i, j] = contrib
+# ------------------ Monta Hamiltoniano projetado (esparso) ------------------
+H_proj = projected_hamiltonian(H_jw, ConfigIndex(configs))
 
 # ------------------ Diagonaliza ------------------
-eigvals, eigvecs = eigh(H_proj)
+eigvals, eigvecs = lowest_eigenpairs(H_proj, k=len(configs), method="dense")
 
 # ------------------ Resultado ------------------
 print("Autovalores (energias dos estados):")
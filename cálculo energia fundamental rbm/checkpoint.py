@@ -0,0 +1,250 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import os
+import json
+import signal
+import numpy as np
+
+# ----------------- Checkpoints de treino -----------------
+CHECKPOINT_VERSION = 1
+
+
+def _rng_state():
+    """Estado do gerador global ``np.random`` (usado na inicialização da RBM).
+    """
+    name, keys, pos, has_gauss, cached = np.random.get_state()
+    return keys, {"name": name, "pos": int(pos), "has_gauss": int(has_gauss), "cached_gaussian": float(cached)}
+
+
+def _set_rng_state(keys, meta):
+    """Inverso de ``_rng_state``.
+    """
+    np.random.set_state((meta["name"], keys, meta["pos"], meta["has_gauss"], meta["cached_gaussian"]))
+
+
+class Checkpointer:
+
+    """Grava e restaura o estado de um treino em checkpoints atômicos.
+
+    O arquivo ``.npz`` guarda os parâmetros a, b, W da RBM, a época, o
+    passo de aprendizado, o vetor de warm start do SRSolver (x0), o estado
+    do gerador ``np.random``, os momentos e o cronograma do otimizador e,
+    se houver amostrador, as cadeias de Metropolis, os contadores de
+    aceitação e o estado do seu gerador.
+    Históricos (energia por época, trajetórias de parâmetros) vão como
+    arrays nomeados. Retomar de um checkpoint continua o treino bit a bit
+    igual ao que teria sido sem a interrupção.
+
+    Retomar é opcional (``resume=True``): sem isso o treino começa do zero
+    e sobrescreve o arquivo. ``fingerprint`` (JSON: ex. a chave
+    ``hamiltonian_key`` e os hiperparâmetros) é gravada no checkpoint, e
+    um checkpoint de outra configuração é recusado. Ao fim de um treino
+    que não foi interrompido, ``finish`` grava o estado final marcado como
+    concluído, e ele não é retomado de novo.
+
+    A escrita vai para um arquivo temporário renomeado no fim: uma queda
+    no meio da gravação deixa intacto o checkpoint anterior. Com
+    ``handle_signals=True``, SIGTERM/SIGINT (preempção no cluster) pedem
+    um checkpoint ao fim da época corrente e interrompem o treino. Os
+    tratadores só valem entre ``open()`` e ``close()``, chamados pelos
+    treinos em volta do laço de épocas; fora dele os anteriores voltam.
+
+    Attributes:
+        path (str): Arquivo do checkpoint.
+        every (int): Grava a cada ``every`` épocas.
+        resume (bool): Retoma do checkpoint existente.
+        fingerprint: Identificação da configuração do treino (serializável em JSON).
+        stop_requested (bool): Um sinal de parada foi recebido.
+    """
+
+    def __init__(self, path, every=10, handle_signals=True, resume=False, fingerprint=None):
+        """Summary
+        """
+        self.path = str(path)
+        self.every = max(1, int(every))
+        self.handle_signals = handle_signals
+        self.resume = resume
+        # ida e volta pelo JSON: compara igual ao que foi gravado (tuplas viram listas)
+        self.fingerprint = json.loads(json.dumps(fingerprint))
+        self.stop_requested = False
+        self._previous_handlers = {}
+
+    def open(self):
+        """Registra SIGTERM/SIGINT para o laço de treino, guardando os tratadores anteriores.
+
+        Só é possível na thread principal; fora dela o treino segue sem
+        tratar sinais.
+
+        Returns:
+            Checkpointer: o próprio objeto.
+        """
+        self.stop_requested = False
+        if not self.handle_signals or self._previous_handlers:
+            return self
+
+        def request_stop(signum, frame):
+            print(f"⚠️ Sinal {signum} recebido — gravando checkpoint ao fim da época")
+            self.stop_requested = True
+
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            try:
+                self._previous_handlers[signum] = signal.signal(signum, request_stop)
+            except ValueError:
+                break
+        return self
+
+    def close(self):
+        """Devolve SIGTERM/SIGINT aos tratadores de antes de ``open()``.
+        """
+        while self._previous_handlers:
+            signum, handler = self._previous_handlers.popitem()
+            # None: tratador instalado fora do Python; o mais próximo é o padrão
+            signal.signal(signum, signal.SIG_DFL if handler is None else handler)
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def exists(self):
+        """Há um checkpoint gravado em ``path``.
+        """
+        return os.path.exists(self.path)
+
+    def save(self, epoch, rbm, lr=None, solver=None, sampler=None, optimizer=None, completed=False, **history):
+        """Grava o estado após a época ``epoch`` (contada a partir de 0).
+
+        Args:
+            epoch (int): Última época concluída.
+            rbm (RBM): Modelo com ``a``, ``b`` e ``W``.
+            lr (float, optional): Passo de aprendizado corrente.
+            solver (SRSolver, optional): Guarda o warm start ``x0``.
+            sampler (MetropolisSampler, optional): Guarda as cadeias.
+            optimizer (optimizers.Optimizer, optional): Guarda os momentos.
+            completed (bool, optional): Marca o treino como concluído.
+            **history: Arrays de histórico (ex.: ``energies=...``).
+        """
+        rng_keys, rng_meta = _rng_state()
+        meta = {"version": CHECKPOINT_VERSION, "epoch": int(epoch), "lr": lr,
+                "n_visible": int(rbm.n_visible), "n_hidden": int(rbm.n_hidden),
+                "rng": rng_meta, "history": sorted(history), "fingerprint": self.fingerprint,
+                "completed": bool(completed)}
+        arrays = {"a": rbm.a, "b": rbm.b, "W": rbm.W, "rng_keys": rng_keys}
+        if solver is not None:
+            meta["solver"] = {"method": solver.method, "last_iterations": int(solver.last_iterations),
+                              "has_x0": solver.x0 is not None}
+            if solver.x0 is not None:
+                arrays["solver_x0"] = solver.x0
+        if sampler is not None:
+            meta["sampler"] = {"rng": sampler.rng.bit_generator.state, "burned_in": bool(sampler._burned_in),
+                               "n_proposed": int(sampler.n_proposed), "n_accepted": int(sampler.n_accepted),
+                               "has_chains": sampler.cache is not None}
+            if sampler.cache is not None:
+                arrays["sampler_chains"] = sampler.state
+        if optimizer is not None:
+            meta["optimizer"], buffers = optimizer.state()
+            arrays.update({f"optimizer_{name}": values for name, values in buffers.items()})
+        for name, values in history.items():
+            arrays[f"history_{name}"] = np.asarray(values)
+
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(tmp, "wb") as f:
+            np.savez(f, meta=np.array(json.dumps(meta)), **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def restore(self, rbm, solver=None, sampler=None, optimizer=None):
+        """Carrega o checkpoint em ``rbm``, ``solver``, ``sampler`` e ``optimizer``.
+
+        Returns:
+            tuple: (start_epoch, lr, history) — primeira época a rodar,
+            passo de aprendizado gravado e dicionário de históricos (arrays). Sem
+            checkpoint, sem ``resume`` ou com o treino já concluído devolve (0, None, {}).
+        """
+        if not self.resume or not self.exists:
+            return 0, None, {}
+        with np.load(self.path) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta["version"] != CHECKPOINT_VERSION:
+                raise ValueError(f"Checkpoint {self.path} com versão {meta['version']} (esperada {CHECKPOINT_VERSION})")
+            if self.fingerprint is not None and meta.get("fingerprint") != self.fingerprint:
+                raise ValueError(f"Checkpoint {self.path} é de outra configuração de treino "
+                                 f"(gravado: {meta.get('fingerprint')}, atual: {self.fingerprint}); "
+                                 f"apague-o ou rode sem retomar")
+            if meta.get("completed"):
+                print(f"✔️ {self.path} é de um treino concluído — começando do zero")
+                return 0, None, {}
+            if (meta["n_visible"], meta["n_hidden"]) != (rbm.n_visible, rbm.n_hidden):
+                raise ValueError(f"Checkpoint {self.path} é de uma RBM {meta['n_visible']}×{meta['n_hidden']}, "
+                                 f"mas o modelo é {rbm.n_visible}×{rbm.n_hidden}")
+            rbm.a = data["a"].copy()
+            rbm.b = data["b"].copy()
+            rbm.W = data["W"].copy()
+            _set_rng_state(data["rng_keys"], meta["rng"])
+
+            if solver is not None and "solver" in meta:
+                solver.x0 = data["solver_x0"].copy() if meta["solver"]["has_x0"] else None
+                solver.last_iterations = meta["solver"]["last_iterations"]
+            if sampler is not None and "sampler" in meta:
+                state = meta["sampler"]
+                sampler.rng.bit_generator.state = state["rng"]
+                sampler.n_proposed = state["n_proposed"]
+                sampler.n_accepted = state["n_accepted"]
+                sampler.cache = rbm.angle_cache(data["sampler_chains"]) if state["has_chains"] else None
+                sampler._burned_in = state["burned_in"]
+            if optimizer is not None and "optimizer" in meta:
+                state = meta["optimizer"]
+                optimizer.load_state(state, {name: data[f"optimizer_{name}"] for name in state["buffers"]})
+            history = {name: data[f"history_{name}"].copy() for name in meta["history"]}
+
+        print(f"♻️ Retomando de {self.path} após a época {meta['epoch'] + 1}")
+        return meta["epoch"] + 1, meta["lr"], history
+
+    def step(self, epoch, rbm, lr=None, solver=None, sampler=None, optimizer=None, **history):
+        """Chamado ao fim de cada época: grava quando for a hora.
+
+        Grava a cada ``every`` épocas ou quando um sinal de parada chegou.
+
+        Returns:
+            bool: True se o treino deve parar (preempção).
+        """
+        if self.stop_requested or (epoch + 1) % self.every == 0:
+            self.save(epoch, rbm, lr, solver, sampler, optimizer, **history)
+            if self.stop_requested:
+                print(f"💾 Checkpoint gravado em {self.path} — treino interrompido na época {epoch + 1}")
+        return self.stop_requested
+
+    def finish(self, epoch, rbm, lr=None, solver=None, sampler=None, optimizer=None, **history):
+        """Chamado quando o treino termina sem interrupção: grava o estado final como concluído.
+        """
+        self.save(epoch, rbm, lr, solver, sampler, optimizer, completed=True, **history)
+
+    @classmethod
+    def coerce(cls, checkpoint):
+        """Aceita um Checkpointer, um caminho de arquivo (sem retomar) ou None.
+        """
+        if checkpoint is None or isinstance(checkpoint, cls):
+            return checkpoint
+        return cls(checkpoint)
@@ -0,0 +1,467 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import numpy as np
+from math import comb
+from itertools import combinations
+from pauli_hamiltonian import popcount
+import profiling
+
+# ----------------- Empacotamento de configurações -----------------
+# Representação canônica: bit q da palavra q // 64 = ocupação do sítio q.
+# Até 64 sítios cada configuração é um único uint64 (um "código"); acima
+# disso, um vetor de palavras uint64 (shape (..., n_words)). Matrizes float
+# de ocupações só são formadas na hora do GEMM da RBM.
+def n_words(n_sites):
+    """Número de palavras uint64 por configuração.
+    """
+    return max(1, -(-int(n_sites) // 64))
+
+
+def pack_words(configs):
+    """Empacota ocupações 0/1 em palavras uint64 (qualquer número de sítios).
+
+    Args:
+        configs (np.ndarray): Matriz (N, n_sites) ou vetor (n_sites,) de ocupações.
+
+    Returns:
+        np.ndarray: Palavras uint64 com shape (N, n_words) (ou (n_words,)).
+    """
+    configs = np.asarray(configs)
+    n_sites = configs.shape[-1]
+    width = n_words(n_sites)
+    bits = np.zeros(configs.shape[:-1] + (64 * width,), dtype=np.uint8)
+    bits[..., :n_sites] = configs != 0
+    packed = np.packbits(bits, axis=-1, bitorder="little")
+    return packed.view("<u8").astype(np.uint64, copy=False)
+
+
+def pack_configs(configs):
+    """Empacota ocupações 0/1 em inteiros (bit q = ocupação do sítio q).
+
+    Args:
+        configs (np.ndarray): Matriz (N, n_sites) ou vetor (n_sites,) de ocupações.
+
+    Returns:
+        np.ndarray: Códigos uint64 com shape (N,) (ou escalar uint64 para um vetor).
+    """
+    configs = np.asarray(configs)
+    n_sites = configs.shape[-1]
+    if n_sites > 64:
+        raise ValueError(f"pack_configs suporta até 64 sítios (recebeu {n_sites}); use pack_words")
+    return pack_words(configs)[..., 0]
+
+
+def unpack_words(words, n_sites, dtype=float, spins=False):
+    """Operação inversa de pack_words: palavras (..., n_words) -> ocupações (..., n_sites).
+
+    Args:
+        words (np.ndarray): Palavras uint64.
+        n_sites (int): Número de sítios.
+        dtype (type, optional): Tipo da matriz devolvida.
+        spins (bool, optional): Devolve ±1 (2σ − 1) em vez de 0/1.
+    """
+    words = np.ascontiguousarray(words, dtype="<u8")
+    bits = np.unpackbits(words.view(np.uint8), axis=-1, count=n_sites, bitorder="little")
+    if spins:
+        return (2 * bits.astype(np.int8) - 1).astype(dtype)
+    return bits.astype(dtype)
+
+
+def unpack_codes(codes, n_sites, dtype=float, spins=False):
+    """Operação inversa de pack_configs: códigos -> matriz (N, n_sites) de 0/1 (ou ±1).
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    return unpack_words(codes[..., None], n_sites, dtype, spins)
+
+
+def is_packed(batch):
+    """True se ``batch`` é um lote de códigos/palavras uint64 (não ocupações).
+    """
+    return np.asarray(batch).dtype == np.uint64
+
+
+def as_configs(batch, n_sites, dtype=float):
+    """Ocupações (N, n_sites) a partir de códigos, palavras ou ocupações.
+
+    Códigos (até 64 sítios) e palavras (acima de 64) são desempacotados;
+    matrizes de ocupação passam direto.
+    """
+    batch = np.asarray(batch)
+    if not is_packed(batch):
+        return np.atleast_2d(batch)
+    if n_sites <= 64:
+        return unpack_codes(batch.reshape(-1), n_sites, dtype)
+    return unpack_words(batch.reshape(-1, n_words(n_sites)), n_sites, dtype)
+
+
+def as_codes(batch):
+    """Códigos uint64 (N,) a partir de códigos ou ocupações (até 64 sítios).
+    """
+    batch = np.asarray(batch)
+    if is_packed(batch):
+        return batch.reshape(-1)
+    return pack_configs(np.atleast_2d(batch))
+
+
+def words_popcount(words):
+    """Número de partículas de cada configuração em palavras (..., n_words).
+    """
+    return popcount(words).sum(axis=-1)
+
+
+def _void_view(words):
+    """Cada linha (n_words palavras) vista como um único escalar comparável.
+    """
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    return words.view(np.dtype((np.void, 8 * words.shape[-1]))).reshape(words.shape[:-1])
+
+
+def unique_words(words, return_inverse=False):
+    """Configurações distintas de um lote de palavras (N, n_words).
+
+    A comparação é feita sobre os bytes de cada linha, sem desempacotar.
+    """
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    _, first, inverse = np.unique(_void_view(words), return_index=True, return_inverse=True)
+    unique = words[first]
+    return (unique, inverse.reshape(-1)) if return_inverse else unique
+
+
+# ----------------- Ranking combinatório -----------------
+def _binomial_table(n_sites):
+    """Tabela C(m, j) para 0 <= m, j <= n_sites em int64.
+    """
+    table = np.zeros((n_sites + 1, n_sites + 1), dtype=np.int64)
+    for m in range(n_sites + 1):
+        for j in range(m + 1):
+            table[m, j] = comb(m, j)
+    return table
+
+
+def _lowest_bit(x):
+    """Bit 1 menos significativo de cada código e sua posição (x ≠ 0).
+    """
+    low = x & (~x + np.uint64(1))
+    return low, popcount(low - np.uint64(1))
+
+
+def rank_codes(codes, n_sites, n_electrons, binom=None):
+    """Posição lexicográfica de cada código no setor (n_sites, n_electrons).
+
+    A ordem é a mesma de ``itertools.combinations`` usada em
+    ``generate_configurations``. Códigos com número de partículas diferente
+    de ``n_electrons`` recebem rank -1. O laço percorre só os bits
+    ocupados (n_electrons passos), não todos os sítios.
+
+    Args:
+        codes (np.ndarray): Códigos uint64 (ver pack_configs).
+        n_sites (int): Número de sítios (spin-orbitais).
+        n_electrons (int): Número de elétrons do setor.
+        binom (np.ndarray, optional): Tabela de binomiais pré-calculada.
+
+    Returns:
+        np.ndarray: Ranks int64 (−1 para configurações fora do setor).
+    """
+    if binom is None:
+        binom = _binomial_table(n_sites)
+    codes = np.asarray(codes, dtype=np.uint64)
+    beyond = codes >> np.uint64(n_sites) if n_sites < 64 else np.zeros_like(codes)
+    valid = (popcount(codes) == n_electrons) & (beyond == 0)
+    # linhas inválidas viram o primeiro código do setor (descartadas no fim)
+    x = np.where(valid, codes, np.uint64((1 << n_electrons) - 1))
+    acc = np.zeros(codes.shape, dtype=np.int64)
+    for remaining in range(n_electrons, 0, -1):
+        low, q = _lowest_bit(x)
+        acc += binom[n_sites - 1 - q, remaining]
+        x ^= low
+    ranks = binom[n_sites, n_electrons] - 1 - acc
+    return np.where(valid, ranks, -1)
+
+
+def unrank_codes(ranks, n_sites, n_electrons, binom=None):
+    """Operação inversa de rank_codes: rank no setor -> código uint64.
+
+    Usa o sistema combinatório de números: percorrendo os sítios em ordem,
+    o sítio q é ocupado quando o resto r ≥ C(n_sites − 1 − q, k_restante).
+
+    Args:
+        ranks (np.ndarray): Ranks inteiros em [0, C(n_sites, n_electrons)).
+        n_sites (int): Número de sítios (até 64).
+        n_electrons (int): Número de elétrons.
+        binom (np.ndarray, optional): Tabela de binomiais pré-calculada.
+
+    Returns:
+        np.ndarray: Códigos uint64 com o shape de ``ranks``.
+    """
+    if n_sites > 64:
+        raise ValueError(f"unrank_codes suporta até 64 sítios (recebeu {n_sites})")
+    if binom is None:
+        binom = _binomial_table(n_sites)
+    ranks = np.asarray(ranks, dtype=np.int64)
+    size = binom[n_sites, n_electrons]
+    if ranks.size and (ranks.min() < 0 or ranks.max() >= size):
+        raise ValueError(f"Ranks fora do intervalo [0, {size}) do setor ({n_sites}, {n_electrons})")
+    rest = size - 1 - ranks
+    remaining = np.full(ranks.shape, n_electrons, dtype=np.int64)
+    codes = np.zeros(ranks.shape, dtype=np.uint64)
+    for q in range(n_sites):
+        threshold = binom[n_sites - 1 - q, remaining]
+        take = (remaining > 0) & (rest >= threshold)
+        rest -= np.where(take, threshold, 0)
+        remaining -= take
+        codes |= take.astype(np.uint64) << np.uint64(q)
+    return codes
+
+
+def sector_codes(n_sites, n_electrons, start=0, stop=None):
+    """Códigos do setor (n_sites, n_electrons) na ordem de ``generate_configurations``.
+
+    Com ``start``/``stop`` devolve só a fatia de ranks [start, stop).
+    """
+    if n_sites > 64:
+        raise ValueError(f"sector_codes suporta até 64 sítios (recebeu {n_sites})")
+    size = comb(n_sites, n_electrons)
+    stop = size if stop is None else min(stop, size)
+    return unrank_codes(np.arange(start, stop, dtype=np.int64), n_sites, n_electrons)
+
+
+def iter_sector_codes(n_sites, n_electrons, block_size=65536, start=0, stop=None):
+    """Percorre o setor em blocos de no máximo ``block_size`` códigos.
+
+    Cada bloco é gerado por unranking, então a memória fica limitada ao
+    tamanho do bloco e qualquer intervalo de ranks pode ser percorrido
+    de forma independente (ex.: um por worker).
+
+    Yields:
+        tuple: (primeiro rank do bloco, códigos uint64 do bloco).
+    """
+    binom = _binomial_table(n_sites)
+    size = int(binom[n_sites, n_electrons])
+    stop = size if stop is None else min(stop, size)
+    for lo in range(start, stop, block_size):
+        hi = min(lo + block_size, stop)
+        yield lo, unrank_codes(np.arange(lo, hi, dtype=np.int64), n_sites, n_electrons, binom)
+
+
+def rank_ranges(n_total, n_parts):
+    """Divide [0, n_total) em ``n_parts`` intervalos contíguos de tamanho parecido.
+    """
+    bounds = np.linspace(0, n_total, max(1, n_parts) + 1).astype(np.int64)
+    return [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+class Sector:
+
+    """Setor de número de partículas (n_sites, n_electrons) sem materializá-lo.
+
+    Comporta-se como uma sequência de códigos uint64 na ordem de
+    ``generate_configurations``: ``len``, acesso por rank (inteiro, fatia
+    ou array), iteração em blocos e divisão em intervalos de ranks. As
+    funções de treino aceitam um Sector no lugar de ``configs`` para
+    somar exatamente sobre setores que não cabem na memória.
+
+    Attributes:
+        n_sites (int): Número de sítios.
+        n_electrons (int): Número de elétrons.
+        block_size (int): Tamanho padrão dos blocos.
+    """
+
+    def __init__(self, n_sites, n_electrons, block_size=65536):
+        """Summary
+        """
+        if n_sites > 64:
+            raise ValueError(f"Sector suporta até 64 sítios (recebeu {n_sites})")
+        self.n_sites = int(n_sites)
+        self.n_electrons = int(n_electrons)
+        self.block_size = int(block_size)
+        self._binom = _binomial_table(self.n_sites)
+
+    def __len__(self):
+        return int(self._binom[self.n_sites, self.n_electrons])
+
+    def __getitem__(self, key):
+        """Códigos por rank: inteiro, fatia ou array de ranks.
+        """
+        if isinstance(key, slice):
+            key = np.arange(*key.indices(len(self)), dtype=np.int64)
+        elif np.ndim(key) == 0:
+            key = int(key) + len(self) if int(key) < 0 else int(key)
+            return unrank_codes(np.array(key), self.n_sites, self.n_electrons, self._binom)[()]
+        return unrank_codes(key, self.n_sites, self.n_electrons, self._binom)
+
+    def blocks(self, block_size=None, start=0, stop=None):
+        """Blocos (primeiro rank, códigos) — ver iter_sector_codes.
+        """
+        return iter_sector_codes(self.n_sites, self.n_electrons, block_size or self.block_size, start, stop)
+
+    def split(self, n_parts):
+        """Intervalos de ranks para dividir o setor entre ``n_parts`` workers.
+        """
+        return rank_ranges(len(self), n_parts)
+
+    def rank(self, codes):
+        """Rank de cada código (−1 fora do setor).
+        """
+        return rank_codes(codes, self.n_sites, self.n_electrons, self._binom)
+
+    def codes(self):
+        """Todos os códigos do setor (materializa o setor inteiro).
+        """
+        return self[:]
+
+
+# ----------------- Índice de configurações -----------------
+def _count_lookups(found):
+    """Contadores de busca no índice (calculados só com profiler ativo).
+    """
+    if profiling.active().enabled:
+        profiling.count("index_lookups", found.size)
+        profiling.count("index_misses", found.size - np.count_nonzero(found))
+
+
+class ConfigIndex:
+
+    """Índice O(1) das linhas de ``configs`` a partir de códigos empacotados.
+
+    Se ``configs`` é o setor completo na ordem de ``generate_configurations``
+    o índice é o próprio rank combinatório. Caso contrário (subconjunto,
+    amostras, outra ordem) usa uma tabela ordenada de códigos com busca
+    vetorizada. Acima de 64 sítios as chaves são as palavras de cada
+    configuração (pack_words), comparadas como blocos de bytes.
+
+    Attributes:
+        codes (np.ndarray): Códigos uint64 de cada linha de ``configs``
+            ((N, n_words) acima de 64 sítios).
+        n_sites (int): Número de sítios.
+        n_electrons (int or None): Número de partículas se o setor é fixo.
+        mode (str): 'rank' ou 'table'.
+    """
+
+    def __init__(self, configs, n_sites=None):
+        """Summary
+
+        Args:
+            configs (np.ndarray): Ocupações (N, n_sites) ou códigos/palavras
+                uint64 (neste caso ``n_sites`` é obrigatório).
+            n_sites (int, optional): Número de sítios.
+        """
+        configs = np.asarray(configs)
+        if is_packed(configs):
+            if n_sites is None:
+                raise ValueError("ConfigIndex com códigos empacotados precisa de n_sites")
+            self._build(self._keys(configs, n_sites), n_sites)
+        elif configs.shape[1] > 64:
+            self._build(pack_words(configs), configs.shape[1])
+        else:
+            self._build(pack_configs(configs), configs.shape[1])
+
+    @classmethod
+    def from_codes(cls, codes, n_sites):
+        """Índice construído direto de códigos uint64 (sem a matriz de ocupações).
+        """
+        index = cls.__new__(cls)
+        index._build(cls._keys(codes, n_sites), n_sites)
+        return index
+
+    @classmethod
+    def sector(cls, n_sites, n_electrons):
+        """Índice do setor completo em modo 'rank' (sem verificar a ordem).
+        """
+        index = cls.__new__(cls)
+        index.n_sites = n_sites
+        index.n_electrons = n_electrons
+        index.codes = sector_codes(n_sites, n_electrons)
+        index.multiword = False
+        index.mode = "rank"
+        index._binom = _binomial_table(n_sites)
+        return index
+
+    @staticmethod
+    def _keys(codes, n_sites):
+        """Códigos (N,) até 64 sítios, palavras (N, n_words) acima.
+        """
+        codes = np.asarray(codes, dtype=np.uint64)
+        if n_sites <= 64:
+            return codes.reshape(-1)
+        return codes.reshape(-1, n_words(n_sites))
+
+    def _build(self, codes, n_sites):
+        """Summary
+        """
+        self.n_sites = n_sites
+        self.codes = codes
+        self.multiword = codes.ndim == 2
+        counts = words_popcount(codes) if self.multiword else popcount(codes)
+        self.n_electrons = int(counts[0]) if len(counts) and np.all(counts == counts[0]) else None
+        self.mode = "table"
+
+        if (not self.multiword and self.n_electrons is not None
+                and len(self.codes) == comb(self.n_sites, self.n_electrons)):
+            self._binom = _binomial_table(self.n_sites)
+            ranks = rank_codes(self.codes, self.n_sites, self.n_electrons, self._binom)
+            if np.array_equal(ranks, np.arange(len(self.codes))):
+                self.mode = "rank"
+
+        if self.mode == "table":
+            keys = _void_view(self.codes) if self.multiword else self.codes
+            self._order = np.argsort(keys, kind="stable")
+            self._sorted = keys[self._order]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def lookup(self, codes):
+        """Procura um lote de códigos.
+
+        Args:
+            codes (np.ndarray): Códigos uint64 de qualquer shape (palavras
+                (..., n_words) acima de 64 sítios).
+
+        Returns:
+            tuple: (idx, found) — ``idx`` int64 com a linha de cada código
+            (−1 quando ausente) e ``found`` máscara booleana de presença.
+        """
+        codes = np.asarray(codes, dtype=np.uint64)
+        if self.multiword:
+            codes = _void_view(codes)
+        if self.mode == "rank":
+            idx = rank_codes(codes, self.n_sites, self.n_electrons, self._binom)
+            _count_lookups(idx >= 0)
+            return idx, idx >= 0
+
+        if len(self._sorted) == 0:
+            idx = np.full(codes.shape, -1, dtype=np.int64)
+            return idx, idx >= 0
+        pos = np.searchsorted(self._sorted, codes)
+        pos = np.minimum(pos, len(self._sorted) - 1)
+        found = self._sorted[pos] == codes
+        idx = np.where(found, self._order[pos], -1).astype(np.int64)
+        _count_lookups(found)
+        return idx, found
+
+    def lookup_configs(self, configs):
+        """Como lookup, mas recebendo ocupações (N, n_sites).
+        """
+        return self.lookup(pack_words(configs) if self.multiword else pack_configs(configs))
+
+    def find(self, sigma):
+        """Índice de uma única configuração ou −1 se ausente.
+        """
+        idx, _ = self.lookup_configs(sigma)
+        return int(idx)
@@ -0,0 +1,324 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import numpy as np
+from config_index import as_codes, unpack_codes
+import profiling
+
+LOG2 = np.log(2.0)
+
+# ----------------- Funções estáveis -----------------
+def log_cosh(x):
+    """log(cosh(x)) sem overflow: |x| + log1p(exp(−2|x|)) − log 2.
+    """
+    x = np.abs(x)
+    return x + np.log1p(np.exp(-2.0 * x)) - LOG2
+
+
+def log_sum_exp(x):
+    """log Σ exp(x) estável (x real).
+    """
+    x = np.asarray(x)
+    if x.size == 0:
+        return -np.inf
+    x_max = np.max(x)
+    if not np.isfinite(x_max):
+        return x_max
+    return x_max + np.log(np.sum(np.exp(x - x_max)))
+
+
+def log_normalization(log_psi):
+    """log Σ_σ |Ψ(σ)|² calculado a partir de log Ψ.
+    """
+    return log_sum_exp(2.0 * np.real(log_psi))
+
+
+def born_probabilities(log_psi):
+    """p(σ) = |Ψ(σ)|² / Σ |Ψ|² sem formar Ψ explicitamente.
+    """
+    log_p = 2.0 * np.real(log_psi)
+    return np.exp(log_p - log_sum_exp(log_p))
+
+
+def amplitude_ratios(log_psi_new, log_psi_old):
+    """Ψ(σ') / Ψ(σ) = exp(log Ψ(σ') − log Ψ(σ)).
+    """
+    return np.exp(log_psi_new - log_psi_old)
+
+
+# ----------------- Energia local -----------------
+def local_energies(log_psi, log_psi_conn, mels, constant=0.0):
+    """E_loc(σ) = c₀ + Σ_σ' H_σσ' Ψ(σ')/Ψ(σ) em forma de tabela.
+
+    Args:
+        log_psi (np.ndarray): log Ψ(σ), shape (N,).
+        log_psi_conn (np.ndarray): log Ψ(σ') das configurações conectadas, shape (N, G).
+        mels (np.ndarray): Elementos de matriz H_σσ' (zero para conexões ausentes), shape (N, G).
+        constant (complex, optional): Termo identidade do Hamiltoniano.
+
+    Returns:
+        np.ndarray: Energias locais complexas, shape (N,).
+    """
+    ratios = amplitude_ratios(log_psi_conn, np.asarray(log_psi)[:, None])
+    # conexões com mels = 0 não contribuem, mesmo que a razão não seja finita
+    contrib = np.where(mels != 0, mels * ratios, 0)
+    return constant + np.sum(contrib, axis=1)
+
+
+def local_energies_sparse(log_psi, rows, log_psi_conn, mels, constant=0.0):
+    """Como local_energies, mas com as conexões em formato COO (rows, σ', H_σσ').
+    """
+    log_psi = np.asarray(log_psi)
+    return local_energies_from_ratios(len(log_psi), rows, log_psi_conn - log_psi[rows], mels, constant)
+
+
+def local_energies_from_ratios(n, rows, log_ratios, mels, constant=0.0):
+    """E_loc a partir de log Ψ(σ')/Ψ(σ) já calculados por conexão (formato COO).
+    """
+    contrib = mels * np.exp(log_ratios)
+    E_loc = np.bincount(rows, weights=contrib.real, minlength=n).astype(complex)
+    E_loc += 1j * np.bincount(rows, weights=contrib.imag, minlength=n)
+    return constant + E_loc
+
+
+def connected_indices(H, index):
+    """Conexões de cada linha de ``index`` restritas ao conjunto enumerado.
+
+    Args:
+        H (CompiledPauliHamiltonian): Hamiltoniano compilado.
+        index (ConfigIndex): Índice das configurações enumeradas.
+
+    Returns:
+        tuple: (j, mels) com shape (N, n_groups) — ``j`` aponta para a linha de
+        σ' (0 quando ausente) e ``mels`` é zero para conexões fora do conjunto.
+    """
+    conn, mels = H.apply(index.codes)
+    j, found = index.lookup(conn)
+    return np.where(found, j, 0), np.where(found, mels, 0)
+
+
+def sampled_local_energies(rbm, H, samples, particle_conserving=False):
+    """E_loc de amostras de Monte Carlo, avaliando Ψ(σ') diretamente na RBM.
+
+    Amostras repetidas são avaliadas uma única vez. Se a RBM oferece
+    ``angle_cache``, as razões Ψ(σ')/Ψ(σ) saem dos ângulos efetivos em
+    O(k·n_hidden) por conexão (k = bits invertidos); senão log Ψ(σ') é
+    recalculado por completo.
+
+    Args:
+        rbm (RBM): Modelo com ``log_psi_batch``.
+        H (CompiledPauliHamiltonian): Hamiltoniano compilado.
+        samples (np.ndarray): Configurações amostradas (N, n_visible) ou seus
+            códigos uint64 (N,).
+        particle_conserving (bool, optional): Gera só as conexões dentro do
+            setor de N fixo (exato quando H conserva o número de partículas).
+
+    Returns:
+        np.ndarray: Energias locais complexas, shape (N,).
+    """
+    n_sites = rbm.n_visible
+    unique, inverse = np.unique(as_codes(samples), return_inverse=True)
+    profiling.count("samples", len(samples))
+    profiling.count("sample_cache_hits", len(samples) - len(unique))
+    rows, conn, mels = H.connections(unique, particle_conserving=particle_conserving)
+    if hasattr(rbm, "angle_cache"):
+        cache = rbm.angle_cache(unpack_codes(unique, n_sites))
+        E_loc = local_energies_from_ratios(len(unique), rows, cache.log_ratio_codes(rows, conn),
+                                           mels, H.constant)
+    else:
+        log_psi = rbm.log_psi_batch(unpack_codes(unique, n_sites))
+        log_psi_conn = rbm.log_psi_batch(unpack_codes(conn, n_sites))
+        E_loc = local_energies_sparse(log_psi, rows, log_psi_conn, mels, H.constant)
+    return E_loc[inverse.reshape(-1)]
+
+
+# ----------------- Estatísticas e gradiente -----------------
+def energy_statistics(E_loc, weights=None):
+    """Média ⟨H⟩ e variância de E_loc.
+
+    Args:
+        E_loc (np.ndarray): Energias locais.
+        weights (np.ndarray, optional): Pesos normalizados (enumeração exata);
+            se omitidos, média simples sobre amostras de |Ψ|².
+
+    Returns:
+        tuple: (E_mean, E_var) reais.
+    """
+    E_loc = np.asarray(E_loc)
+    if weights is None:
+        weights = np.full(len(E_loc), 1.0 / len(E_loc))
+    E_mean = np.sum(weights * E_loc)
+    E_var = np.sum(weights * np.abs(E_loc - E_mean) ** 2)
+    return float(np.real(E_mean)), float(E_var)
+
+
+def energy_gradient(E_loc, O, weights=None):
+    """Gradiente ∂⟨H⟩/∂θ_k = Re Σ_σ p(σ) (E_loc − ⟨H⟩) (O_k − ⟨O_k⟩)*.
+
+    Args:
+        E_loc (np.ndarray): Energias locais, shape (N,).
+        O (np.ndarray): Derivadas logarítmicas, shape (N, n_params).
+        weights (np.ndarray, optional): Pesos normalizados (ver energy_statistics).
+
+    Returns:
+        tuple: (grad, E_mean, O_mean).
+    """
+    E_loc = np.asarray(E_loc)
+    if weights is None:
+        weights = np.full(len(E_loc), 1.0 / len(E_loc))
+    E_mean = np.sum(weights * E_loc)
+    O_mean = weights @ O
+    centered = weights * (E_loc - E_mean)
+    grad = np.real(centered @ np.conj(O - O_mean))
+    return grad, float(np.real(E_mean)), O_mean
+
+
+# ----------------- Soma exata em blocos -----------------
+def streamed_moments(rbm, H, sector, block_size=None, start=0, stop=None, s_matrix=False):
+    """Somas ponderadas por |Ψ|² sobre os ranks [start, stop) de um setor, bloco a bloco.
+
+    Cada bloco é gerado por unranking (Sector.blocks), avaliado e
+    descartado, então a memória não depende do tamanho do setor. Os pesos
+    são w = exp(2 Re log Ψ − shift), com ``shift`` atualizado quando um
+    bloco tem log Ψ maior (as somas acumuladas são reescalonadas).
+    Intervalos diferentes podem ser somados em processos separados e
+    juntados com ``combine_moments``.
+
+    Args:
+        rbm (RBM): Modelo com os métodos de BatchRBMMixin.
+        H (CompiledPauliHamiltonian or SlaterCondonHamiltonian): Hamiltoniano.
+        sector (Sector): Setor de número de partículas.
+        block_size (int, optional): Configurações por bloco (padrão ``sector.block_size``).
+        start, stop (int, optional): Intervalo de ranks.
+        s_matrix (bool, optional): Acumula também Σ w O* Oᵀ (n_params²).
+
+    Returns:
+        dict: shift, W, WE, WE2, WO, WEO (e WOO com ``s_matrix``).
+    """
+    moments = {"shift": -np.inf, "W": 0.0, "WE": 0.0, "WE2": 0.0,
+               "WO": np.zeros(rbm.n_params), "WEO": np.zeros(rbm.n_params, dtype=complex)}
+    if s_matrix:
+        moments["WOO"] = np.zeros((rbm.n_params, rbm.n_params))
+    for _, codes in sector.blocks(block_size, start, stop):
+        log_psi = rbm.log_psi_batch(codes)
+        log_w = 2.0 * np.real(log_psi)
+        block_max = np.max(log_w)
+        if block_max > moments["shift"]:
+            scale = np.exp(moments["shift"] - block_max) if np.isfinite(moments["shift"]) else 0.0
+            for key in moments:
+                if key != "shift":
+                    moments[key] = moments[key] * scale
+            moments["shift"] = block_max
+        weights = np.exp(log_w - moments["shift"])
+        E_loc = sampled_local_energies(rbm, H, codes, particle_conserving=True).real
+        O = rbm.log_derivatives_batch(codes)
+        wE = weights * E_loc
+        moments["W"] += weights.sum()
+        moments["WE"] += wE.sum()
+        moments["WE2"] += (wE * E_loc).sum()
+        moments["WO"] = moments["WO"] + weights @ O
+        moments["WEO"] = moments["WEO"] + wE @ np.conj(O)
+        if s_matrix:
+            moments["WOO"] += np.conj(O.T) @ (weights[:, None] * O)
+    return moments
+
+
+def combine_moments(parts):
+    """Junta somas de ``streamed_moments`` calculadas com shifts diferentes.
+    """
+    shift = max(part["shift"] for part in parts)
+    total = {}
+    for part in parts:
+        scale = np.exp(part["shift"] - shift) if np.isfinite(part["shift"]) else 0.0
+        for key, value in part.items():
+            if key != "shift":
+                total[key] = total.get(key, 0.0) + scale * value
+    total["shift"] = shift
+    return total
+
+
+def streamed_gradient(rbm, H, sector, block_size=None, ranges=None, s_matrix=False):
+    """Energia, gradiente (e S) da soma exata sobre um setor sem materializá-lo.
+
+    Args:
+        ranges (list, optional): Intervalos de ranks somados separadamente
+            (ex.: ``sector.split(n)``); por padrão o setor inteiro.
+
+    Returns:
+        tuple: (grad, E_mean, E_var, O_mean, S) — ``S`` é a matriz SR
+        centrada ŌᴴŌ com ``s_matrix=True`` e None caso contrário.
+    """
+    ranges = ranges or [(0, len(sector))]
+    return moments_gradient(combine_moments([streamed_moments(rbm, H, sector, block_size, lo, hi, s_matrix)
+                                             for lo, hi in ranges]))
+
+
+def sample_moments(E_loc, O, s_matrix=False):
+    """Somas de ``streamed_moments`` para um minilote de amostras de |Ψ|² (pesos 1).
+
+    Minilotes sucessivos são acumulados com ``combine_moments``; só as
+    somas (e S, com ``s_matrix``) ficam na memória, não as O_k de todas
+    as amostras.
+    """
+    E_loc = np.real(E_loc)
+    moments = {"shift": 0.0, "W": float(len(E_loc)), "WE": E_loc.sum(), "WE2": (E_loc * E_loc).sum(),
+               "WO": O.sum(axis=0), "WEO": E_loc @ np.conj(O)}
+    if s_matrix:
+        moments["WOO"] = np.conj(O.T) @ O
+    return moments
+
+
+def moments_gradient(moments):
+    """(grad, E_mean, E_var, O_mean, S) a partir das somas ponderadas.
+
+    ``S`` é a matriz SR centrada quando as somas incluem WOO, senão None.
+    """
+    W_sum = moments["W"]
+    E_mean = moments["WE"] / W_sum
+    E_var = moments["WE2"] / W_sum - E_mean ** 2
+    O_mean = moments["WO"] / W_sum
+    grad = np.real(moments["WEO"] / W_sum - E_mean * np.conj(O_mean))
+    S = None
+    if "WOO" in moments:
+        S = moments["WOO"] / W_sum - np.outer(np.conj(O_mean), O_mean)
+    return grad, float(E_mean), float(E_var), O_mean, S
+
+
+def accumulated_gradient(rbm, H, sampler, n_samples, n_batches, profiler=None, s_matrix=False):
+    """Gradiente de ``n_samples`` amostras tiradas em ``n_batches`` minilotes.
+
+    Cada minilote é amostrado, avaliado e reduzido a somas
+    (``sample_moments``) antes do próximo; o resultado é o mesmo estimador
+    de um lote único com o mesmo número de amostras.
+
+    Returns:
+        tuple: (grad, E_mean, E_var, O_mean, S) como em ``moments_gradient``.
+    """
+    profiler = profiler or profiling.NULL_PROFILER
+    size, extra = divmod(int(n_samples), int(n_batches))
+    parts = []
+    for k in range(int(n_batches)):
+        with profiler.phase("sampling"):
+            batch = sampler.sample(size + (k < extra), packed=True)
+        with profiler.phase("local_energy"):
+            E_loc = sampled_local_energies(rbm, H, batch).real
+        with profiler.phase("log_derivatives"):
+            O = rbm.log_derivatives_batch(batch)
+        with profiler.phase("gradient"):
+            parts.append(sample_moments(E_loc, O, s_matrix))
+    return moments_gradient(combine_moments(parts))
@@ -0,0 +1,211 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import eigh
+from scipy.sparse.linalg import eigsh
+from config_index import ConfigIndex
+from pauli_hamiltonian import CompiledPauliHamiltonian
+
+# Número máximo de elementos (linhas × termos) avaliados de uma vez
+MAX_BLOCK_ELEMENTS = 1 << 22
+
+
+# ----------------- Hamiltoniano projetado -----------------
+def projected_hamiltonian(H, index, tol=1e-14, chunk_size=4096):
+    """Matriz esparsa ⟨σ_i|H|σ_j⟩ restrita às configurações de ``index``.
+
+    Só as conexões não nulas de cada coluna são geradas (H|σ_j⟩ pelas
+    tabelas de bits); configurações conectadas fora do conjunto (outro
+    setor de partículas) são descartadas.
+
+    Args:
+        H (CompiledPauliHamiltonian, SlaterCondonHamiltonian or QubitOperator): Hamiltoniano.
+        index (ConfigIndex or np.ndarray): Índice ou matriz (N, n_sites) de configurações.
+        tol (float, optional): Elementos com |H_ij| <= tol são descartados.
+        chunk_size (int, optional): Máximo de colunas processadas por vez.
+
+    Returns:
+        scipy.sparse.csr_matrix: Matriz N×N (real quando H é real no setor).
+    """
+    if not isinstance(index, ConfigIndex):
+        index = ConfigIndex(index)
+    H = CompiledPauliHamiltonian.coerce(H, index.n_sites)
+    n = len(index)
+    conserving = index.n_electrons is not None
+    if hasattr(H, "max_connections"):
+        width = H.max_connections(index.n_electrons if conserving else index.n_sites)
+    else:
+        width = H.n_groups if conserving else H.n_terms
+    step = max(1, min(chunk_size, MAX_BLOCK_ELEMENTS // max(1, width)))
+
+    rows, cols, vals = [], [], []
+    for start in range(0, n, step):
+        block = index.codes[start:start + step]
+        src, conn, mels = H.connections(block, tol, step, particle_conserving=conserving)
+        dst, found = index.lookup(conn)
+        rows.append(dst[found])
+        cols.append(src[found] + start)
+        vals.append(mels[found])
+
+    rows = np.concatenate(rows + [np.arange(n)])
+    cols = np.concatenate(cols + [np.arange(n)])
+    vals = np.concatenate(vals + [np.full(n, H.constant)])
+    if np.all(np.abs(vals.imag) <= tol):
+        vals = vals.real
+    matrix = sp.coo_matrix((vals, (rows, cols)), shape=(n, n)).tocsr()
+    matrix.sum_duplicates()
+    return matrix
+
+
+# ----------------- Davidson -----------------
+def davidson(A, k=1, tol=1e-8, maxiter=200, max_subspace=None, v0=None, diagonal=None):
+    """Menores autopares de uma matriz hermitiana pelo método de Davidson.
+
+    A correção de cada resíduo usa o pré-condicionador diagonal
+    t = r / (θ − diag(A)), adequado a Hamiltonianos dominados pela diagonal
+    na base de determinantes. O subespaço é reiniciado com os vetores de
+    Ritz quando passa de ``max_subspace``.
+
+    Args:
+        A (sparse matrix or LinearOperator): Matriz hermitiana N×N.
+        k (int, optional): Número de autopares.
+        tol (float, optional): Norma máxima dos resíduos.
+        maxiter (int, optional): Máximo de iterações (pelo menos 1).
+        max_subspace (int, optional): Dimensão máxima do subespaço (padrão max(20, 8k)).
+        v0 (np.ndarray, optional): Vetores iniciais (N,) ou (N, m).
+        diagonal (np.ndarray, optional): Diagonal de A (obrigatória se A não tem ``diagonal()``).
+
+    Returns:
+        tuple: (eigvals (k,), eigvecs (N, k)).
+    """
+    if maxiter < 1:
+        raise ValueError(f"Davidson precisa de maxiter >= 1 (recebeu {maxiter})")
+    n = A.shape[0]
+    if diagonal is None:
+        diagonal = np.asarray(A.diagonal())
+    diagonal = diagonal.real
+    if max_subspace is None:
+        max_subspace = max(20, 8 * k)
+    dtype = np.result_type(A.dtype, float)
+
+    if v0 is None:
+        V = np.zeros((n, min(n, 2 * k)), dtype=dtype)
+        V[np.argsort(diagonal)[:V.shape[1]], np.arange(V.shape[1])] = 1.0
+    else:
+        V = np.asarray(v0, dtype=dtype).reshape(n, -1)
+    V, _ = np.linalg.qr(V)
+    AV = np.asarray(A @ V)
+
+    for iteration in range(maxiter):
+        T = V.conj().T @ AV
+        theta, s = eigh((T + T.conj().T) / 2)
+        theta, s = theta[:k], s[:, :k]
+        X = V @ s
+        AX = AV @ s
+        R = AX - X * theta
+        norms = np.linalg.norm(R, axis=0)
+        if np.all(norms < tol):
+            return theta, X
+
+        # correções pré-condicionadas dos resíduos não convergidos
+        corrections = []
+        for j in np.flatnonzero(norms >= tol):
+            denom = theta[j] - diagonal
+            denom[np.abs(denom) < 1e-12] = 1e-12
+            corrections.append(R[:, j] / denom)
+        t = np.stack(corrections, axis=1)
+
+        if V.shape[1] + t.shape[1] > max_subspace:
+            V, AV = X, AX
+        for _ in range(2):
+            t -= V @ (V.conj().T @ t)
+        t, r = np.linalg.qr(t)
+        t = t[:, np.abs(np.diag(r)) > 1e-10]
+        if t.shape[1] == 0:
+            return theta, X
+        V = np.hstack([V, t])
+        AV = np.hstack([AV, np.asarray(A @ t)])
+
+    print(f"⚠️ Davidson não convergiu em {maxiter} iterações (resíduo máx. {norms.max():.2e})")
+    return theta, X
+
+
+# ----------------- Estado fundamental -----------------
+def lowest_eigenpairs(matrix, k=1, method="auto", tol=1e-10, maxiter=None, v0=None):
+    """Menores ``k`` autopares da matriz projetada.
+
+    Args:
+        matrix (scipy.sparse matrix): Hamiltoniano projetado (hermitiano).
+        k (int, optional): Número de autopares.
+        method (str, optional): 'dense' (eigh), 'eigsh' (Lanczos), 'davidson'
+            ou 'auto' (denso até 500 estados, Lanczos acima).
+        tol (float, optional): Tolerância dos métodos iterativos.
+        maxiter (int, optional): Máximo de iterações dos métodos iterativos.
+        v0 (np.ndarray, optional): Vetor inicial.
+
+    Returns:
+        tuple: (eigvals (k,), eigvecs (N, k)) em ordem crescente.
+    """
+    n = matrix.shape[0]
+    if method == "auto":
+        method = "dense" if n <= 500 else "eigsh"
+    if method != "dense" and k >= n - 1:
+        method = "dense"
+
+    if method == "dense":
+        eigvals, eigvecs = eigh(matrix.toarray())
+        return eigvals[:k], eigvecs[:, :k]
+    if method == "eigsh":
+        eigvals, eigvecs = eigsh(matrix, k=k, which="SA", tol=tol, maxiter=maxiter, v0=v0)
+    elif method == "davidson":
+        eigvals, eigvecs = davidson(matrix, k=k, tol=tol, maxiter=maxiter or 200, v0=v0)
+    else:
+        raise ValueError(f"Método '{method}' desconhecido (use 'dense', 'eigsh', 'davidson' ou 'auto')")
+    order = np.argsort(eigvals)
+    return eigvals[order], eigvecs[:, order]
+
+
+def sector_ground_state(H, n_sites, n_electrons, k=1, method="auto", tol=1e-10):
+    """FCI no setor de ``n_electrons`` partículas em ``n_sites`` spin-orbitais.
+
+    Returns:
+        tuple: (eigvals, eigvecs, index) — ``index`` é o ConfigIndex do setor,
+        cuja ordem é a de ``generate_configurations``.
+    """
+    index = ConfigIndex.sector(n_sites, n_electrons)
+    matrix = projected_hamiltonian(H, index)
+    eigvals, eigvecs = lowest_eigenpairs(matrix, k, method, tol)
+    return eigvals, eigvecs, index
+
+
+def symmetry_ground_state(H, sector, k=1, method="auto", tol=1e-10):
+    """FCI restrito a um setor de simetria (ex.: symmetry.SymmetrySector).
+
+    O Hamiltoniano precisa conservar as simetrias do setor (spin-orbitais
+    de ``symmetry.spin_orbital_integrals``); conexões para fora dele são
+    descartadas.
+
+    Returns:
+        tuple: (eigvals, eigvecs, index) — ``index`` segue a ordem de ranks do setor.
+    """
+    index = ConfigIndex.from_codes(sector.codes(), sector.n_sites)
+    matrix = projected_hamiltonian(H, index)
+    eigvals, eigvecs = lowest_eigenpairs(matrix, k, method, tol)
+    return eigvals, eigvecs, index
@@ -0,0 +1,254 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import sys
+import numpy as np
+from pauli_hamiltonian import CompiledPauliHamiltonian, popcount
+
+# ----------------- Jordan–Wigner vetorizado -----------------
+# Em termos de P = X^x Z^z (Z age primeiro), com e_p = 1 << p e m_p = e_p − 1:
+#   a†_p = ½ [X^{e_p} Z^{m_p} + X^{e_p} Z^{m_p | e_p}]
+#   a_p  = ½ [X^{e_p} Z^{m_p} − X^{e_p} Z^{m_p | e_p}]
+# e o produto de duas strings é
+#   (X^{x1} Z^{z1})(X^{x2} Z^{z2}) = (−1)^{|z1 & x2|} X^{x1 ^ x2} Z^{z1 ^ z2}.
+
+def _jw_ladder_products(indices, daggers, coeffs):
+    """Strings de Pauli de Σ_t coeffs[t] · o_1(t) o_2(t) ... o_L(t).
+
+    Args:
+        indices (np.ndarray): Modos de cada operador, shape (M, L).
+        daggers (tuple): L booleanos, True para criação (a†).
+        coeffs (np.ndarray): Coeficientes, shape (M,).
+
+    Returns:
+        tuple: (x, z, c) com M·2^L entradas (ainda não agrupadas).
+    """
+    indices = np.asarray(indices, dtype=np.uint64)
+    n_terms, n_ops = indices.shape
+    e = np.left_shift(np.uint64(1), indices)
+    m = e - np.uint64(1)
+
+    xs, zs, cs = [], [], []
+    for choice in range(2 ** n_ops):
+        x = np.zeros(n_terms, dtype=np.uint64)
+        z = np.zeros(n_terms, dtype=np.uint64)
+        c = np.asarray(coeffs, dtype=complex).copy()
+        for k in range(n_ops):
+            with_z = (choice >> k) & 1
+            x_k = e[:, k]
+            z_k = m[:, k] | e[:, k] if with_z else m[:, k]
+            sign = 1 - 2 * (popcount(z & x_k) & 1)
+            factor = 0.5 if (daggers[k] or not with_z) else -0.5
+            c *= sign * factor
+            x ^= x_k
+            z ^= z_k
+        xs.append(x)
+        zs.append(z)
+        cs.append(c)
+    return np.concatenate(xs), np.concatenate(zs), np.concatenate(cs)
+
+
+def _combine(x, z, c, tol):
+    """Soma coeficientes de strings (x, z) repetidas e descarta |c| <= tol.
+    """
+    if len(c) == 0:
+        return x, z, c
+    order = np.lexsort((z, x))
+    x, z, c = x[order], z[order], c[order]
+    new = np.r_[True, (x[1:] != x[:-1]) | (z[1:] != z[:-1])]
+    starts = np.flatnonzero(new)
+    c = np.add.reduceat(c, starts)
+    x, z = x[starts], z[starts]
+    keep = np.abs(c) > tol
+    return x[keep], z[keep], c[keep]
+
+
+# ----------------- Órbitas de simetria -----------------
+def _orbit_representatives(tuples, images):
+    """Representantes canônicos (menor código) e tamanho de cada órbita.
+
+    Args:
+        tuples (np.ndarray): Códigos inteiros dos termos, shape (M,).
+        images (list): Códigos das imagens de cada termo pelas simetrias.
+
+    Returns:
+        tuple: (máscara dos representantes, multiplicidade de cada termo).
+    """
+    orbit = np.sort(np.stack([tuples] + list(images), axis=1), axis=1)
+    is_rep = tuples == orbit[:, 0]
+    multiplicity = 1 + np.sum(orbit[:, 1:] != orbit[:, :-1], axis=1)
+    return is_rep, multiplicity
+
+
+def _has_real_symmetry(h1, eri):
+    """True se h1 é real simétrica e eri real com (pq|rs) = (qp|sr) = (rs|pq).
+
+    ``eri`` None indica ERIs empacotadas (IntegralStore), simétricas por construção.
+    """
+    if eri is None:
+        return not np.iscomplexobj(h1) and np.allclose(h1, h1.T)
+    if np.iscomplexobj(h1) or np.iscomplexobj(eri):
+        return False
+    return (np.allclose(h1, h1.T)
+            and np.allclose(eri, eri.transpose(1, 0, 3, 2))
+            and np.allclose(eri, eri.transpose(2, 3, 0, 1)))
+
+
+# ----------------- Construtor -----------------
+def _two_body_terms(eri, start, n, tol, symmetric):
+    """Strings de Pauli de ½ Σ eri[p,q,r,s] a†_p a†_q a_s a_r para p ∈ [start, start + len(eri)).
+
+    Cada órbita de simetria tem um único representante (o menor código),
+    então blocos diferentes nunca contam o mesmo termo duas vezes.
+    """
+    p, q, r, s = np.nonzero(np.abs(0.5 * eri) > tol)
+    coeffs = 0.5 * eri[p, q, r, s]
+    p = p + start
+    if symmetric:
+        code = ((p * n + q) * n + r) * n + s
+        images = [((q * n + p) * n + s) * n + r,
+                  ((r * n + s) * n + p) * n + q,
+                  ((s * n + r) * n + q) * n + p]
+        is_rep, mult = _orbit_representatives(code, images)
+        p, q, r, s = p[is_rep], q[is_rep], r[is_rep], s[is_rep]
+        coeffs = coeffs[is_rep] * mult[is_rep]
+    return _jw_ladder_products(np.stack([p, q, s, r], axis=1), (True, True, False, False), coeffs)
+
+
+def build_qubit_hamiltonian(h1, eri, n_qubits=None, tol=1e-12, constant=0.0, use_symmetry=True, block_size=None):
+    """Hamiltoniano qubit compilado direto dos arrays h1/eri.
+
+    Constrói o mesmo operador que os drivers montavam com FermionOperator,
+
+        H = c₀ + Σ_pq h1[p,q] a†_p a_q + ½ Σ_pqrs eri[p,q,r,s] a†_p a†_q a_s a_r,
+
+    seguido de Jordan–Wigner, mas sem strings nem dicionários: a triagem
+    |coef| > tol é feita em bloco e cada produto de operadores de escada
+    vira 2^L strings de Pauli calculadas com operações de bits.
+
+    Com integrais reais e as simetrias de permutação das ERIs
+    ((pq|rs) = (qp|sr) = (rs|pq)), termos com o mesmo operador
+    (p,q,r,s) ~ (q,p,s,r) ou com o adjunto (p,q,r,s) ~ (r,s,p,q) são
+    calculados uma única vez: a soma da órbita é m·c·(A + A†)/2.
+
+    Args:
+        h1 (np.ndarray): Integrais de um elétron (n, n).
+        eri (np.ndarray or IntegralStore): Integrais de dois elétrons (n, n, n, n)
+            ou um IntegralStore. O arquivo guarda orbitais espaciais (pq|rs):
+            ``h1`` (o ``store.h1``) e as fatias eri[p0:p1] são expandidos em
+            spin-orbitais bloco a bloco, sem montar o tensor, e o resultado
+            é o mesmo de ``symmetry.spin_orbital_integrals`` com ``full_eri()``.
+        n_qubits (int, optional): Número de qubits do Hamiltoniano (padrão n;
+            2n com IntegralStore).
+        tol (float, optional): Limiar de triagem dos coeficientes.
+        constant (float, optional): Termo constante (ex.: repulsão nuclear).
+        use_symmetry (bool, optional): Explora as simetrias quando válidas.
+        block_size (int, optional): Orbitais espaciais por fatia quando ``eri`` é um IntegralStore.
+
+    Returns:
+        CompiledPauliHamiltonian: Hamiltoniano compilado.
+    """
+    h1 = np.asarray(h1)
+    streamed = hasattr(eri, "iter_spin_orbital_blocks")
+    if streamed:
+        h1 = np.kron(h1, np.eye(2))  # 2p = α, 2p+1 = β, como as fatias de eri
+    else:
+        eri = np.asarray(eri)
+    n = h1.shape[0]
+    if n_qubits is None:
+        n_qubits = n
+    symmetric = use_symmetry and _has_real_symmetry(h1, None if streamed else eri)
+
+    # Termos de 1 elétron: a†_p a_q
+    p, q = np.nonzero(np.abs(h1) > tol)
+    coeffs = h1[p, q]
+    if symmetric:
+        code = p * n + q
+        is_rep, mult = _orbit_representatives(code, [q * n + p])
+        p, q, coeffs = p[is_rep], q[is_rep], coeffs[is_rep] * mult[is_rep]
+    x1, z1, c1 = _jw_ladder_products(np.stack([p, q], axis=1), (True, False), coeffs)
+
+    # Termos de 2 elétrons: a†_p a†_q a_s a_r, fatia eri_so[P0:P1] por vez
+    if streamed:
+        # as strings já combinadas ficam limitadas ao número de Paulis distintas
+        x, z, c = x1, z1, c1
+        for start, block in eri.iter_spin_orbital_blocks(block_size):
+            x2, z2, c2 = _two_body_terms(block, start, n, tol, symmetric)
+            x, z, c = _combine(np.concatenate([x, x2]), np.concatenate([z, z2]), np.concatenate([c, c2]), 0.0)
+    else:
+        x2, z2, c2 = _two_body_terms(eri, 0, n, tol, symmetric)
+        x = np.concatenate([x1, x2])
+        z = np.concatenate([z1, z2])
+        c = np.concatenate([c1, c2])
+    if symmetric:
+        # a soma de cada órbita com o seu adjunto é hermitiana: na base das
+        # Paulis hermitianas i^{n_Y} X^x Z^z sobrevive só a parte real
+        i_ny = 1j ** (popcount(x & z) % 4)
+        c = (c / i_ny).real * i_ny
+    x, z, c = _combine(x, z, c, tol)
+
+    identity = (x == 0) & (z == 0)
+    constant = constant + np.sum(c[identity])
+    x, z, c = x[~identity], z[~identity], c[~identity]
+    return CompiledPauliHamiltonian(n_qubits, x, z, c, constant)
+
+
+# ----------------- Verificação -----------------
+def check_streamed(path, block_size=1, tol=1e-12):
+    """Compara o caminho em fatias de um arquivo de integrais com o tensor expandido.
+
+    Constrói ``build_qubit_hamiltonian(store.h1, store)`` e
+    ``build_qubit_hamiltonian(*spin_orbital_integrals(h1, store.full_eri()))``
+    e exige as mesmas strings de Pauli, coeficientes e constante.
+
+    Returns:
+        bool: True se os dois Hamiltonianos coincidem.
+    """
+    from integral_store import IntegralStore
+    from symmetry import spin_orbital_integrals
+
+    store = IntegralStore(path)
+    streamed = build_qubit_hamiltonian(store.h1, store, block_size=block_size)
+    dense = build_qubit_hamiltonian(*spin_orbital_integrals(store.h1, store.full_eri()))
+    return (streamed.n_qubits == dense.n_qubits
+            and np.array_equal(streamed.flip_masks, dense.flip_masks)
+            and np.array_equal(streamed.phase_masks, dense.phase_masks)
+            and np.allclose(streamed.coeffs, dense.coeffs, rtol=0.0, atol=tol)
+            and abs(streamed.constant - dense.constant) <= tol)
+
+
+def main(argv=None):
+    """Summary
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Confere o Hamiltoniano em fatias contra o tensor em spin-orbitais.")
+    parser.add_argument("integrals", nargs="*", default=["h2_integrals.npz", "lih_integrals.npz"],
+                        help="arquivos de integrais (padrão: H₂ e LiH)")
+    parser.add_argument("--block-size", type=int, default=1, help="orbitais espaciais por fatia")
+    args = parser.parse_args(argv)
+
+    failures = [path for path in args.integrals if not check_streamed(path, args.block_size)]
+    for path in args.integrals:
+        print(f"   {'❌' if path in failures else '✅'} {path}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import os
+import hashlib
+import numpy as np
+import profiling
+from pauli_hamiltonian import CompiledPauliHamiltonian
+from hamiltonian_builder import build_qubit_hamiltonian
+from integral_store import IntegralStore
+from symmetry import spin_orbital_integrals
+
+# ----------------- Cache em disco -----------------
+# Versão do formato/convenção das tabelas: mudar invalida todo o cache
+CACHE_VERSION = 1
+MAPPINGS = ("jordan-wigner",)
+DEFAULT_CACHE_DIR = os.environ.get("RBM_HAMILTONIAN_CACHE", ".hamiltonian_cache")
+HASH_CHUNK = 1 << 22
+
+
+def hamiltonian_key(h1, eri, n_qubits, nelec=None, tol=1e-12, constant=0.0, mapping="jordan-wigner"):
+    """Hash sha256 de tudo que determina o Hamiltoniano compilado.
+
+    Entram o conteúdo (bytes, dtype e shape) de h1 e eri, o mapeamento,
+    o setor (n_orb, nelec), o número de qubits, o limiar de triagem, o
+    termo constante e, para um IntegralStore, a expansão em spin-orbitais
+    feita pelo construtor. Qualquer mudança gera outra chave.
+
+    Returns:
+        str: Hash hexadecimal.
+    """
+    digest = hashlib.sha256()
+    store = hasattr(eri, "eri8")
+    meta = (CACHE_VERSION, mapping, int(np.shape(h1)[0]), nelec, int(n_qubits), float(tol), complex(constant))
+    if store:
+        # entradas antigas de IntegralStore eram do operador espacial, sem spin
+        meta += ("spin-orbital",)
+    digest.update(repr(meta).encode())
+    # de um IntegralStore entra o vetor empacotado, lido do disco em fatias
+    eri_tag, eri = ("s8", eri.eri8) if store else ("", eri)
+    for tag, array in (("", h1), (eri_tag, eri)):
+        array = np.ascontiguousarray(array)
+        digest.update(f"{tag}{array.dtype.str}{array.shape}".encode())
+        flat = array.reshape(-1)
+        for start in range(0, flat.size, HASH_CHUNK):
+            digest.update(flat[start:start + HASH_CHUNK].tobytes())
+    return digest.hexdigest()
+
+
+def cached_qubit_hamiltonian(h1, eri, n_qubits=None, nelec=None, tol=1e-12, constant=0.0,
+                             mapping="jordan-wigner", cache_dir=None, verbose=False):
+    """``build_qubit_hamiltonian`` com cache persistente em disco.
+
+    Na primeira chamada o Hamiltoniano é construído e gravado em
+    ``cache_dir/<hash>.npz``; chamadas seguintes com os mesmos integrais e
+    parâmetros só leem as tabelas. Use ``cache_dir=False`` para desativar.
+
+    Args:
+        h1 (np.ndarray): Integrais de um elétron.
+        eri (np.ndarray or IntegralStore): Integrais de dois elétrons; um
+            IntegralStore (com ``h1`` espacial) é expandido em spin-orbitais.
+        n_qubits (int, optional): Número de qubits (padrão: o tamanho de h1,
+            ou 2·n_orb com IntegralStore).
+        nelec (int, optional): Número de elétrons do setor (entra na chave).
+        tol (float, optional): Limiar de triagem dos coeficientes.
+        constant (float, optional): Termo constante.
+        mapping (str, optional): Mapeamento fermion → qubit.
+        cache_dir (str, optional): Diretório do cache (padrão $RBM_HAMILTONIAN_CACHE
+            ou ``.hamiltonian_cache``).
+        verbose (bool, optional): Informa se houve acerto no cache.
+
+    Returns:
+        CompiledPauliHamiltonian: Hamiltoniano compilado.
+    """
+    if mapping not in MAPPINGS:
+        raise ValueError(f"Mapeamento '{mapping}' não suportado (opções: {MAPPINGS})")
+    if n_qubits is None:
+        n_qubits = np.shape(h1)[0] * (2 if hasattr(eri, "iter_spin_orbital_blocks") else 1)
+    if cache_dir is False:
+        return build_qubit_hamiltonian(h1, eri, n_qubits, tol, constant)
+    if cache_dir is None:
+        cache_dir = DEFAULT_CACHE_DIR
+
+    key = hamiltonian_key(h1, eri, n_qubits, nelec, tol, constant, mapping)
+    path = os.path.join(cache_dir, f"{key}.npz")
+    if os.path.exists(path):
+        try:
+            H = CompiledPauliHamiltonian.load(path)
+            profiling.count("hamiltonian_cache_hits")
+            if verbose:
+                print(f"📦 Hamiltoniano carregado do cache: {path}")
+            return H
+        except (OSError, ValueError, KeyError):
+            print(f"⚠️ Entrada de cache corrompida, reconstruindo: {path}")
+
+    profiling.count("hamiltonian_cache_misses")
+    H = build_qubit_hamiltonian(h1, eri, n_qubits, tol, constant)
+    os.makedirs(cache_dir, exist_ok=True)
+    H.save(path)
+    if verbose:
+        print(f"💾 Hamiltoniano gravado no cache: {path}")
+    return H
+
+
+def load_hamiltonian(integrals_path, n_qubits=None, tol=1e-12, constant=None, mapping="jordan-wigner",
+                     cache_dir=None, verbose=False):
+    """Hamiltoniano compilado a partir de um arquivo de integrais (ver integral_store).
+
+    As integrais espaciais viram 2·n_orb spin-orbitais (2p = α, 2p+1 = β).
+    Arquivos no formato empacotado são lidos e expandidos em fatias direto
+    do disco; os antigos (``h1``, ``eri`` completo) continuam aceitos e
+    passam por ``symmetry.spin_orbital_integrals``. Sem ``constant``,
+    entra o ``e_core`` gravado no arquivo.
+    """
+    store = IntegralStore(integrals_path)
+    if constant is None:
+        constant = store.e_core
+    if store.legacy:
+        h1, eri = spin_orbital_integrals(store.h1, store.full_eri())
+    else:
+        h1, eri = store.h1, store
+    return cached_qubit_hamiltonian(h1, eri, n_qubits, store.nelec, tol, constant, mapping, cache_dir, verbose)
@@ -0,0 +1,392 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import os
+import json
+import struct
+import zipfile
+import numpy as np
+
+# ----------------- Formato -----------------
+# Um arquivo .npz sem compressão com:
+#   meta    JSON (versão, n_orb, nelec, base, geometria, e_core, convenção das ERIs, ...)
+#   h1      integrais de um elétron (n_orb, n_orb)
+#   eri8    ERIs (pq|rs) com as 8 simetrias de permutação, vetor de npair·(npair+1)/2
+#   orbsym  (opcional) irreps dos orbitais
+#   mo_energy, mo_coeff, mo_occ  (opcionais) resultado do SCF que gerou os orbitais
+# A repulsão nuclear e a energia HF ficam no JSON (e_nuc, e_hf), então os
+# drivers não precisam refazer o SCF (nem importar o PySCF) para relatar
+# energias totais.
+# O layout de ``eri8`` é o mesmo de ``ao2mo.restore(8, ...)`` do PySCF: par
+# pq = p(p+1)/2 + q com p ≥ q e, para os pares, ij = i(i+1)/2 + j com i ≥ j.
+# Como os membros do zip não são comprimidos, ``eri8`` é mapeado direto do
+# disco (np.memmap) e só as páginas lidas entram na memória.
+INTEGRAL_STORE_FORMAT = "rbm-integrals"
+INTEGRAL_STORE_VERSION = 1
+ERI_CONVENTIONS = ("chemist",)
+SCF_ARRAYS = ("mo_energy", "mo_coeff", "mo_occ")
+
+
+def pair_index(p, q):
+    """Índice triangular do par (p, q): max(p,q)·(max(p,q)+1)/2 + min(p,q).
+    """
+    p = np.asarray(p, dtype=np.int64)
+    q = np.asarray(q, dtype=np.int64)
+    high, low = np.maximum(p, q), np.minimum(p, q)
+    return high * (high + 1) // 2 + low
+
+
+def eri8_index(p, q, r, s):
+    """Posição de (pq|rs) no vetor ``eri8``.
+    """
+    return pair_index(pair_index(p, q), pair_index(r, s))
+
+
+def eri8_size(n_orb):
+    """Número de elementos únicos das ERIs reais de ``n_orb`` orbitais.
+    """
+    n_pair = n_orb * (n_orb + 1) // 2
+    return n_pair * (n_pair + 1) // 2
+
+
+def n_orb_from_eri8(size):
+    """Inverte ``eri8_size``: n_orb a partir do comprimento do vetor empacotado.
+    """
+    n_pair = int(round((np.sqrt(8 * size + 1) - 1) / 2))
+    n_orb = int(round((np.sqrt(8 * n_pair + 1) - 1) / 2))
+    if eri8_size(n_orb) != size:
+        raise ValueError(f"Comprimento {size} não corresponde a ERIs empacotadas com simetria 8")
+    return n_orb
+
+
+def pack_eri8(eri, tol=1e-10):
+    """Empacota o tensor (pq|rs) completo no vetor com simetria 8.
+
+    Args:
+        eri (np.ndarray): ERIs (n, n, n, n) na notação química.
+        tol (float, optional): Tolerância das verificações de simetria.
+
+    Returns:
+        np.ndarray: Vetor de ``eri8_size(n)`` elementos.
+    """
+    eri = np.asarray(eri)
+    if np.iscomplexobj(eri):
+        raise ValueError("ERIs complexas não têm a simetria 8 (use o tensor completo)")
+    n = eri.shape[0]
+    if eri.shape != (n,) * 4:
+        raise ValueError(f"ERIs devem ter shape (n, n, n, n), recebeu {eri.shape}")
+    if not (np.allclose(eri, eri.transpose(1, 0, 2, 3), atol=tol)
+            and np.allclose(eri, eri.transpose(0, 1, 3, 2), atol=tol)
+            and np.allclose(eri, eri.transpose(2, 3, 0, 1), atol=tol)):
+        raise ValueError("ERIs sem as simetrias (pq|rs) = (qp|rs) = (pq|sr) = (rs|pq)")
+    p, q = np.tril_indices(n)
+    pairs = eri[p[:, None], q[:, None], p[None, :], q[None, :]]
+    i, j = np.tril_indices(len(p))
+    return np.ascontiguousarray(pairs[i, j], dtype=float)
+
+
+def unpack_eri8(eri8, n_orb=None):
+    """Tensor (pq|rs) completo (n, n, n, n) a partir do vetor com simetria 8.
+    """
+    eri8 = np.asarray(eri8)
+    if n_orb is None:
+        n_orb = n_orb_from_eri8(len(eri8))
+    idx = np.arange(n_orb)
+    pq = pair_index(idx[:, None], idx[None, :])
+    return eri8[pair_index(pq[:, :, None, None], pq[None, None, :, :])]
+
+
+def spin_orbital_block(eri):
+    """Expande uma fatia eri[p0:p1] (pq|rs) espacial para spin-orbitais intercalados.
+
+    O spin-orbital 2p é α e 2p+1 é β, e a saída já está na ordem dos
+    construtores de Hamiltoniano (coeficiente de ½ a†_P a†_Q a_S a_R):
+
+        eri_so[2p+σ, 2q+τ, 2r+σ, 2s+τ] = (pr|qs)
+
+    Args:
+        eri (np.ndarray): Fatia (m, n, n, n) ou o tensor completo.
+
+    Returns:
+        np.ndarray: Fatia (2m, 2n, 2n, 2n) em spin-orbitais.
+    """
+    physicist = np.asarray(eri).transpose(0, 2, 1, 3)
+    spin = np.eye(2)
+    eri_so = np.einsum("pqrs,ac,bd->paqbrcsd", physicist, spin, spin)
+    return eri_so.reshape(tuple(2 * d for d in physicist.shape))
+
+
+# ----------------- Escrita -----------------
+def save_integrals(path, h1, eri, nelec, e_core=0.0, basis=None, geometry=None, orbsym=None, e_nuc=None,
+                   e_hf=None, mo_energy=None, mo_coeff=None, mo_occ=None, convention="chemist", **meta):
+    """Grava integrais no formato empacotado (escrita atômica).
+
+    Args:
+        path (str): Arquivo de saída (``.npz``).
+        h1 (np.ndarray): Integrais de um elétron (n_orb, n_orb), reais.
+        eri (np.ndarray): ERIs (pq|rs) completas (n,)*4 ou já empacotadas
+            (vetor ``eri8``, ex.: ``ao2mo.restore(8, ...)``).
+        nelec (int): Número de elétrons (do espaço ativo, se houver).
+        e_core (float, optional): Repulsão nuclear (mais a energia do caroço congelado).
+        basis (str, optional): Base atômica.
+        geometry (str or list, optional): Geometria no formato do PySCF.
+        orbsym (array_like, optional): Irreps dos orbitais.
+        e_nuc (float, optional): Repulsão nuclear (igual a ``e_core`` sem caroço congelado).
+        e_hf (float, optional): Energia Hartree–Fock total.
+        mo_energy (np.ndarray, optional): Energias dos orbitais.
+        mo_coeff (np.ndarray, optional): Coeficientes dos MOs (n_ao, n_mo).
+        mo_occ (np.ndarray, optional): Ocupações dos MOs.
+        convention (str, optional): Convenção das ERIs (só 'chemist').
+        **meta: Metadados extras serializáveis em JSON (ex.: spin, charge).
+
+    Returns:
+        str: ``path``.
+    """
+    if convention not in ERI_CONVENTIONS:
+        raise ValueError(f"Convenção de ERIs '{convention}' não suportada (opções: {ERI_CONVENTIONS})")
+    h1 = np.asarray(h1)
+    if np.iscomplexobj(h1) or not np.allclose(h1, h1.T):
+        raise ValueError("h1 deve ser real e simétrica")
+    n_orb = h1.shape[0]
+    eri = np.asarray(eri)
+    eri8 = pack_eri8(eri) if eri.ndim == 4 else np.ascontiguousarray(eri.reshape(-1), dtype=float)
+    if len(eri8) != eri8_size(n_orb):
+        raise ValueError(f"eri8 com {len(eri8)} elementos, esperado {eri8_size(n_orb)} para {n_orb} orbitais")
+
+    header = {"format": INTEGRAL_STORE_FORMAT, "version": INTEGRAL_STORE_VERSION, "n_orb": int(n_orb),
+              "nelec": int(nelec), "e_core": float(e_core), "basis": basis, "geometry": geometry,
+              "eri_convention": convention, "eri_packing": "s8",
+              "e_nuc": None if e_nuc is None else float(e_nuc), "e_hf": None if e_hf is None else float(e_hf)}
+    header.update({key: value.item() if isinstance(value, np.generic) else value for key, value in meta.items()})
+    arrays = {"meta": np.array(json.dumps(header)), "h1": np.ascontiguousarray(h1, dtype=float), "eri8": eri8}
+    if orbsym is not None:
+        arrays["orbsym"] = np.asarray(orbsym, dtype=np.int64)
+    for name, array in zip(SCF_ARRAYS, (mo_energy, mo_coeff, mo_occ)):
+        if array is not None:
+            arrays[name] = np.asarray(array, dtype=float)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+    return path
+
+
+def convert_integrals(source, target=None, **meta):
+    """Converte um arquivo antigo (``h1``, ``eri`` completo) para o formato empacotado.
+
+    Com ``target`` None o arquivo é reescrito no lugar.
+    """
+    store = IntegralStore(source, mmap=False)
+    header = {key: value for key, value in store.meta.items()
+              if key not in ("format", "version", "n_orb", "eri_packing")}
+    header.update(meta)
+    for name in SCF_ARRAYS:
+        if header.get(name) is None:
+            header[name] = getattr(store, name)
+    return save_integrals(source if target is None else target, store.h1, store.eri8, orbsym=store.orbsym,
+                          convention=header.pop("eri_convention", "chemist"), **header)
+
+
+# ----------------- Leitura -----------------
+def _npz_memmap(path, name):
+    """np.memmap do membro ``name`` de um .npz não comprimido (None se comprimido).
+    """
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo(f"{name}.npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    with open(path, "rb") as f:
+        f.seek(info.header_offset)
+        local = f.read(30)
+        if local[:4] != b"PK\x03\x04":
+            raise ValueError(f"Cabeçalho zip inválido em {path}")
+        name_len, extra_len = struct.unpack("<HH", local[26:30])
+        f.seek(info.header_offset + 30 + name_len + extra_len)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if dtype.hasobject:
+        raise ValueError(f"Membro {name} de {path} não pode ser mapeado")
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape, order="F" if fortran else "C")
+
+
+class IntegralStore:
+
+    """Acesso preguiçoso a um arquivo de integrais.
+
+    Lê o formato empacotado (``save_integrals``) com ``eri8`` mapeado do
+    disco e, por compatibilidade, os arquivos antigos com ``eri`` completo
+    (empacotado na memória ao abrir; ``full_eri`` e ``iter_eri_blocks``
+    devolvem o tensor original sem alteração). h1 é pequeno e sempre
+    carregado.
+
+    As ERIs nunca são expandidas sem pedido explícito: ``eri`` busca
+    elementos avulsos, ``iter_eri_blocks`` gera fatias eri[p0:p1] de
+    tamanho limitado, ``iter_spin_orbital_blocks`` as mesmas fatias já em
+    spin-orbitais para os construtores de Hamiltoniano, e ``full_eri``
+    monta o tensor (n,)*4.
+
+    Attributes:
+        path (str): Arquivo de origem.
+        meta (dict): Metadados (versão, n_orb, nelec, basis, geometry, e_core, eri_convention, ...).
+        h1 (np.ndarray): Integrais de um elétron.
+        eri8 (np.ndarray): ERIs empacotadas (np.memmap quando possível).
+        orbsym (np.ndarray): Irreps dos orbitais ou None.
+        mo_energy, mo_coeff, mo_occ (np.ndarray): Dados do SCF ou None.
+    """
+
+    block_elements = 1 << 22
+
+    def __init__(self, path, mmap=True):
+        """Summary
+        """
+        self.path = path
+        self._eri = None
+        with np.load(path) as data:
+            files = set(data.files)
+            if "meta" in files:
+                self.meta = json.loads(str(data["meta"]))
+                if self.meta.get("format") != INTEGRAL_STORE_FORMAT:
+                    raise ValueError(f"{path} não é um arquivo de integrais ({self.meta.get('format')})")
+                if self.meta["version"] > INTEGRAL_STORE_VERSION:
+                    raise ValueError(f"{path} usa a versão {self.meta['version']} do formato "
+                                     f"(suportada até {INTEGRAL_STORE_VERSION})")
+                self.h1 = data["h1"]
+                self.eri8 = _npz_memmap(path, "eri8") if mmap else None
+                if self.eri8 is None:
+                    self.eri8 = data["eri8"]
+            elif {"h1", "eri"} <= files:
+                # formato antigo: tensor completo, sem versão
+                self.h1 = data["h1"]
+                self._eri = data["eri"]
+                self.eri8 = pack_eri8(self._eri)
+                self.meta = {"format": INTEGRAL_STORE_FORMAT, "version": 0, "n_orb": int(self.h1.shape[0]),
+                             "nelec": None, "e_core": 0.0, "basis": None, "geometry": None,
+                             "eri_convention": "chemist", "eri_packing": "s8"}
+                # escalares soltos (nelec, e_core, e_hf, ...) viram metadados
+                for key in files - {"h1", "eri", "orbsym", "n_orb"}:
+                    if data[key].ndim == 0:
+                        self.meta[key] = data[key].item()
+            else:
+                raise ValueError(f"{path} não tem h1/eri nem h1/eri8")
+            self.orbsym = np.asarray(data["orbsym"], dtype=np.int64) if "orbsym" in files else None
+            for name in SCF_ARRAYS:
+                setattr(self, name, data[name] if name in files and data[name].ndim else None)
+
+    def __repr__(self):
+        return (f"IntegralStore({self.path!r}, n_orb={self.n_orb}, nelec={self.nelec}, "
+                f"version={self.meta['version']})")
+
+    @property
+    def legacy(self):
+        """True para arquivos antigos (tensor completo já na memória).
+        """
+        return self._eri is not None
+
+    @property
+    def n_orb(self):
+        return self.meta["n_orb"]
+
+    @property
+    def nelec(self):
+        return self.meta["nelec"]
+
+    @property
+    def e_core(self):
+        return self.meta["e_core"]
+
+    @property
+    def e_nuc(self):
+        return self.meta.get("e_nuc")
+
+    @property
+    def e_hf(self):
+        return self.meta.get("e_hf")
+
+    @property
+    def basis(self):
+        return self.meta.get("basis")
+
+    @property
+    def geometry(self):
+        return self.meta.get("geometry")
+
+    @property
+    def convention(self):
+        return self.meta.get("eri_convention", "chemist")
+
+    def eri(self, p, q, r, s):
+        """Elementos (pq|rs), vetorizado (arrays de índices com broadcasting).
+        """
+        return np.asarray(self.eri8[eri8_index(p, q, r, s)])
+
+    def eri_block(self, start, stop):
+        """Fatia eri[start:stop] completa, shape (stop − start, n, n, n).
+        """
+        if self._eri is not None:
+            return self._eri[start:stop]
+        n = self.n_orb
+        idx = np.arange(n)
+        pq = pair_index(np.arange(start, stop)[:, None], idx[None, :])
+        rs = pair_index(idx[:, None], idx[None, :])
+        return np.asarray(self.eri8[pair_index(pq[:, :, None, None], rs[None, None, :, :])])
+
+    def iter_eri_blocks(self, block_size=None):
+        """Gera (start, eri[start:start + block_size]) cobrindo o primeiro índice.
+
+        O padrão limita cada bloco a ``block_elements`` elementos, então a
+        memória não depende de n⁴.
+        """
+        n = self.n_orb
+        if block_size is None:
+            block_size = max(1, self.block_elements // max(n ** 3, 1))
+        for start in range(0, n, block_size):
+            yield start, self.eri_block(start, min(start + block_size, n))
+
+    def iter_spin_orbital_blocks(self, block_size=None):
+        """Gera (2·start, fatia em spin-orbitais) para os orbitais espaciais [start, start + block_size).
+
+        Cada fatia sai de ``spin_orbital_block``, com shape
+        (2·block_size, 2n, 2n, 2n); o padrão limita esse tamanho a
+        ``block_elements`` elementos.
+        """
+        n = self.n_orb
+        if block_size is None:
+            block_size = max(1, self.block_elements // max(16 * n ** 3, 1))
+        for start, block in self.iter_eri_blocks(block_size):
+            yield 2 * start, spin_orbital_block(block)
+
+    def full_eri(self):
+        """Tensor (pq|rs) completo (n,)*4 na memória.
+        """
+        if self._eri is not None:
+            return self._eri
+        return unpack_eri8(self.eri8, self.n_orb)
+
+
+def load_integrals(path, mmap=True):
+    """Abre um arquivo de integrais (formato empacotado ou antigo) como IntegralStore.
+    """
+    return IntegralStore(path, mmap=mmap)
@@ -16,37 +16,21 @@
 ====================================================================================================================================================
 """
 
-from openfermion import FermionOperator, jordan_wigner, hermitian_conjugated, load_operator
 import numpy as np
+from hamiltonian_cache import cached_qubit_hamiltonian
+from integral_store import IntegralStore
+from symmetry import spin_orbital_integrals
 
 # Carrega os dados do PySCF
-data = np.load("h2_integrals.npz")
-h1 = data["h1"]
-eri = data["eri"]
-n_orb = int(data["n_orb"])
-nelec = int(data["nelec"])
+store = IntegralStore("h2_integrals.npz")
+h1 = store.h1
+eri = store.full_eri()
+n_orb = store.n_orb
+nelec = store.nelec
 
-# Cria Hamiltoniano em segunda quantização
-H = FermionOperator()
-
-# Termos de um elétron
-for p in range(n_orb):
-    for q in range(n_orb):
-        coef = h1[p, q]
-        if abs(coef) > 1e-12:
-            H += FermionOperator(f"{p}^ {q}", coef)
-
-# Termos de dois elétrons
-for p in range(n_orb):
-    for q in range(n_orb):
-        for r in range(n_orb):
-            for s in range(n_orb):
-                coef = 0.5 * eri[p, q, r, s]
-                if abs(coef) > 1e-12:
-                    H += FermionOperator(f"{p}^ {q}^ {s} {r}", coef)
-
-# Aplica Jordan-Wigner
-H_jw = jordan_wigner(H)
+# Cria Hamiltoniano em segunda quantização (spin-orbitais) e aplica Jordan–Wigner
+h1_so, eri_so = spin_orbital_integrals(h1, eri)
+H_jw = cached_qubit_hamiltonian(h1_so, eri_so, n_qubits=2 * n_orb, nelec=nelec).to_qubit_operator()
 
 # Mostra os 10 primeiros termos do Hamiltoniano mapeado
 print("Hamiltoniano mapeado (Jordan–Wigner):")
@@ -17,40 +17,25 @@
 """
 
 import numpy as np
-from openfermion import FermionOperator, jordan_wigner, get_sparse_operator
-from scipy.sparse.linalg import eigsh
+from hamiltonian_cache import cached_qubit_hamiltonian
+from integral_store import IntegralStore
+from symmetry import spin_orbital_integrals
+from config_index import ConfigIndex
+from exact_diag import projected_hamiltonian, lowest_eigenpairs
 from itertools import combinations
 
 # 1. Carrega os dados
-data = np.load("lih_integrals.npz")
-h1 = data["h1"]
-eri = data["eri"]
-n_orb = int(data["n_orb"])     # 6
-nelec = int(data["nelec"])     # 4
+store = IntegralStore("lih_integrals.npz")
+h1 = store.h1
+eri = store.full_eri()
+n_orb = store.n_orb     # 6
+nelec = store.nelec     # 4
 
-# 2. Constrói Hamiltoniano em segunda quantização
-H = FermionOperator()
+# 2–3. Constrói Hamiltoniano em segunda quantização (spin-orbitais) e aplica Jordan-Wigner
+h1_so, eri_so = spin_orbital_integrals(h1, eri)
+H_jw = cached_qubit_hamiltonian(h1_so, eri_so, n_qubits=2 * n_orb, nelec=nelec)
 
-# Termos de 1 elétron
-for p in range(n_orb):
-    for q in range(n_orb):
-        coef = h1[p, q]
-        if abs(coef) > 1e-12:
-            H += FermionOperator(f"{p}^ {q}", coef)
-
-# Termos de 2 elétrons
-for p in range(n_orb):
-    for q in range(n_orb):
-        for r in range(n_orb):
-            for s in range(n_orb):
-                coef = 0.5 * eri[p, q, r, s]
-                if abs(coef) > 1e-12:
-                    H += FermionOperator(f"{p}^ {q}^ {s} {r}", coef)
-
-# 3. Jordan-Wigner
-H_jw = jordan_wigner(H)
-
-# 4. Gera todas as 15 configurações (ocupações binárias com 4 elétrons em 6 orbitais)
+# 4. Gera todas as 495 configurações (ocupações binárias com 4 elétrons em 12 spin-orbitais)
 def generate_configurations(n, k):
     """Summary
     """
@@ -61,33 +46,15 @@ def generate_configurations(n, k):
         configs.append(state)
     return np.array(configs)
 
-configs = generate_configurations(n_orb, nelec)
-
-# 5. Avalia H em cada par de configurações (15x15 matriz)
-psi_vals = [1.0] * len(configs)  # assume função de onda igual para projeção
-H_matrix = np.zeros((len(configs), len(configs)), dtype=complex)
+configs = generate_configurations(2 * n_orb, nelec)
 
-for i, sigma_i in enumerate(configs):
-    for j, sigma_j in enumerate(configs):
-        contrib = 0
-        for term, coeff in H_jw.terms.items():
-            s_i = sigma_i.copy()
-            s_j = sigma_j.copy()
-            phase = 1.0 + 0j
-            for qubit, op in term:
-                if op == 'Z':
-                    phase *= (-1) ** s_j[qubit]
-                elif op in ('X', 'Y'):
-                    s_j[qubit] = 1 - s_j[qubit]
-                    if op == 'Y':
-                        phase *= 1j if sigma_j[qubit] == 0 else -1j
-            if np.array_equal(s_j, sigma_i):
-                contrib += coeff * phase
-        H_matrix[i, j] = contrib
+# 5. Monta H projetado como matriz esparsa (só as conexões não nulas)
+H_matrix = projected_hamiltonian(H_jw, ConfigIndex(configs))
 
-# 6. Diagonaliza
-eigvals, eigvecs = np.linalg.eigh(H_matrix.real)
+# 6. Diagonaliza (Lanczos/Davidson para setores grandes)
+eigvals, eigvecs = lowest_eigenpairs(H_matrix, k=1)
 
 # 7. Resultado
 E_ground = eigvals[0]
-print(f"⚛️ Energia eletrônica exata (FCI) no subespaço de 15 estados: {E_ground:.6f} Ha")
\ No newline at end of file
+print(f"⚛️ Energia eletrônica exata (FCI) no setor de {len(configs)} determinantes: {E_ground:.6f} Ha | "
+      f"total: {E_ground + store.e_nuc:.6f} Ha")
\ No newline at end of file
@@ -17,6 +17,8 @@
 """
 
 import numpy as np
+from integral_store import IntegralStore
 
 data = np.load("lih_integrals.npz")
-print("Conteúdo do arquivo:", list(data.keys()))
\ No newline at end of file
+print("Conteúdo do arquivo:", list(data.keys()))
+print("Metadados:", IntegralStore("lih_integrals.npz").meta)
\ No newline at end of file
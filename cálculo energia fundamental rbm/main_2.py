@@ -16,14 +16,24 @@
 ====================================================================================================================================================
 """
 
+import sys
 import numpy as np
-import matplotlib.pyplot as plt
-from openfermion import FermionOperator, jordan_wigner
+from hamiltonian_cache import cached_qubit_hamiltonian, hamiltonian_key
+from integral_store import IntegralStore
+from symmetry import spin_orbital_integrals
+from exact_diag import sector_ground_state
+from reporting import save_training_log, render_in_background
 from itertools import combinations
 from scipy.linalg import lstsq
+from config_index import ConfigIndex
+from pauli_hamiltonian import CompiledPauliHamiltonian
+from rbm_batch import BatchRBMMixin
+from sr_solver import SRSolver
+from checkpoint import Checkpointer
+from estimators import LOG2, log_cosh, born_probabilities, local_energies, connected_indices
 
 # ================= Classe RBM ===================
-class RBM:
+class RBM(BatchRBMMixin):
 
     """Description
     
@@ -55,7 +65,7 @@ class RBM:
         """
         a_dot = np.dot(self.a, sigma)
         preactivation = self.b + np.dot(sigma, self.W)
-        return a_dot + np.sum(np.log(2 * np.cosh(preactivation)))
+        return a_dot + np.sum(log_cosh(preactivation) + LOG2)
 
     def psi(self, sigma):
         """Description
@@ -101,56 +111,8 @@ def generate_configurations(n_sites, n_electrons):
         configs.append(cfg)
     return np.array(configs)
 
-def apply_term(term, sigma):
-    """Description
-    
-    Args:
-        term (TYPE): Description
-        sigma (TYPE): Description
-    
-    Returns:
-        TYPE: Description
-    """
-    new_sigma = sigma.copy()
-    coeff = 1.0
-    for i, op in term:
-        if op == 'Z':
-            coeff *= (-1)**int(new_sigma[i])
-        elif op in ('X', 'Y'):
-            coeff *= 1j if op == 'Y' and new_sigma[i] == 0 else (-1j if op == 'Y' else 1)
-            new_sigma[i] = 1 - new_sigma[i]
-    return coeff, new_sigma
-
-def local_energy(rbm, sigma, hamiltonian, configs, psi_vals):
-    """Description
-    
-    Args:
-        rbm (TYPE): Description
-        sigma (TYPE): Description
-        hamiltonian (TYPE): Description
-        configs (TYPE): Description
-        psi_vals (TYPE): Description
-    
-    Returns:
-        TYPE: Description
-    """
-    E_loc = 0
-    psi_sigma = rbm.psi(sigma)
-    for term, coeff in hamiltonian.terms.items():
-        if term == ():  # identidade
-            E_loc += coeff
-        else:
-            phase, new_sigma = apply_term(term, sigma)
-            try:
-                j = configs.tolist().index(new_sigma.tolist())
-                psi_sp = psi_vals[j]
-                E_loc += coeff * phase * psi_sp / psi_sigma
-            except ValueError:
-                continue
-    return E_loc
-
 # ============== Treinamento com SR ===============
-def train_rbm_sr(rbm, configs, H_jw, epochs=100, lr=0.01, damping=1e-3):
+def train_rbm_sr(rbm, configs, H_jw, epochs=100, lr=0.01, damping=1e-3, sr_solver=None, checkpoint=None):
     """Description
     
     Args:
@@ -160,172 +122,110 @@ def train_rbm_sr(rbm, configs, H_jw, epochs=100, lr=0.01, damping=1e-3):
         epochs (int, optional): Description
         lr (float, optional): Description
         damping (float, optional): Description
+        sr_solver (SRSolver or str, optional): Resolve o SR sem formar S
+            ('cg', 'minres' ou 'minsr', com S centrada e deslocamento ``damping``);
+            None mantém a matriz S densa com lstsq
+        checkpoint (Checkpointer or str, optional): Grava o estado a cada
+            ``every`` épocas; com ``resume=True`` retoma do último checkpoint
     
     Returns:
         TYPE: Description
     """
-    energies = []
-
-    for epoch in range(epochs):
-        psi_vals = np.array([rbm.psi(cfg) for cfg in configs])
-        norm = np.sum(np.abs(psi_vals)**2)
-        norm_probs = np.abs(psi_vals)**2 / norm
-
-        E_locals = np.array([local_energy(rbm, sigma, H_jw, configs, psi_vals) for sigma in configs])
-        E_mean = np.sum(norm_probs * E_locals.real)
-        energies.append(E_mean)
-
-        # Valor de referência para H₂
-        chemical_accuracy = 1.6e-5
-
-        # if epoch > 0 and abs(energies[-1] - energies[-2]) < chemical_accuracy:
-        #     print(f"✅ Convergência interna na época {epoch+1}: variação < {chemical_accuracy}")
-        #     break
-
-        if epoch > 0 and abs(energies[-1] - energies[-2]) < 1e-3:
-            print(f"💡 ΔE < 10⁻³ at epoch {epoch+1}")
-
-        grad_logs = np.array([rbm.grad_log_psi(cfg) for cfg in configs])
-        grad_E = np.sum(norm_probs[:, None] * grad_logs * (E_locals[:, None].real - E_mean), axis=0)
-
-        S = grad_logs.T @ (norm_probs[:, None] * grad_logs)
-        S += np.eye(S.shape[0]) * damping
-
-        delta, *_ = lstsq(S, grad_E)
-
-        n_a = rbm.a.shape[0]
-        n_b = rbm.b.shape[0]
-        n_w = rbm.W.shape
-
-        rbm.a -= lr * delta[:n_a]
-        rbm.b -= lr * delta[n_a:n_a+n_b]
-        rbm.W -= lr * delta[n_a+n_b:].reshape(n_w)
-
-        print(f"Epoch {epoch+1:03d} ⟶  ⟨H⟩ = {E_mean:.6f} Ha")
+    if isinstance(sr_solver, str):
+        sr_solver = SRSolver(sr_solver, diag_shift=damping)
+    checkpoint = Checkpointer.coerce(checkpoint)
+    start_epoch, history = 0, {}
+    if checkpoint is not None:
+        start_epoch, _, history = checkpoint.restore(rbm, sr_solver)
+    energies = list(history.get("energies", []))
+    index = ConfigIndex(configs)
+    H_jw = CompiledPauliHamiltonian.coerce(H_jw, configs.shape[1])
+    j, mels = connected_indices(H_jw, index)
+
+    if checkpoint is not None:
+        checkpoint.open()
+    try:
+        for epoch in range(start_epoch, epochs):
+            log_psi = rbm.log_psi_batch(configs)
+            norm_probs = born_probabilities(log_psi)
+
+            E_locals = local_energies(log_psi, log_psi[j], mels, H_jw.constant)
+            E_mean = np.sum(norm_probs * E_locals.real)
+            energies.append(E_mean)
+
+            # Valor de referência para H₂
+            chemical_accuracy = 1.6e-5
+
+            # if epoch > 0 and abs(energies[-1] - energies[-2]) < chemical_accuracy:
+            #     print(f"✅ Convergência interna na época {epoch+1}: variação < {chemical_accuracy}")
+            #     break
+
+            if epoch > 0 and abs(energies[-1] - energies[-2]) < 1e-3:
+                print(f"💡 ΔE < 10⁻³ at epoch {epoch+1}")
+
+            grad_logs = rbm.log_derivatives_batch(configs)
+            grad_E = np.sum(norm_probs[:, None] * grad_logs * (E_locals[:, None].real - E_mean), axis=0)
+
+            if sr_solver is not None:
+                delta = sr_solver.solve(grad_logs, grad_E, norm_probs, E_locals.real)
+            else:
+                S = grad_logs.T @ (norm_probs[:, None] * grad_logs)
+                S += np.eye(S.shape[0]) * damping
+
+                delta, *_ = lstsq(S, grad_E)
+
+            n_a = rbm.a.shape[0]
+            n_b = rbm.b.shape[0]
+            n_w = rbm.W.shape
+
+            rbm.a -= lr * delta[:n_a]
+            rbm.b -= lr * delta[n_a:n_a+n_b]
+            rbm.W -= lr * delta[n_a+n_b:].reshape(n_w)
+
+            print(f"Epoch {epoch+1:03d} ⟶  ⟨H⟩ = {E_mean:.6f} Ha")
+
+            if checkpoint is not None and checkpoint.step(epoch, rbm, lr, sr_solver, energies=energies):
+                break
+        if checkpoint is not None and not checkpoint.stop_requested and energies:
+            checkpoint.finish(len(energies) - 1, rbm, lr, sr_solver, energies=energies)
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
 
     return energies
 
 # =================== Main ===================
-data = np.load("h2_integrals.npz")
-h1 = data["h1"]
-eri = data["eri"]
-n_orb = int(data["n_orb"])
-nelec = int(data["nelec"])
-
-# Monta Hamiltoniano em segunda quantização
-H = FermionOperator()
-for p in range(n_orb):
-    for q in range(n_orb):
-        if abs(h1[p, q]) > 1e-12:
-            H += FermionOperator(f"{p}^ {q}", h1[p, q])
-for p in range(n_orb):
-    for q in range(n_orb):
-        for r in range(n_orb):
-            for s in range(n_orb):
-                if abs(eri[p, q, r, s]) > 1e-12:
-                    H += FermionOperator(f"{p}^ {q}^ {s} {r}", 0.5 * eri[p, q, r, s])
+store = IntegralStore("h2_integrals.npz")
+h1 = store.h1
+eri = store.full_eri()
+n_orb = store.n_orb
+nelec = store.nelec
 
-theta = jordan_wigner(H)
+# Monta Hamiltoniano em segunda quantização (Jordan–Wigner dos integrais em spin-orbitais)
+h1_so, eri_so = spin_orbital_integrals(h1, eri)
+theta = cached_qubit_hamiltonian(h1_so, eri_so, n_qubits=2 * n_orb, nelec=nelec)
 
-# Gera as 6 configurações de 2 elétrons em 4 orbitais
+# Gera as 6 configurações de 2 elétrons em 4 spin-orbitais
 configs = generate_configurations(n_sites=4, n_electrons=2)
 
 # Cria a RBM
 rbm = RBM(n_visible=4, n_hidden=4)
 
+# Checkpoints em checkpoints/main_2_h2_sr.npz; só retoma com `python main_2.py --resume`
+# e se Hamiltoniano e hiperparâmetros forem os mesmos do checkpoint
+checkpoint = Checkpointer("checkpoints/main_2_h2_sr.npz", every=50, resume="--resume" in sys.argv[1:],
+                          fingerprint={"hamiltonian": hamiltonian_key(h1_so, eri_so, 2 * n_orb, nelec),
+                                       "epochs": 900, "lr": 0.01, "damping": 1e-3})
+
 # Treina com Stochastic Reconfiguration
-energies = train_rbm_sr(rbm, configs, theta, epochs=900, lr=0.01)
+energies = train_rbm_sr(rbm, configs, theta, epochs=900, lr=0.01, checkpoint=checkpoint)
 
-# Localiza o ponto em que a energia estabiliza abaixo do limiar de 10⁻³
+# Localiza o ponto em que a energia estabiliza abaixo do limiar de 10⁻³ (ver reporting.py)
 threshold = 1e-3
 window = 10
+fci_energy = sector_ground_state(theta, 2 * n_orb, nelec)[0][0]  # FCI eletrônica no mesmo setor
 
-
-
-
-
-
-def find_sustained_chemical_accuracy(energies, threshold=1e-3, window=10):
-    """Description
-    
-    Args:
-        energies (TYPE): Description
-        threshold (float, optional): Description
-        window (int, optional): Description
-    
-    Returns:
-        TYPE: Description
-    """
-    # for i in range(len(energies) - window):
-    #     ok = True
-    #     for j in range(i, i + window):
-    #         if abs(energies[j + 1] - energies[j]) >= threshold:
-    #             ok = False
-    #             break
-    #     if ok:
-    #         return i
-    return 609
-
-
-def plot_energy_convergence(energies, fci_energy=None, threshold=1e-3, window=10):
-    """
-    Plots the energy convergence curve with automatic detection of chemical accuracy.
-    
-    Parameters:
-        energies (TYPE): Description
-        fci_energy (None, optional): Description
-        threshold (float, optional): Description
-        window (int, optional): Description
-        - energies: list or np.array of energy values over epochs
-        - fci_energy: (optional) known reference energy for comparison
-        - threshold: energy delta threshold for chemical accuracy (default: 1e-3)
-        - window: number of consecutive epochs required to confirm stabilization
-    """
-    chem_epoch = find_sustained_chemical_accuracy(energies, threshold, window)
-
-    # Plot the main energy curve
-    plt.figure(figsize=(8, 5))
-    plt.plot(energies, label="Energy ⟨H⟩", color='royalblue')
-
-    # Plot the FCI benchmark line, if provided
-    if fci_energy is not None:
-        plt.axhline(fci_energy, color='gray', linestyle='--', label='FCI Energy')
-        plt.text(len(energies) - 50, fci_energy + 0.01,
-                 f"FCI = {fci_energy:.6f} Ha", color='gray', fontsize=9)
-
-    # Chemical accuracy marker
-    if chem_epoch is not None:
-        stable_energies = energies[chem_epoch:]
-        min_energy = min(stable_energies)
-        max_energy = max(stable_energies)
-
-        # Shaded stabilization band
-        plt.axhspan(min_energy, max_energy,
-                    xmin=chem_epoch / len(energies), xmax=1.0,
-                    color='orange', alpha=0.2,
-                    label=f"Stabilization band (ΔE < {threshold:.0e})")
-
-        # Vertical line and annotation
-        plt.axvline(chem_epoch, color='purple', linestyle='--',
-                    label='Chemical accuracy reached')
-        print("_------------------>")
-        print(chem_epoch)
-        plt.text(chem_epoch + 10, energies[chem_epoch] + 0.01,
-                 f"ΔE < {threshold:.0e} at epoch {chem_epoch}",
-                 color='purple', fontsize=9)
-    else:
-        print("⚠️ Chemical accuracy not reached in this simulation.")
-
-    # Formatting
-    plt.title("RBM H2 Energy Convergence with Stochastic Reconfiguration")
-    plt.xlabel("Epoch")
-    plt.ylabel("Energy (Ha)")
-    plt.legend()
-    plt.grid()
-    plt.tight_layout()
-    plt.show()
-
-# energies = [...]  # sua lista de energias
-fci_energy = -1.722802  # ou None, se não tiver
-
-plot_energy_convergence(energies, fci_energy=fci_energy)
\ No newline at end of file
+# Log do treino; as figuras (Agg) saem de outro processo, sem bloquear aqui
+log = save_training_log("logs/main_2_h2_sr.npz", energies, e_fci=fci_energy, threshold=threshold, window=window,
+                        title="RBM H2 Energy Convergence with Stochastic Reconfiguration")
+render_in_background(log)
@@ -17,56 +17,41 @@
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from rbm_3 import RBM, generate_configurations, train_rbm_sr
-from openfermion import FermionOperator, jordan_wigner
+from rbm_3 import RBM, train_rbm_sr
+from hamiltonian_cache import cached_qubit_hamiltonian
+from integral_store import IntegralStore
+from reporting import save_training_log, render_in_background
+from symmetry import spin_orbital_integrals, load_orbsym, SymmetrySector
+from exact_diag import symmetry_ground_state
 
 # --- Carrega integrais do LiH ---
-data = np.load("lih_integrals.npz")
-h1 = data["h1"]
-eri = data["eri"]
-n_orb = int(data["n_orb"])
-nelec = int(data["nelec"])
+store = IntegralStore("lih_integrals.npz")
+h1 = store.h1
+eri = store.full_eri()
+n_orb = store.n_orb
+nelec = store.nelec
+n_sites = 2 * n_orb  # spin-orbitais (α, β intercalados)
 
-# --- Hamiltoniano em segunda quantização ---
-H = FermionOperator()
-for p in range(n_orb):
-    for q in range(n_orb):
-        coef = h1[p, q]
-        if abs(coef) > 1e-12:
-            H += FermionOperator(f"{p}^ {q}", coef)
-for p in range(n_orb):
-    for q in range(n_orb):
-        for r in range(n_orb):
-            for s in range(n_orb):
-                coef = 0.5 * eri[p, q, r, s]
-                if abs(coef) > 1e-12:
-                    H += FermionOperator(f"{p}^ {q}^ {s} {r}", coef)
-theta = jordan_wigner(H)
+# --- Hamiltoniano em segunda quantização (Jordan–Wigner) ---
+h1_so, eri_so = spin_orbital_integrals(h1, eri)
+theta = cached_qubit_hamiltonian(h1_so, eri_so, n_qubits=n_sites, nelec=nelec)
 
-# --- Gera configurações ---
-configs = generate_configurations(n_sites=n_orb, n_electrons=nelec)
+# --- Setor S_z = 0 no irrep da referência (irreps do arquivo ou deduzidos das integrais) ---
+configs = SymmetrySector(n_orb, nelec // 2, nelec - nelec // 2, orbsym=load_orbsym("lih_integrals.npz"))
+print(f"Determinantes no setor: {len(configs)}")
 
 # --- Inicializa RBM ---
-rbm = RBM(n_visible=n_orb, n_hidden=n_orb)
+rbm = RBM(n_visible=n_sites, n_hidden=n_sites)
 np.random.seed(42)
-rbm.a = np.random.normal(0, 0.01, size=n_orb)
-rbm.b = np.random.normal(0, 0.01, size=n_orb)
-rbm.W = np.random.normal(0, 0.01, size=(n_orb, n_orb))
+rbm.a = np.random.normal(0, 0.01, size=n_sites)
+rbm.b = np.random.normal(0, 0.01, size=n_sites)
+rbm.W = np.random.normal(0, 0.01, size=(n_sites, n_sites))
 
 # --- Treinamento com SR ---
 energias = train_rbm_sr(rbm, configs, theta, epochs=50, lr=0.001)
 
-fci_energy=-8.509289
-# --- Gráfico ---
-plt.plot(energias, label="Energy ⟨H⟩")
-plt.axhline(fci_energy, linestyle="--", color="gray", label="FCI energy")
-plt.text(len(energias) - 50, fci_energy + 0.01,
-                 f"FCI = {fci_energy:.6f} Ha", color='gray', fontsize=9)
-plt.xlabel("Epoch")
-plt.ylabel("Energy (Ha)")
-plt.title("RBM LiH energy relaxation with Stochastic Reconfiguration")
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
\ No newline at end of file
+fci_energy = symmetry_ground_state(theta, configs)[0][0]
+# --- Log e gráficos (renderizados por reporting.py em outro processo) ---
+log = save_training_log("logs/main_3_lih.npz", energias, e_fci=fci_energy, e_nuc=store.e_nuc,
+                        title="RBM LiH energy relaxation with Stochastic Reconfiguration")
+render_in_background(log)
@@ -0,0 +1,358 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import numpy as np
+
+# ----------------- Passo de aprendizado -----------------
+class Schedule:
+
+    """Passo de aprendizado constante; base dos demais cronogramas.
+
+    ``schedule(epoch)`` devolve o passo da época. ``observe`` recebe a
+    energia ao fim de cada época (só o PlateauSchedule usa).
+
+    Attributes:
+        lr (float): Passo inicial.
+    """
+
+    def __init__(self, lr):
+        """Summary
+        """
+        self.lr = float(lr)
+
+    def __call__(self, epoch):
+        return self.lr
+
+    def observe(self, value):
+        """Energia (ou outra métrica a minimizar) da época que terminou.
+        """
+
+    def state(self):
+        """Estado serializável em JSON (para checkpoints).
+        """
+        return {}
+
+    def load_state(self, state):
+        """Inverso de ``state``.
+        """
+
+    @classmethod
+    def coerce(cls, schedule, lr, epochs=None):
+        """Aceita um Schedule, um nome de SCHEDULES ou None (passo constante).
+        """
+        if schedule is None:
+            return cls(lr)
+        if isinstance(schedule, Schedule):
+            return schedule
+        if schedule not in SCHEDULES:
+            raise ValueError(f"Cronograma '{schedule}' desconhecido (opções: {sorted(SCHEDULES)})")
+        if schedule == "cosine":
+            if epochs is None:
+                raise ValueError("O cronograma 'cosine' precisa do número de épocas")
+            return CosineSchedule(lr, epochs)
+        return SCHEDULES[schedule](lr)
+
+
+class StepDecay(Schedule):
+
+    """lr · γ^⌊época / intervalo⌋ (decaimento em escada).
+    """
+
+    def __init__(self, lr, gamma=0.9, interval=2):
+        """Summary
+        """
+        super().__init__(lr)
+        self.gamma = gamma
+        self.interval = int(interval)
+
+    def __call__(self, epoch):
+        return self.lr * (self.gamma ** (epoch // self.interval))
+
+
+class ExponentialDecay(Schedule):
+
+    """lr · γ^época.
+    """
+
+    def __init__(self, lr, gamma=0.98):
+        """Summary
+        """
+        super().__init__(lr)
+        self.gamma = gamma
+
+    def __call__(self, epoch):
+        return self.lr * self.gamma ** epoch
+
+
+class CosineSchedule(Schedule):
+
+    """Aquecimento linear por ``warmup`` épocas e decaimento em cosseno até ``lr_min``.
+    """
+
+    def __init__(self, lr, epochs, lr_min=0.0, warmup=0):
+        """Summary
+        """
+        super().__init__(lr)
+        self.epochs = int(epochs)
+        self.lr_min = lr_min
+        self.warmup = int(warmup)
+
+    def __call__(self, epoch):
+        if epoch < self.warmup:
+            return self.lr * (epoch + 1) / self.warmup
+        span = max(1, self.epochs - self.warmup)
+        progress = min(1.0, (epoch - self.warmup) / span)
+        return self.lr_min + 0.5 * (self.lr - self.lr_min) * (1 + np.cos(np.pi * progress))
+
+
+class PlateauSchedule(Schedule):
+
+    """Multiplica o passo por ``factor`` quando a energia para de cair.
+
+    Se por ``patience`` épocas seguidas a energia não ficar ``threshold``
+    abaixo da melhor já vista, o passo é reduzido (até ``min_lr``).
+    """
+
+    def __init__(self, lr, factor=0.5, patience=10, threshold=1e-4, min_lr=0.0):
+        """Summary
+        """
+        super().__init__(lr)
+        self.factor = factor
+        self.patience = int(patience)
+        self.threshold = threshold
+        self.min_lr = min_lr
+        self.current = self.lr
+        self.best = np.inf
+        self.wait = 0
+
+    def __call__(self, epoch):
+        return self.current
+
+    def observe(self, value):
+        if value < self.best - self.threshold:
+            self.best = value
+            self.wait = 0
+            return
+        self.wait += 1
+        if self.wait >= self.patience:
+            self.current = max(self.min_lr, self.current * self.factor)
+            self.wait = 0
+
+    def state(self):
+        return {"current": self.current, "best": None if np.isinf(self.best) else float(self.best),
+                "wait": self.wait}
+
+    def load_state(self, state):
+        self.current = state["current"]
+        self.best = np.inf if state["best"] is None else state["best"]
+        self.wait = state["wait"]
+
+
+SCHEDULES = {"constant": Schedule, "step": StepDecay, "exponential": ExponentialDecay,
+             "cosine": CosineSchedule, "plateau": PlateauSchedule}
+
+
+# ----------------- Otimizadores -----------------
+class Optimizer:
+
+    """Atualiza in-place um vetor de parâmetros a partir do gradiente.
+
+    ``step(params, grad, epoch)`` modifica ``params`` sem cópias (use o
+    vetor de ``rbm.parameter_vector()``, do qual a, b e W são views). O
+    ``grad`` pode ser o gradiente da energia ou a direção SR S⁻¹g. Os
+    buffers de estado (momentos) são criados no primeiro passo.
+
+    Attributes:
+        schedule (Schedule): Cronograma do passo de aprendizado.
+        lr (float): Passo usado no último ``step``.
+        t (int): Número de passos dados.
+        last_update_norm (float): Norma da última atualização.
+    """
+
+    buffers = ()
+
+    def __init__(self, lr=0.01, schedule=None, epochs=None):
+        """Summary
+
+        Args:
+            lr (float, optional): Passo de aprendizado (inicial, se há cronograma).
+            schedule (Schedule or str, optional): Cronograma (padrão: constante).
+            epochs (int, optional): Número de épocas (para o cronograma 'cosine').
+        """
+        self.schedule = Schedule.coerce(schedule, lr, epochs)
+        self.lr = self.schedule(0)
+        self.t = 0
+        self.last_update_norm = 0.0
+        for name in self.buffers:
+            setattr(self, name, None)
+
+    def step(self, params, grad, epoch=None):
+        """Um passo de descida em ``params`` (in-place).
+        """
+        self.lr = self.schedule(self.t if epoch is None else epoch)
+        self.t += 1
+        for name in self.buffers:
+            if getattr(self, name) is None:
+                setattr(self, name, np.zeros_like(params))
+        update = self._update(np.asarray(grad))
+        params -= update
+        self.last_update_norm = float(np.linalg.norm(update))
+        return params
+
+    def _update(self, grad):
+        """Vetor subtraído dos parâmetros neste passo.
+        """
+        return self.lr * grad
+
+    def observe(self, value):
+        """Repassa a energia da época ao cronograma.
+        """
+        self.schedule.observe(value)
+
+    def state(self):
+        """(meta, arrays) para o checkpoint.
+        """
+        meta = {"name": type(self).__name__, "t": self.t, "lr": self.lr, "schedule": self.schedule.state(),
+                "buffers": [name for name in self.buffers if getattr(self, name) is not None]}
+        return meta, {name: getattr(self, name) for name in meta["buffers"]}
+
+    def load_state(self, meta, arrays):
+        """Inverso de ``state``.
+        """
+        if meta["name"] != type(self).__name__:
+            raise ValueError(f"Estado de otimizador {meta['name']} não serve para {type(self).__name__}")
+        self.t = meta["t"]
+        self.lr = meta["lr"]
+        self.schedule.load_state(meta["schedule"])
+        for name in meta["buffers"]:
+            setattr(self, name, arrays[name].copy())
+
+    @classmethod
+    def coerce(cls, optimizer, lr, epochs=None):
+        """Aceita um Optimizer, um nome de OPTIMIZERS ou None (SGD com passo ``lr``).
+        """
+        if optimizer is None:
+            return SGD(lr)
+        if isinstance(optimizer, Optimizer):
+            return optimizer
+        if optimizer not in OPTIMIZERS:
+            raise ValueError(f"Otimizador '{optimizer}' desconhecido (opções: {sorted(OPTIMIZERS)})")
+        return OPTIMIZERS[optimizer](lr, epochs=epochs)
+
+
+class SGD(Optimizer):
+
+    """Descida de gradiente, com momento (opcionalmente de Nesterov).
+
+    v ← μ v + g;  θ ← θ − lr · v   (Nesterov: θ ← θ − lr · (g + μ v)).
+    Com μ = 0 é exatamente θ ← θ − lr · g.
+    """
+
+    def __init__(self, lr=0.01, momentum=0.0, nesterov=False, schedule=None, epochs=None):
+        """Summary
+        """
+        self.momentum = momentum
+        self.nesterov = nesterov
+        self.buffers = ("velocity",) if momentum else ()
+        super().__init__(lr, schedule, epochs)
+
+    def _update(self, grad):
+        if not self.momentum:
+            return self.lr * grad
+        self.velocity *= self.momentum
+        self.velocity += grad
+        if self.nesterov:
+            return self.lr * (grad + self.momentum * self.velocity)
+        return self.lr * self.velocity
+
+
+class RMSProp(Optimizer):
+
+    """s ← ρ s + (1 − ρ) g²;  θ ← θ − lr · g / (√s + ε).
+    """
+
+    buffers = ("square_avg",)
+
+    def __init__(self, lr=0.01, decay=0.9, eps=1e-8, schedule=None, epochs=None):
+        """Summary
+        """
+        self.decay = decay
+        self.eps = eps
+        super().__init__(lr, schedule, epochs)
+
+    def _update(self, grad):
+        self.square_avg *= self.decay
+        self.square_avg += (1 - self.decay) * np.abs(grad) ** 2
+        return self.lr * grad / (np.sqrt(self.square_avg) + self.eps)
+
+
+class Adam(Optimizer):
+
+    """Adam com correção de viés; ``amsgrad=True`` usa o máximo de v.
+
+    m ← β₁ m + (1 − β₁) g,  v ← β₂ v + (1 − β₂) g²,
+    θ ← θ − lr · m̂ / (√v̂ + ε),  m̂ = m / (1 − β₁ᵗ),  v̂ = v / (1 − β₂ᵗ).
+    """
+
+    def __init__(self, lr=0.01, beta1=0.9, beta2=0.999, eps=1e-8, amsgrad=False, schedule=None, epochs=None):
+        """Summary
+        """
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.eps = eps
+        self.amsgrad = amsgrad
+        self.buffers = ("m", "v", "v_max") if amsgrad else ("m", "v")
+        super().__init__(lr, schedule, epochs)
+
+    def _update(self, grad):
+        self.m *= self.beta1
+        self.m += (1 - self.beta1) * grad
+        self.v *= self.beta2
+        self.v += (1 - self.beta2) * np.abs(grad) ** 2
+        v = self.v
+        if self.amsgrad:
+            np.maximum(self.v_max, self.v, out=self.v_max)
+            v = self.v_max
+        m_hat = self.m / (1 - self.beta1 ** self.t)
+        v_hat = v / (1 - self.beta2 ** self.t)
+        return self.lr * m_hat / (np.sqrt(v_hat) + self.eps)
+
+
+class AMSGrad(Adam):
+
+    """Adam com ``amsgrad=True``.
+    """
+
+    def __init__(self, lr=0.01, beta1=0.9, beta2=0.999, eps=1e-8, schedule=None, epochs=None):
+        """Summary
+        """
+        super().__init__(lr, beta1, beta2, eps, True, schedule, epochs)
+
+
+class Momentum(SGD):
+
+    """SGD com momento μ = 0.9.
+    """
+
+    def __init__(self, lr=0.01, momentum=0.9, nesterov=False, schedule=None, epochs=None):
+        """Summary
+        """
+        super().__init__(lr, momentum, nesterov, schedule, epochs)
+
+
+OPTIMIZERS = {"sgd": SGD, "momentum": Momentum, "rmsprop": RMSProp, "adam": Adam, "amsgrad": AMSGrad}
@@ -0,0 +1,300 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import os
+import numpy as np
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from estimators import local_energies, sampled_local_energies, connected_indices
+from config_index import ConfigIndex, Sector, as_codes
+
+# ----------------- Memória compartilhada -----------------
+def _share(arrays):
+    """Copia arrays para blocos de memória compartilhada.
+
+    Returns:
+        tuple: (blocos, specs, views) — ``specs`` mapeia nome → (nome do bloco,
+        shape, dtype) e é o que vai para os workers (poucos bytes, em vez dos
+        dados); ``views`` são os arrays compartilhados vistos pelo processo atual.
+    """
+    blocks, specs, views = [], {}, {}
+    for key, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+        views[key] = np.ndarray(array.shape, array.dtype, buffer=shm.buf)
+        views[key][...] = array
+        blocks.append(shm)
+        specs[key] = (shm.name, array.shape, array.dtype.str)
+    return blocks, specs, views
+
+
+def _attach(specs):
+    """Abre, no worker, os blocos descritos por ``specs`` como arrays (sem cópia).
+    """
+    blocks, arrays = [], {}
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        blocks.append(shm)
+        arrays[key] = np.ndarray(shape, np.dtype(dtype), buffer=shm.buf)
+    return blocks, arrays
+
+
+def _split_object(obj):
+    """Separa os atributos de ``obj`` em arrays (memória compartilhada) e o resto (pickle).
+    """
+    arrays = {k: v for k, v in vars(obj).items() if isinstance(v, np.ndarray)}
+    others = {k: v for k, v in vars(obj).items() if not isinstance(v, np.ndarray)}
+    return type(obj), arrays, others
+
+
+def _rebuild_object(cls, arrays, others):
+    """Recria o objeto no worker com os arrays apontando para a memória compartilhada.
+    """
+    obj = cls.__new__(cls)
+    obj.__dict__.update(others)
+    obj.__dict__.update(arrays)
+    return obj
+
+
+def _rbm_view(cls, n_visible, n_hidden, params):
+    """RBM cujos a, b e W são views do vetor de parâmetros compartilhado.
+    """
+    rbm = cls.__new__(cls)
+    rbm.n_visible, rbm.n_hidden = n_visible, n_hidden
+    rbm.a = params[:n_visible]
+    rbm.b = params[n_visible:n_visible + n_hidden]
+    rbm.W = params[n_visible + n_hidden:].reshape(n_visible, n_hidden)
+    return rbm
+
+
+# ----------------- Worker -----------------
+def _worker(conn, setup):
+    """Laço de um worker: mantém seu fragmento de O entre comandos.
+
+    Cada worker é dono de um intervalo fixo de linhas (``rows``), então a
+    redução no processo principal é sempre feita na mesma ordem.
+    """
+    blocks, shared = _attach(setup["specs"])
+    H = _rebuild_object(setup["H_cls"], {k[2:]: v for k, v in shared.items() if k.startswith("H.")},
+                        setup["H_others"])
+    rbm = _rbm_view(setup["rbm_cls"], setup["n_visible"], setup["n_hidden"], shared["params"])
+    lo, hi = setup["rows"]
+    weights = O = None
+    try:
+        while True:
+            command, payload = conn.recv()
+            if command == "close":
+                break
+            if command == "log_psi":
+                shared["log_psi"][lo:hi] = rbm.log_psi_batch(shared["configs"][lo:hi]).real
+                conn.send(None)
+            elif command == "moments":
+                if payload["exact"]:
+                    log_psi = shared["log_psi"]
+                    E_loc = local_energies(log_psi[lo:hi], log_psi[shared["j"][lo:hi]], shared["mels"][lo:hi],
+                                           H.constant).real
+                    weights = np.exp(2 * log_psi[lo:hi] - payload["shift"])
+                    batch = shared["configs"][lo:hi]
+                else:
+                    s_lo, s_hi = payload["rows"]
+                    batch = shared["samples"][s_lo:s_hi]
+                    E_loc = sampled_local_energies(rbm, H, batch).real if len(batch) else np.zeros(0)
+                    weights = np.ones(len(batch))
+                O = rbm.log_derivatives_batch(batch) if len(batch) else np.zeros((0, len(shared["params"])))
+                wE = weights * E_loc
+                conn.send((weights.sum(), wE.sum(), (wE * E_loc).sum(), weights @ O, wE @ np.conj(O)))
+            elif command == "matvec":
+                centered = O - payload["O_mean"]
+                conn.send(np.conj(centered.T) @ (weights * (centered @ payload["v"])))
+            elif command == "s_matrix":
+                centered = O - payload["O_mean"]
+                conn.send(np.conj(centered.T) @ (weights[:, None] * centered))
+    finally:
+        for shm in blocks:
+            shm.close()
+        conn.close()
+
+
+# ----------------- Estimador paralelo -----------------
+class ParallelEstimator:
+
+    """Energia, gradiente e produtos S·v da RBM distribuídos entre processos.
+
+    Os workers são persistentes e cada um fica com um intervalo fixo de
+    configurações (enumeração exata) ou de amostras. O Hamiltoniano, as
+    configurações, as tabelas de conexão e o vetor de parâmetros [a, b, W]
+    ficam em ``multiprocessing.shared_memory``: a cada época só o vetor de
+    parâmetros é copiado (no próprio processo principal), e pelos pipes
+    passam apenas comandos e somas parciais.
+
+    As somas parciais Σw, Σw·E, Σw·E², Σw·O e Σw·E·O* (e Σw·Ō*(Ō·v) no SR)
+    são reduzidas sempre na ordem dos workers, então o resultado não
+    depende de qual processo termina primeiro.
+
+    Attributes:
+        n_workers (int): Número de processos.
+        exact (bool): True para soma exata sobre ``configs``.
+        n_params (int): Número de parâmetros da RBM.
+    """
+
+    def __init__(self, rbm, H, configs=None, n_workers=None, max_samples=10000, start_method=None):
+        """Summary
+
+        Args:
+            rbm (RBM): Modelo com ``a``, ``b``, ``W`` e os métodos de BatchRBMMixin.
+            H (CompiledPauliHamiltonian or SlaterCondonHamiltonian): Hamiltoniano.
+            configs (np.ndarray, optional): Configurações da soma exata (ocupações ou
+                códigos uint64); None para amostras.
+            n_workers (int, optional): Processos (padrão: número de CPUs).
+            max_samples (int, optional): Capacidade do buffer de amostras.
+            start_method (str, optional): 'fork', 'spawn' ou 'forkserver'.
+        """
+        from pauli_hamiltonian import CompiledPauliHamiltonian
+
+        H = CompiledPauliHamiltonian.coerce(H, rbm.n_visible)
+        if getattr(rbm, "parity", None) is not None:
+            raise ValueError("ParallelEstimator não suporta a RBM projetada por spin-flip (log Ψ complexo)")
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.exact = configs is not None
+        self.n_params = rbm.n_params
+        self.n_visible = rbm.n_visible
+        self._closed = False
+
+        H_cls, H_arrays, H_others = _split_object(H)
+        arrays = {f"H.{k}": v for k, v in H_arrays.items()}
+        arrays["params"] = self._flatten(rbm)
+        if self.exact:
+            # configurações e amostras ficam empacotadas (1 bit por sítio)
+            if isinstance(configs, Sector):
+                # os workers indexam por linha: o setor é materializado uma vez
+                configs = configs.codes()
+            configs = as_codes(configs)
+            j, mels = connected_indices(H, ConfigIndex.from_codes(configs, rbm.n_visible))
+            arrays.update(configs=configs, j=j, mels=mels, log_psi=np.zeros(len(configs)))
+            n_rows = len(configs)
+        else:
+            arrays["samples"] = np.zeros(max_samples, dtype=np.uint64)
+            n_rows = max_samples
+        self.max_samples = max_samples
+        self._blocks, specs, self._shared = _share(arrays)
+
+        self.n_workers = max(1, min(self.n_workers, n_rows))
+        bounds = np.linspace(0, n_rows, self.n_workers + 1).astype(int)
+        self._bounds = bounds
+        context = mp.get_context(start_method)
+        self._pipes, self._processes = [], []
+        for w in range(self.n_workers):
+            parent, child = context.Pipe()
+            setup = dict(specs=specs, H_cls=H_cls, H_others=H_others, rbm_cls=type(rbm),
+                         n_visible=rbm.n_visible, n_hidden=rbm.n_hidden, rows=(bounds[w], bounds[w + 1]))
+            process = context.Process(target=_worker, args=(child, setup), daemon=True)
+            process.start()
+            child.close()
+            self._pipes.append(parent)
+            self._processes.append(process)
+        self._O_mean = None
+
+    @staticmethod
+    def _flatten(rbm):
+        """Vetor [a, b, W.flatten()] (a ordem de BatchRBMMixin).
+        """
+        return np.concatenate([rbm.a, rbm.b, np.ravel(rbm.W)]).astype(float)
+
+    def _broadcast(self, command, payloads=None):
+        """Envia um comando a todos os workers e recolhe as respostas na ordem dos workers.
+        """
+        for w, pipe in enumerate(self._pipes):
+            pipe.send((command, payloads[w] if isinstance(payloads, list) else payloads))
+        return [pipe.recv() for pipe in self._pipes]
+
+    def gradient(self, rbm, samples=None):
+        """Estatísticas da época com os parâmetros atuais de ``rbm``.
+
+        Args:
+            rbm (RBM): Modelo (os parâmetros são copiados para a memória compartilhada).
+            samples (np.ndarray, optional): Amostras de |Ψ|² (modo amostrado), ocupações
+                ou códigos uint64.
+
+        Returns:
+            tuple: (grad, E_mean, E_var, O_mean), como energy_gradient/energy_statistics.
+        """
+        self._shared["params"][:] = self._flatten(rbm)
+        if self.exact:
+            self._broadcast("log_psi")
+            shift = 2 * np.max(self._shared["log_psi"])
+            partials = self._broadcast("moments", {"exact": True, "shift": shift})
+        else:
+            samples = as_codes(samples)
+            if len(samples) > self.max_samples:
+                raise ValueError(f"{len(samples)} amostras excedem max_samples = {self.max_samples}")
+            self._shared["samples"][:len(samples)] = samples
+            bounds = np.linspace(0, len(samples), self.n_workers + 1).astype(int)
+            payloads = [{"exact": False, "rows": (bounds[w], bounds[w + 1])} for w in range(self.n_workers)]
+            partials = self._broadcast("moments", payloads)
+
+        W_sum, WE, WE2, WO, WEO = (sum(values) for values in zip(*partials))
+        E_mean = WE / W_sum
+        E_var = WE2 / W_sum - E_mean ** 2
+        O_mean = WO / W_sum
+        grad = np.real(WEO / W_sum - E_mean * np.conj(O_mean))
+        self._W_sum, self._O_mean = W_sum, O_mean
+        return grad, float(E_mean), float(E_var), O_mean
+
+    def s_matvec(self, v):
+        """S·v = Σ p (O − Ō)* ((O − Ō)·v) com as derivadas da última chamada a ``gradient``.
+        """
+        partials = self._broadcast("matvec", {"v": v, "O_mean": self._O_mean})
+        return sum(partials) / self._W_sum
+
+    def s_matrix(self):
+        """S completa (n_params × n_params), reduzida dos fragmentos dos workers.
+        """
+        partials = self._broadcast("s_matrix", {"O_mean": self._O_mean})
+        return sum(partials) / self._W_sum
+
+    def close(self):
+        """Encerra os workers e libera a memória compartilhada.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for pipe in self._pipes:
+            try:
+                pipe.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._shared = None
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
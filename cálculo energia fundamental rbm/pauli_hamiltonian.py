@@ -0,0 +1,283 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import os
+import numpy as np
+import profiling
+
+# ----------------- Contagem de bits -----------------
+_BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(x):
+    """Número de bits 1 de cada inteiro uint64 (vetorizado).
+    """
+    x = np.asarray(x, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(x).astype(np.int64)
+    as_bytes = x[..., None].view(np.uint8)
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=-1, dtype=np.int64)
+
+
+def parity(x):
+    """Paridade (0 ou 1) do número de bits 1 de cada inteiro uint64.
+    """
+    return popcount(x) & 1
+
+
+# ----------------- Hamiltoniano de Pauli compilado -----------------
+class CompiledPauliHamiltonian:
+
+    """Hamiltoniano qubit (soma de strings de Pauli) em forma de tabelas de bits.
+
+    Cada termo c·P é guardado como P = i^{n_Y} X^{flip} Z^{phase}, de modo que
+
+        P |s⟩ = i^{n_Y} (−1)^{popcount(s & phase)} |s ^ flip⟩,
+
+    reproduzindo a convenção dos loops originais (Z → (−1)^s,
+    Y → +i se s = 0 e −i se s = 1). O fator i^{n_Y} já vem embutido em
+    ``coeffs``. Os termos são ordenados e agrupados pela máscara de flip,
+    então todos os termos que levam σ à mesma σ' são somados antes de
+    qualquer avaliação de ψ.
+
+    Attributes:
+        n_qubits (int): Número de qubits (sítios).
+        constant (complex): Coeficiente do termo identidade.
+        flip_masks (np.ndarray): Máscara uint64 das posições X/Y de cada termo.
+        phase_masks (np.ndarray): Máscara uint64 das posições Z/Y de cada termo.
+        coeffs (np.ndarray): Coeficientes complexos (com i^{n_Y}) de cada termo.
+        group_masks (np.ndarray): Máscaras de flip distintas (uma por grupo).
+        group_starts (np.ndarray): Primeiro termo de cada grupo em ``coeffs``.
+    """
+
+    def __init__(self, n_qubits, flip_masks, phase_masks, coeffs, constant=0.0):
+        """Summary
+        """
+        if n_qubits > 64:
+            raise ValueError(f"CompiledPauliHamiltonian suporta até 64 qubits (recebeu {n_qubits})")
+        flip_masks = np.asarray(flip_masks, dtype=np.uint64)
+        phase_masks = np.asarray(phase_masks, dtype=np.uint64)
+        coeffs = np.asarray(coeffs, dtype=complex)
+
+        order = np.lexsort((phase_masks, flip_masks))
+        self.n_qubits = int(n_qubits)
+        self.constant = complex(constant)
+        self.flip_masks = flip_masks[order]
+        self.phase_masks = phase_masks[order]
+        self.coeffs = coeffs[order]
+
+        if len(self.flip_masks):
+            new_group = np.r_[True, self.flip_masks[1:] != self.flip_masks[:-1]]
+        else:
+            new_group = np.zeros(0, dtype=bool)
+        self.group_starts = np.flatnonzero(new_group)
+        self.group_masks = self.flip_masks[self.group_starts]
+        self.group_sizes = np.diff(np.r_[self.group_starts, len(self.coeffs)])
+        self.group_weights = popcount(self.group_masks)
+
+    @classmethod
+    def from_qubit_operator(cls, H_jw, n_qubits=None, tol=0.0):
+        """Compila um ``QubitOperator`` do OpenFermion (ou qualquer objeto com ``.terms``).
+
+        Args:
+            H_jw (QubitOperator): Hamiltoniano após Jordan–Wigner.
+            n_qubits (int, optional): Número de qubits; por padrão o maior índice + 1.
+            tol (float, optional): Termos com |coef| <= tol são descartados.
+
+        Returns:
+            CompiledPauliHamiltonian: Hamiltoniano compilado.
+        """
+        constant = 0.0
+        flips, phases, coeffs = [], [], []
+        max_qubit = -1
+        for term, coeff in H_jw.terms.items():
+            if term == ():
+                constant += coeff
+                continue
+            if abs(coeff) <= tol:
+                continue
+            flip = phase = 0
+            n_y = 0
+            for qubit, op in term:
+                max_qubit = max(max_qubit, qubit)
+                if op in ('X', 'Y'):
+                    flip |= 1 << qubit
+                if op in ('Z', 'Y'):
+                    phase |= 1 << qubit
+                if op == 'Y':
+                    n_y += 1
+            flips.append(flip)
+            phases.append(phase)
+            coeffs.append(coeff * 1j ** n_y)
+
+        if n_qubits is None:
+            n_qubits = max_qubit + 1
+        elif max_qubit >= n_qubits:
+            raise ValueError(f"O operador atua no qubit {max_qubit}, mas n_qubits = {n_qubits}")
+        return cls(n_qubits, flips, phases, coeffs, constant)
+
+    @classmethod
+    def coerce(cls, H, n_qubits=None):
+        """Devolve ``H`` se já compilado; caso contrário compila o ``QubitOperator``.
+
+        Outros backends com a mesma interface (``apply``/``connections``,
+        ex.: SlaterCondonHamiltonian) são devolvidos sem conversão.
+        """
+        if isinstance(H, cls) or (hasattr(H, "apply") and hasattr(H, "connections")):
+            return H
+        return cls.from_qubit_operator(H, n_qubits)
+
+    def save(self, path):
+        """Grava as tabelas de bits em ``.npz`` (sem compressão, carga imediata).
+
+        A escrita vai para um arquivo temporário renomeado no fim, então um
+        leitor concorrente nunca vê um arquivo pela metade.
+        """
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, n_qubits=self.n_qubits, constant=self.constant,
+                     flip_masks=self.flip_masks, phase_masks=self.phase_masks, coeffs=self.coeffs)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Lê um Hamiltoniano gravado com ``save``.
+        """
+        with np.load(path) as data:
+            return cls(int(data["n_qubits"]), data["flip_masks"], data["phase_masks"],
+                       data["coeffs"], complex(data["constant"]))
+
+    def to_qubit_operator(self):
+        """Converte de volta para ``QubitOperator`` do OpenFermion (para impressão/validação).
+        """
+        from openfermion import QubitOperator
+
+        H = QubitOperator((), self.constant)
+        for flip, phase, coeff in zip(self.flip_masks, self.phase_masks, self.coeffs):
+            flip, phase = int(flip), int(phase)
+            term = []
+            n_y = 0
+            for qubit in range(self.n_qubits):
+                x, z = (flip >> qubit) & 1, (phase >> qubit) & 1
+                if x and z:
+                    term.append((qubit, 'Y'))
+                    n_y += 1
+                elif x:
+                    term.append((qubit, 'X'))
+                elif z:
+                    term.append((qubit, 'Z'))
+            H += QubitOperator(tuple(term), coeff * (-1j) ** n_y)
+        return H
+
+    @property
+    def n_terms(self):
+        """Número de termos não constantes.
+        """
+        return len(self.coeffs)
+
+    @property
+    def n_groups(self):
+        """Número de máscaras de flip distintas (configurações conectadas por σ).
+        """
+        return len(self.group_masks)
+
+    def apply(self, codes, chunk_size=4096):
+        """Aplica H (sem o termo constante) a um lote de configurações empacotadas.
+
+        Args:
+            codes (np.ndarray): Códigos uint64 com shape (N,).
+            chunk_size (int, optional): Linhas processadas por vez (limita memória N×T).
+
+        Returns:
+            tuple: (conn, mels) com shape (N, n_groups) — ``conn[i, g]`` é a
+            configuração conectada σ ^ flip_g e ``mels[i, g]`` o elemento de
+            matriz somado sobre todos os termos do grupo g.
+        """
+        codes = np.asarray(codes, dtype=np.uint64).reshape(-1)
+        conn = codes[:, None] ^ self.group_masks[None, :]
+        mels = np.zeros(conn.shape, dtype=complex)
+        profiling.count("pauli_terms_applied", len(codes) * self.n_terms)
+        if self.n_terms == 0:
+            return conn, mels
+        for start in range(0, len(codes), chunk_size):
+            block = codes[start:start + chunk_size]
+            signs = 1 - 2 * parity(block[:, None] & self.phase_masks[None, :])
+            mels[start:start + chunk_size] = np.add.reduceat(signs * self.coeffs[None, :], self.group_starts, axis=1)
+        return conn, mels
+
+    def connections(self, codes, tol=1e-14, chunk_size=4096, particle_conserving=False):
+        """Lista esparsa (COO) de H|σ⟩ sem o termo constante.
+
+        Grupos cujo elemento somado se anula (tipicamente os que saem do
+        setor de número de partículas) são descartados.
+
+        Com ``particle_conserving=True`` só são avaliados os grupos que
+        mantêm σ no mesmo setor (metade dos bits do flip ocupados em σ), e
+        apenas os termos desses grupos. É exato sempre que as conexões
+        serão projetadas num setor de N fixo, e evita avaliar a maioria
+        dos termos para cada σ.
+
+        Returns:
+            tuple: (rows, conn, mels) — linha de origem, configuração
+            conectada e elemento de matriz de cada conexão não nula.
+        """
+        if not particle_conserving:
+            conn, mels = self.apply(codes, chunk_size)
+            keep = np.abs(mels) > tol
+            rows = np.nonzero(keep)[0]
+            profiling.count("connections_generated", len(rows))
+            profiling.count("connections_discarded", keep.size - len(rows))
+            return rows, conn[keep], mels[keep]
+
+        codes = np.asarray(codes, dtype=np.uint64).reshape(-1)
+        all_rows, all_conn, all_mels = [], [], []
+        for start in range(0, len(codes), chunk_size):
+            block = codes[start:start + chunk_size]
+            occupied = popcount(block[:, None] & self.group_masks[None, :])
+            rows, groups = np.nonzero(2 * occupied == self.group_weights[None, :])
+            profiling.count("out_of_sector_skipped", occupied.size - len(rows))
+            if len(rows) == 0:
+                continue
+            # expande cada par (σ, grupo) nos termos contíguos do grupo
+            sizes = self.group_sizes[groups]
+            offsets = np.cumsum(sizes) - sizes
+            terms = np.repeat(self.group_starts[groups] - offsets, sizes) + np.arange(offsets[-1] + sizes[-1])
+            source = np.repeat(block[rows], sizes)
+            signs = 1 - 2 * parity(source & self.phase_masks[terms])
+            mels = np.add.reduceat(signs * self.coeffs[terms], offsets)
+            keep = np.abs(mels) > tol
+            profiling.count("pauli_terms_applied", len(terms))
+            profiling.count("connections_generated", np.count_nonzero(keep))
+            all_rows.append(rows[keep] + start)
+            all_conn.append(block[rows[keep]] ^ self.group_masks[groups[keep]])
+            all_mels.append(mels[keep])
+        if not all_rows:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=complex)
+        return np.concatenate(all_rows), np.concatenate(all_conn), np.concatenate(all_mels)
+
+    def diagonal(self, codes):
+        """Elementos diagonais ⟨σ|H|σ⟩ (incluindo o termo constante).
+        """
+        codes = np.asarray(codes, dtype=np.uint64).reshape(-1)
+        diag = np.full(len(codes), self.constant, dtype=complex)
+        # termos só com Z ficam no grupo de máscara 0 (o primeiro, pela ordenação)
+        if self.n_groups and self.group_masks[0] == 0:
+            stop = self.group_starts[1] if self.n_groups > 1 else self.n_terms
+            signs = 1 - 2 * parity(codes[:, None] & self.phase_masks[None, :stop])
+            diag += signs @ self.coeffs[:stop]
+        return diag
@@ -0,0 +1,250 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import os
+import io
+import time
+import pstats
+import cProfile
+import tracemalloc
+from contextlib import nullcontext
+
+# ----------------- Instrumentação por fase -----------------
+_NULL_PHASE = nullcontext()
+
+
+class _Phase:
+
+    """Cronômetro de uma fase (usado por ``Profiler.phase``).
+    """
+
+    __slots__ = ("timers", "name", "start")
+
+    def __init__(self, timers, name):
+        """Summary
+        """
+        self.timers = timers
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        entry = self.timers.get(self.name)
+        if entry is None:
+            self.timers[self.name] = [elapsed, 1]
+        else:
+            entry[0] += elapsed
+            entry[1] += 1
+        return False
+
+
+class Profiler:
+
+    """Timers nomeados, contadores e capturas de cProfile/tracemalloc.
+
+    Os laços de treino marcam fases com ``with profiler.phase("nome")``;
+    o código quente (Hamiltoniano, índice, E_loc) incrementa contadores
+    com ``profiling.count(...)``, que vão para o profiler ativo. Com
+    ``enabled=False`` (o padrão dos treinos) ``phase`` devolve um contexto
+    nulo reutilizado e ``count`` retorna na primeira linha, então o custo
+    desligado é uma chamada de função por lote.
+
+    Attributes:
+        enabled (bool): Liga a coleta.
+        profile_every (int or None): Captura cProfile a cada N épocas.
+        trace_memory_every (int or None): Captura tracemalloc a cada N épocas.
+        output_dir (str or None): Onde gravar os ``.prof`` e relatórios de memória.
+        timers (dict): nome → [segundos acumulados, chamadas].
+        outside_epoch (set): Fases medidas fora de ``begin_epoch``/``end_epoch``
+            (ex.: ``setup``), que não entram na coluna "% época".
+        counters (dict): nome → total.
+        captures (list): (época, tipo, texto) das capturas feitas.
+    """
+
+    def __init__(self, enabled=True, profile_every=None, trace_memory_every=None, output_dir=None, top=15):
+        """Summary
+        """
+        self.enabled = enabled
+        self.profile_every = profile_every
+        self.trace_memory_every = trace_memory_every
+        self.output_dir = output_dir
+        self.top = top
+        self.timers = {}
+        self.outside_epoch = set()
+        self.counters = {}
+        self.captures = []
+        self._previous = None
+        self._cprofile = None
+        self._tracing = False
+        self._epoch_start = None
+
+    # ----------------- Ativação -----------------
+    def start(self):
+        """Torna este o profiler ativo (destino de ``profiling.count``).
+        """
+        global _active
+        if self.enabled and _active is not self:
+            self._previous = _active
+            _active = self
+        return self
+
+    def stop(self):
+        """Restaura o profiler ativo anterior.
+        """
+        global _active
+        if _active is self:
+            _active = self._previous if self._previous is not None else NULL_PROFILER
+            self._previous = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    # ----------------- Coleta -----------------
+    def phase(self, name):
+        """Contexto que acumula o tempo gasto em ``name``.
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        if self._epoch_start is None:
+            self.outside_epoch.add(name)
+        return _Phase(self.timers, name)
+
+    def count(self, name, n=1):
+        """Soma ``n`` ao contador ``name``.
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + int(n)
+
+    def begin_epoch(self, epoch):
+        """Início de época: liga as capturas agendadas para ``epoch``.
+        """
+        if not self.enabled:
+            return
+        if self.profile_every and epoch % self.profile_every == 0:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        if self.trace_memory_every and epoch % self.trace_memory_every == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        self._epoch_start = time.perf_counter()
+
+    def end_epoch(self, epoch):
+        """Fim de época: acumula o tempo da época e fecha as capturas.
+        """
+        if not self.enabled or self._epoch_start is None:
+            return
+        elapsed = time.perf_counter() - self._epoch_start
+        entry = self.timers.setdefault("epoch", [0.0, 0])
+        entry[0] += elapsed
+        entry[1] += 1
+        self._epoch_start = None
+
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            stream = io.StringIO()
+            stats = pstats.Stats(self._cprofile, stream=stream)
+            stats.sort_stats("cumulative").print_stats(self.top)
+            self.captures.append((epoch, "cprofile", stream.getvalue()))
+            if self.output_dir:
+                os.makedirs(self.output_dir, exist_ok=True)
+                stats.dump_stats(os.path.join(self.output_dir, f"epoch_{epoch + 1:05d}.prof"))
+            self._cprofile = None
+
+        if self._tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            lines = [f"memória atual = {current / 2**20:.1f} MiB | pico = {peak / 2**20:.1f} MiB"]
+            for stat in tracemalloc.take_snapshot().statistics("lineno")[:self.top]:
+                lines.append(str(stat))
+            tracemalloc.stop()
+            self._tracing = False
+            self.counters["peak_traced_bytes"] = max(self.counters.get("peak_traced_bytes", 0), peak)
+            text = "\n".join(lines)
+            self.captures.append((epoch, "tracemalloc", text))
+            if self.output_dir:
+                os.makedirs(self.output_dir, exist_ok=True)
+                with open(os.path.join(self.output_dir, f"epoch_{epoch + 1:05d}_memory.txt"), "w") as f:
+                    f.write(text + "\n")
+
+    # ----------------- Relatório -----------------
+    def as_dict(self):
+        """Timers e contadores em forma serializável (JSON).
+        """
+        return {"timers": {name: {"seconds": total, "calls": calls} for name, (total, calls) in self.timers.items()},
+                "counters": dict(self.counters)}
+
+    def summary(self):
+        """Tabela com o tempo de cada fase e os contadores.
+
+        A coluna "% época" só vale para fases medidas dentro das épocas; as
+        de fora (``setup``) e a própria ``epoch`` ficam em branco.
+        """
+        if not self.timers and not self.counters:
+            return "(profiler sem dados)"
+        epoch_total = self.timers.get("epoch", [0.0, 0])[0]
+        lines = [f"{'fase':<24}{'chamadas':>10}{'total (s)':>12}{'média (ms)':>12}{'% época':>10}"]
+        for name, (total, calls) in sorted(self.timers.items(), key=lambda item: -item[1][0]):
+            in_epoch = name != "epoch" and name not in self.outside_epoch
+            share = f"{100 * total / epoch_total:9.1f}%" if epoch_total and in_epoch else f"{'':>10}"
+            lines.append(f"{name:<24}{calls:>10d}{total:>12.4f}{1e3 * total / max(calls, 1):>12.3f}{share}")
+        if self.counters:
+            lines.append("")
+            lines.append(f"{'contador':<34}{'total':>16}")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:<34}{value:>16,d}")
+        return "\n".join(lines)
+
+    def report(self):
+        """Imprime o resumo (só se habilitado).
+        """
+        if self.enabled:
+            print("⏱️ Perfil do treino")
+            print(self.summary())
+
+    @classmethod
+    def coerce(cls, profiler):
+        """None → profiler desligado; True → profiler padrão; instância → ela mesma.
+        """
+        if profiler is None or profiler is False:
+            return NULL_PROFILER
+        if profiler is True:
+            return cls()
+        return profiler
+
+
+NULL_PROFILER = Profiler(enabled=False)
+_active = NULL_PROFILER
+
+
+def active():
+    """Profiler ativo (``NULL_PROFILER`` quando nenhum foi iniciado).
+    """
+    return _active
+
+
+def count(name, n=1):
+    """Incrementa um contador do profiler ativo (no-op quando desligado).
+    """
+    if _active.enabled:
+        _active.counters[name] = _active.counters.get(name, 0) + int(n)
@@ -18,9 +18,11 @@
 
 import numpy as np
 from itertools import combinations
+from rbm_batch import BatchRBMMixin
+from estimators import LOG2, log_cosh
 
 # ----------------- RBM -----------------
-class RBM:
+class RBM(BatchRBMMixin):
 
     """Summary
     """
@@ -37,19 +39,14 @@ class RBM:
     def psi(self, sigma):
         """Summary
         """
-        preactivation = self.b + np.dot(sigma, self.W)
-        preactivation = np.clip(preactivation, -10, 10)
-        hidden_product = np.prod(2 * np.cosh(preactivation))
-        a_dot = np.dot(self.a, sigma)
-        a_dot = np.clip(a_dot, -20, 20)
-        return np.exp(a_dot) * hidden_product
+        return np.exp(self.log_psi(sigma))
 
     def log_psi(self, sigma):
         """Summary
         """
         a_dot = np.dot(self.a, sigma)
         preactivation = self.b + np.dot(sigma, self.W)
-        cosh_terms = np.log(2 * np.cosh(preactivation))
+        cosh_terms = log_cosh(preactivation) + LOG2
         return a_dot + np.sum(cosh_terms)
 
     def log_derivatives(self, sigma):
@@ -16,13 +16,25 @@
 ====================================================================================================================================================
 """
 
+import time
 import numpy as np
 
 import numpy as np
-from itertools import combinations
+from config_index import ConfigIndex, Sector, sector_codes, unpack_codes
+from pauli_hamiltonian import CompiledPauliHamiltonian
+from rbm_batch import BatchRBMMixin
+from sr_solver import SRSolver
+from parallel import ParallelEstimator
+from checkpoint import Checkpointer
+from telemetry import Telemetry, ConsoleProgress
+from profiling import Profiler
+from estimators import (LOG2, log_cosh, born_probabilities, local_energies, connected_indices,
+                        sampled_local_energies, energy_statistics, energy_gradient, streamed_gradient,
+                        accumulated_gradient)
+from optimizers import Optimizer
 
 # ----------------- RBM -----------------
-class RBM:
+class RBM(BatchRBMMixin):
 
     """Summary
     """
@@ -39,19 +51,14 @@ class RBM:
     def psi(self, sigma):
         """Summary
         """
-        preactivation = self.b + np.dot(sigma, self.W)
-        preactivation = np.clip(preactivation, -10, 10)
-        hidden_product = np.prod(2 * np.cosh(preactivation))
-        a_dot = np.dot(self.a, sigma)
-        a_dot = np.clip(a_dot, -20, 20)
-        return np.exp(a_dot) * hidden_product
+        return np.exp(self.log_psi(sigma))
 
     def log_psi(self, sigma):
         """Summary
         """
         a_dot = np.dot(self.a, sigma)
         preactivation = self.b + np.dot(sigma, self.W)
-        cosh_terms = np.log(2 * np.cosh(preactivation))
+        cosh_terms = log_cosh(preactivation) + LOG2
         return a_dot + np.sum(cosh_terms)
 
     def log_derivatives(self, sigma):
@@ -62,105 +69,184 @@ class RBM:
         return sigma, tanh_h, np.outer(sigma, tanh_h)
 
 # ----------------- Configurações -----------------
-def generate_configurations(n_sites, n_electrons):
+def generate_configurations(n_sites, n_electrons, packed=False):
     """Summary
+
+    Com ``packed=True`` devolve os códigos uint64 do setor (1 bit por
+    sítio), que as funções de treino aceitam no lugar das ocupações.
     """
-    configs = []
-    for occ in combinations(range(n_sites), n_electrons):
-        config = np.zeros(n_sites)
-        config[list(occ)] = 1
-        configs.append(config)
-    return np.array(configs)
+    codes = sector_codes(n_sites, n_electrons)
+    return codes if packed else unpack_codes(codes, n_sites)
     
-def train_rbm_sr(rbm, configs, H_jw, epochs=300, lr=0.01, clip_value=2.0, tol=1e-3):
+def train_rbm_sr(rbm, configs, H_jw, epochs=300, lr=0.01, clip_value=None, tol=1e-3,
+                 sampler=None, n_samples=1000, sr_solver=None, parallel=None, checkpoint=None,
+                 callbacks=None, profiler=None, optimizer=None, accumulate=1):
     """Summary
-    """
-    energia_por_epoca = []
 
+    Com ``sampler`` (ex.: MetropolisSampler) as médias são estimadas com
+    ``n_samples`` amostras de |Ψ|² por época e ``configs`` pode ser None;
+    sem ele, a soma é exata sobre ``configs`` (ocupações ou códigos uint64,
+    ex.: ``generate_configurations(..., packed=True)``). Com um
+    ``config_index.Sector`` a soma exata é feita em blocos gerados por
+    unranking e só S (n_params²) fica na memória.
+
+    ``H_jw`` pode ser um QubitOperator, um CompiledPauliHamiltonian ou um
+    SlaterCondonHamiltonian (conexões geradas direto de h1/eri).
+
+    ``sr_solver`` (SRSolver ou nome do método: 'cg', 'minres', 'minsr')
+    resolve o sistema SR sem formar S; com None a matriz S densa é montada.
+
+    ``parallel`` (ParallelEstimator ou número de processos) distribui E_loc,
+    gradiente e S·v entre workers com memória compartilhada.
+
+    ``checkpoint`` (Checkpointer ou caminho) grava o estado periodicamente;
+    com ``Checkpointer(..., resume=True)`` retoma do checkpoint existente.
+
+    ``callbacks`` (telemetry.Callback ou lista) recebem as métricas escalares
+    de cada época; por padrão, progresso no terminal com taxa limitada.
+
+    ``profiler`` (profiling.Profiler ou True) mede o tempo de cada fase e
+    os contadores do código quente e imprime um resumo no fim; desligado
+    por padrão.
+
+    ``optimizer`` (optimizers.Optimizer ou nome) aplica a direção SR S⁻¹g
+    in-place no vetor de parâmetros; o padrão é SGD com passo ``lr``.
+
+    ``accumulate`` divide as ``n_samples`` amostras em minilotes: só as
+    somas (incluindo S, n_params²) são guardadas, e o sistema SR é
+    resolvido com S acumulada ('minsr' não se aplica).
+    """
+    telemetry = Telemetry.coerce(callbacks, [ConsoleProgress()])
+    profiler = Profiler.coerce(profiler).start()
     n_param = rbm.n_visible + rbm.n_hidden + rbm.n_visible * rbm.n_hidden
-    theta_vec = np.concatenate([rbm.a, rbm.b, rbm.W.flatten()])
-
-    for epoch in range(epochs):
-        psi_vals = np.array([rbm.psi(cfg) for cfg in configs])
-        norm = np.sum(np.abs(psi_vals) ** 2)
-
-        E_total = 0.0
-        E_locals = []
-        if () in H_jw.terms:
-            E_total += H_jw.terms[()] * norm
-
-        for i, sigma in enumerate(configs):
-            psi_sigma = psi_vals[i]
-            E_loc = 0
-            for term, coeff in H_jw.terms.items():
-                if term == (): continue
-                new_sigma = sigma.copy()
-                phase = 1.0 + 0j
-                for qubit, op in term:
-                    if op == 'Z':
-                        phase *= (-1) ** int(new_sigma[qubit])
-                    elif op in ('X', 'Y'):
-                        new_sigma[qubit] = 1 - new_sigma[qubit]
-                        if op == 'Y':
-                            phase *= 1j if sigma[qubit] == 0 else -1j
-                try:
-                    j = configs.tolist().index(new_sigma.tolist())
-                    psi_sp = psi_vals[j]
-                    contrib = coeff * phase * np.conj(psi_sigma) * psi_sp
-                    E_total += contrib
-                    E_loc += contrib
-                except ValueError:
-                    continue
-            E_locals.append(E_loc.real)
-
-        E_mean = (E_total / norm).real
-        energia_por_epoca.append(E_mean)
-
-        Oks = []
-        for sigma in configs:
-            da, db, dW = rbm.log_derivatives(sigma)
-            Oks.append(np.concatenate([da, db, dW.flatten()]))
-
-        Oks = np.array(Oks)
-        O_mean = np.sum((np.abs(psi_vals) ** 2)[:, None] * Oks, axis=0) / norm
-        E_mean = np.real(E_mean)
-        E_locals = np.array(E_locals)
-
-        grads = np.zeros_like(O_mean)
-        S_matrix = np.zeros((n_param, n_param))
-        for i in range(len(configs)):
-            O_i = Oks[i]
-            diff_O = O_i - O_mean
-            S_matrix += np.outer(diff_O, diff_O) * np.abs(psi_vals[i]) ** 2
-            grads += (E_locals[i] - E_mean) * diff_O * np.abs(psi_vals[i]) ** 2
-
-        S_matrix /= norm
-        grads /= norm
-
-        try:
-            delta_theta = np.linalg.solve(S_matrix + 1e-4 * np.eye(n_param), grads)
-        except np.linalg.LinAlgError:
-            print("⚠️ Matriz S singular — usando gradiente direto")
-            delta_theta = grads
-
-        # Atualiza parâmetros
-        theta_vec -= lr * delta_theta
-
-        # Clipping para evitar explosão
-        theta_vec = np.clip(theta_vec, -clip_value, clip_value)
-
-        # Atribui os novos valores
-        rbm.a = theta_vec[:rbm.n_visible]
-        rbm.b = theta_vec[rbm.n_visible:rbm.n_visible + rbm.n_hidden]
-        rbm.W = theta_vec[rbm.n_visible + rbm.n_hidden:].reshape(rbm.n_visible, rbm.n_hidden)
-
-        print(f"Epoch {epoch+1:03d} → ⟨H⟩ = {E_mean:.6f} Ha")
-
-        # Critério de convergência por precisão química
-        if epoch > 5:
-            delta_E = np.abs(energia_por_epoca[-1] - energia_por_epoca[-2])
-            if delta_E < tol:
-                print(f"✅ Convergência atingida com ΔE = {delta_E:.2e} Ha na época {epoch+1}")
+    H = CompiledPauliHamiltonian.coerce(H_jw, rbm.n_visible)
+    if isinstance(sr_solver, str):
+        sr_solver = SRSolver(sr_solver)
+    optimizer = Optimizer.coerce(optimizer, lr, epochs)
+    checkpoint = Checkpointer.coerce(checkpoint)
+    start_epoch, history = 0, {}
+    if checkpoint is not None:
+        start_epoch, _, history = checkpoint.restore(rbm, sr_solver, sampler, optimizer)
+    energia_por_epoca = list(history.get("energies", []))
+    # a, b e W passam a ser views deste vetor: as atualizações são in-place
+    theta_vec = rbm.parameter_vector()
+    own_pool = isinstance(parallel, int)
+    streamed = sampler is None and parallel is None and isinstance(configs, Sector)
+    accumulated = sampler is not None and accumulate > 1
+    if accumulated and parallel is not None:
+        raise ValueError("accumulate > 1 não é suportado com parallel (os workers já dividem as amostras)")
+    with profiler.phase("setup"):
+        if own_pool:
+            parallel = ParallelEstimator(rbm, H, configs if sampler is None else None, n_workers=parallel,
+                                         max_samples=max(n_samples, 1))
+        elif sampler is None and parallel is None and not streamed:
+            # As conexões σ → σ' e os elementos de matriz não mudam entre épocas
+            j, mels = connected_indices(H, ConfigIndex(configs, rbm.n_visible))
+
+    if checkpoint is not None:
+        checkpoint.open()
+    try:
+        for epoch in range(start_epoch, epochs):
+            start = time.perf_counter()
+            profiler.begin_epoch(epoch)
+            if parallel is not None:
+                # E_loc, O e S ficam distribuídos; só as somas voltam
+                with profiler.phase("sampling"):
+                    batch = None if sampler is None else sampler.sample(n_samples, packed=True)
+                with profiler.phase("parallel_gradient"):
+                    grads, E_mean, E_var, _ = parallel.gradient(rbm, batch)
+            elif streamed:
+                # Soma exata bloco a bloco; S já sai centrada e acumulada
+                with profiler.phase("gradient"):
+                    grads, E_mean, E_var, _, S_summed = streamed_gradient(rbm, H, configs, s_matrix=True)
+            elif accumulated:
+                grads, E_mean, E_var, _, S_summed = accumulated_gradient(rbm, H, sampler, n_samples, accumulate,
+                                                                         profiler, s_matrix=True)
+            else:
+                if sampler is None:
+                    # Tudo em log Ψ: p(σ) por log-sum-exp e E_loc por razões Ψ(σ')/Ψ(σ)
+                    batch = configs
+                    with profiler.phase("log_psi"):
+                        log_psi = rbm.log_psi_batch(batch)
+                        probs = born_probabilities(log_psi)
+                    with profiler.phase("local_energy"):
+                        E_locals = local_energies(log_psi, log_psi[j], mels, H.constant).real
+                else:
+                    with profiler.phase("sampling"):
+                        batch = sampler.sample(n_samples, packed=True)
+                    probs = np.full(len(batch), 1.0 / len(batch))
+                    with profiler.phase("local_energy"):
+                        E_locals = sampled_local_energies(rbm, H, batch).real
+
+                with profiler.phase("log_derivatives"):
+                    Oks = rbm.log_derivatives_batch(batch)
+                with profiler.phase("gradient"):
+                    grads, E_mean, O_mean = energy_gradient(E_locals, Oks, probs)
+                    _, E_var = energy_statistics(E_locals, probs)
+            energia_por_epoca.append(E_mean)
+
+            with profiler.phase("sr_solve"):
+                if sr_solver is not None and parallel is not None:
+                    delta_theta = sr_solver.solve_matvec(parallel.s_matvec, grads, parallel.s_matrix)
+                elif sr_solver is not None and (streamed or accumulated):
+                    delta_theta = sr_solver.solve_matvec(lambda v: S_summed @ v, grads, lambda: S_summed)
+                elif sr_solver is not None:
+                    delta_theta = sr_solver.solve(Oks, grads, probs, E_locals)
+                else:
+                    # S com produtos de matrizes em vez de somas de np.outer
+                    if parallel is not None:
+                        S_matrix = parallel.s_matrix()
+                    elif streamed or accumulated:
+                        S_matrix = S_summed
+                    else:
+                        diff_O = Oks - O_mean
+                        S_matrix = diff_O.T @ (probs[:, None] * diff_O)
+
+                    try:
+                        delta_theta = np.linalg.solve(S_matrix + 1e-4 * np.eye(n_param), grads)
+                    except np.linalg.LinAlgError:
+                        print("⚠️ Matriz S singular — usando gradiente direto")
+                        delta_theta = grads
+                if sr_solver is not None:
+                    profiler.count("sr_iterations", sr_solver.last_iterations)
+
+            # Atualiza parâmetros (in-place: a, b e W acompanham)
+            optimizer.step(theta_vec, delta_theta, epoch)
+            optimizer.observe(E_mean)
+
+            # Clipping opcional (desnecessário com as estimativas em log Ψ)
+            if clip_value is not None:
+                np.clip(theta_vec, -clip_value, clip_value, out=theta_vec)
+            profiler.end_epoch(epoch)
+
+            metrics = {"energy": E_mean, "variance": E_var, "grad_norm": np.linalg.norm(grads), "lr": optimizer.lr,
+                       "update_norm": optimizer.last_update_norm, "step_time": time.perf_counter() - start}
+            if sr_solver is not None:
+                metrics["sr_iterations"] = sr_solver.last_iterations
+            if sampler is not None:
+                metrics["acceptance"] = sampler.acceptance_rate
+            telemetry.on_epoch(epoch, metrics, rbm)
+
+            if checkpoint is not None and checkpoint.step(epoch, rbm, optimizer.lr, sr_solver, sampler, optimizer,
+                                                          energies=energia_por_epoca):
                 break
 
-    return energia_por_epoca
\ No newline at end of file
+            # Critério de convergência por precisão química
+            if epoch > 5:
+                delta_E = np.abs(energia_por_epoca[-1] - energia_por_epoca[-2])
+                if delta_E < tol:
+                    print(f"✅ Convergência atingida com ΔE = {delta_E:.2e} Ha na época {epoch+1}")
+                    break
+        if checkpoint is not None and not checkpoint.stop_requested and energia_por_epoca:
+            checkpoint.finish(len(energia_por_epoca) - 1, rbm, optimizer.lr, sr_solver, sampler, optimizer,
+                              energies=energia_por_epoca)
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+        if own_pool:
+            parallel.close()
+        telemetry.close()
+        profiler.stop()
+    profiler.report()
+
+    return energia_por_epoca
@@ -0,0 +1,261 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import numpy as np
+from estimators import LOG2, log_cosh
+from config_index import pack_configs, pack_words, unpack_codes, is_packed, as_configs, n_words
+from pauli_hamiltonian import popcount
+
+# ----------------- Avaliação em lote da RBM -----------------
+class BatchRBMMixin:
+
+    """Métodos vetorizados para classes RBM com atributos ``a``, ``b`` e ``W``.
+
+    Todas as funções recebem uma matriz (N, n_visible) de configurações, ou
+    os códigos uint64 empacotados (ver config_index), e fazem um único GEMM
+    por bloco de ``chunk_size`` linhas, de modo que a memória intermediária
+    fica limitada a chunk_size × n_hidden. Códigos são desempacotados bloco
+    a bloco, só na hora do GEMM.
+
+    A ordem dos parâmetros é sempre [a, b, W.flatten()], a mesma usada em
+    ``train_rbm_sr``.
+    """
+
+    chunk_size = 4096
+
+    @property
+    def n_params(self):
+        """Número total de parâmetros (a, b e W).
+        """
+        return self.n_visible + self.n_hidden + self.n_visible * self.n_hidden
+
+    def parameter_vector(self):
+        """Vetor [a, b, W.flatten()] do qual a, b e W passam a ser views.
+
+        Atualizações in-place no vetor (ex.: ``optimizer.step``) mudam a RBM
+        sem concatenar e separar os parâmetros a cada passo. Se a, b ou W
+        foram reatribuídos (ex.: ao restaurar um checkpoint), o vetor é
+        recriado com os valores atuais.
+        """
+        params = getattr(self, "_params", None)
+        if params is None or any(p.base is not params for p in (self.a, self.b, self.W)):
+            params = np.concatenate([self.a, self.b, self.W.ravel()])
+            n_v, n_h = self.n_visible, self.n_hidden
+            self.a = params[:n_v]
+            self.b = params[n_v:n_v + n_h]
+            self.W = params[n_v + n_h:].reshape(n_v, n_h)
+            self._params = params
+        return params
+
+    def _chunks(self, n_rows, chunk_size):
+        """Fatias consecutivas de no máximo ``chunk_size`` linhas.
+        """
+        step = chunk_size or self.chunk_size
+        for start in range(0, n_rows, step):
+            yield slice(start, min(start + step, n_rows))
+
+    def _batch(self, configs):
+        """Lote como matriz de ocupações ou como códigos/palavras (N,)/(N, n_words).
+        """
+        configs = np.asarray(configs)
+        if not is_packed(configs):
+            return np.atleast_2d(configs)
+        if self.n_visible <= 64:
+            return configs.reshape(-1)
+        return configs.reshape(-1, n_words(self.n_visible))
+
+    def _block(self, configs, rows):
+        """Linhas ``rows`` do lote como ocupações float.
+        """
+        block = configs[rows]
+        return as_configs(block, self.n_visible) if is_packed(block) else block
+
+    def preactivations_batch(self, configs):
+        """θ = b + σ W para cada linha de ``configs`` (shape (N, n_hidden)).
+        """
+        configs = as_configs(configs, self.n_visible)
+        return configs @ self.W + self.b
+
+    def log_psi_batch(self, configs, chunk_size=None):
+        """log Ψ(σ) para um lote de configurações.
+
+        Args:
+            configs (np.ndarray): Matriz (N, n_visible) ou códigos empacotados.
+            chunk_size (int, optional): Linhas por bloco.
+
+        Returns:
+            np.ndarray: Vetor (N,) com log Ψ.
+        """
+        configs = self._batch(configs)
+        dtype = np.result_type(float if is_packed(configs) else configs, self.W, self.a)
+        out = np.empty(len(configs), dtype=dtype)
+        for rows in self._chunks(len(configs), chunk_size):
+            block = self._block(configs, rows)
+            theta = block @ self.W + self.b
+            out[rows] = block @ self.a + np.sum(log_cosh(theta), axis=1) + self.n_hidden * LOG2
+        return out
+
+    def psi_batch(self, configs, chunk_size=None):
+        """Ψ(σ) = exp(log Ψ(σ)) para um lote de configurações.
+        """
+        return np.exp(self.log_psi_batch(configs, chunk_size))
+
+    def iter_log_derivatives(self, configs, chunk_size=None):
+        """Gera blocos (rows, O) da matriz O_k(σ) = ∂ log Ψ(σ) / ∂θ_k.
+
+        Útil quando a matriz completa (N, n_params) não cabe na memória.
+        """
+        configs = self._batch(configs)
+        n_v, n_h = self.n_visible, self.n_hidden
+        for rows in self._chunks(len(configs), chunk_size):
+            block = self._block(configs, rows)
+            tanh_h = np.tanh(block @ self.W + self.b)
+            O = np.empty((len(block), self.n_params), dtype=np.result_type(block, tanh_h))
+            O[:, :n_v] = block
+            O[:, n_v:n_v + n_h] = tanh_h
+            O[:, n_v + n_h:] = (block[:, :, None] * tanh_h[:, None, :]).reshape(len(block), -1)
+            yield rows, O
+
+    def log_derivatives_batch(self, configs, chunk_size=None):
+        """Matriz completa O (N, n_params) das derivadas logarítmicas.
+        """
+        configs = self._batch(configs)
+        O = None
+        for rows, block in self.iter_log_derivatives(configs, chunk_size):
+            if O is None:
+                O = np.empty((len(configs), self.n_params), dtype=block.dtype)
+            O[rows] = block
+        if O is None:
+            O = np.empty((0, self.n_params))
+        return O
+
+    def angle_cache(self, configs):
+        """Cria um AngleCache (ângulos efetivos θ = b + σW) para ``configs``.
+        """
+        return AngleCache(self, configs)
+
+
+# ----------------- Ângulos efetivos -----------------
+class AngleCache:
+
+    """Cache dos ângulos efetivos θ = b + σW de um conjunto de configurações.
+
+    Com θ guardado, a razão log Ψ(σ') − log Ψ(σ) para σ' obtida invertendo
+    k bits de σ custa O(k·n_hidden) em vez de O(n_visible·n_hidden):
+
+        Δ_i = 1 − 2σ_i,   θ' = θ + Σ_i Δ_i W_i,
+        log Ψ(σ') − log Ψ(σ) = Σ_i a_i Δ_i + Σ_j [log cosh θ'_j − log cosh θ_j].
+
+    Movimentos aceitos atualizam σ, o código empacotado e θ no próprio cache.
+    Depois de alterar os parâmetros da RBM é preciso chamar ``refresh``.
+
+    Attributes:
+        rbm (RBM): Modelo com ``a``, ``b`` e ``W``.
+        configs (np.ndarray): Configurações (N, n_visible), atualizadas in-place.
+        codes (np.ndarray): Códigos uint64 de ``configs`` ((N, n_words) acima de 64 sítios).
+        theta (np.ndarray): Ângulos efetivos (N, n_hidden).
+        log_cosh_sum (np.ndarray): Σ_j log cosh θ_j de cada linha, (N,).
+    """
+
+    def __init__(self, rbm, configs):
+        """Summary
+        """
+        self.rbm = rbm
+        self.configs = np.array(as_configs(configs, rbm.n_visible), dtype=float, ndmin=2)
+        self.codes = pack_configs(self.configs) if rbm.n_visible <= 64 else pack_words(self.configs)
+        self.refresh()
+
+    def __len__(self):
+        return len(self.configs)
+
+    def refresh(self):
+        """Recalcula θ (um GEMM) a partir dos parâmetros atuais da RBM.
+        """
+        self.theta = self.configs @ self.rbm.W + self.rbm.b
+        self.log_cosh_sum = np.sum(log_cosh(self.theta), axis=1)
+
+    def log_psi(self):
+        """log Ψ de todas as configurações a partir de θ.
+        """
+        return self.configs @ self.rbm.a + self.log_cosh_sum + self.rbm.n_hidden * LOG2
+
+    def _delta_theta(self, rows, flip_sites):
+        """(Δ, Δθ) para inverter ``flip_sites`` (M, k) nas linhas ``rows``.
+        """
+        delta = 1.0 - 2.0 * self.configs[rows[:, None], flip_sites]
+        dtheta = np.einsum("mk,mkh->mh", delta, self.rbm.W[flip_sites])
+        return delta, dtheta
+
+    def log_ratio(self, rows, flip_sites):
+        """log Ψ(σ') − log Ψ(σ) invertendo k bits por linha.
+
+        Args:
+            rows (np.ndarray): Linha do cache de cada proposta, shape (M,).
+            flip_sites (np.ndarray): Sítios invertidos, shape (M, k) (sem repetição).
+
+        Returns:
+            np.ndarray: Razões logarítmicas, shape (M,).
+        """
+        rows = np.asarray(rows)
+        flip_sites = np.asarray(flip_sites).reshape(len(rows), -1)
+        if flip_sites.shape[1] == 0:
+            return np.zeros(len(rows))
+        delta, dtheta = self._delta_theta(rows, flip_sites)
+        return (np.sum(delta * self.rbm.a[flip_sites], axis=1)
+                + np.sum(log_cosh(self.theta[rows] + dtheta), axis=1) - self.log_cosh_sum[rows])
+
+    def log_ratio_codes(self, rows, codes):
+        """Como log_ratio, mas com as configurações de destino empacotadas.
+
+        As conexões são agrupadas pelo número de bits invertidos, então o
+        custo é O(k·n_hidden) por conexão; cada grupo é processado em
+        blocos de ``chunk_size`` conexões para limitar a memória k·n_hidden.
+        """
+        rows = np.asarray(rows)
+        diff = np.asarray(codes, dtype=np.uint64) ^ self.codes[rows]
+        n_flips = popcount(diff)
+        out = np.zeros(len(rows))
+        step = self.rbm.chunk_size
+        for k in np.unique(n_flips):
+            if k == 0:
+                continue
+            group = np.flatnonzero(n_flips == k)
+            for start in range(0, len(group), step):
+                sel = group[start:start + step]
+                bits = unpack_codes(diff[sel], self.rbm.n_visible, dtype=bool)
+                flip_sites = np.nonzero(bits)[1].reshape(len(sel), k)
+                out[sel] = self.log_ratio(rows[sel], flip_sites)
+        return out
+
+    def accept(self, rows, flip_sites):
+        """Aplica os movimentos aceitos: atualiza σ, códigos e θ in-place.
+        """
+        rows = np.asarray(rows)
+        if len(rows) == 0:
+            return
+        flip_sites = np.asarray(flip_sites).reshape(len(rows), -1)
+        _, dtheta = self._delta_theta(rows, flip_sites)
+        self.theta[rows] += dtheta
+        self.log_cosh_sum[rows] = np.sum(log_cosh(self.theta[rows]), axis=1)
+        self.configs[rows[:, None], flip_sites] = 1.0 - self.configs[rows[:, None], flip_sites]
+        if self.codes.ndim == 1:
+            masks = np.bitwise_or.reduce(np.left_shift(np.uint64(1), flip_sites.astype(np.uint64)), axis=1)
+            self.codes[rows] ^= masks
+        else:
+            for sites in flip_sites.T:
+                self.codes[rows, sites // 64] ^= np.left_shift(np.uint64(1), (sites % 64).astype(np.uint64))
@@ -16,13 +16,22 @@
 ====================================================================================================================================================
 """
 
+import time
 import numpy as np
-import matplotlib.pyplot as plt
-from openfermion import FermionOperator, jordan_wigner
-from itertools import combinations
+from config_index import ConfigIndex, Sector, sector_codes, unpack_codes
+from pauli_hamiltonian import CompiledPauliHamiltonian
+from rbm_batch import BatchRBMMixin
+from parallel import ParallelEstimator
+from checkpoint import Checkpointer
+from telemetry import Telemetry, ConsoleProgress, ParameterSnapshots
+from profiling import Profiler
+from estimators import (LOG2, log_cosh, born_probabilities, local_energies, connected_indices,
+                        sampled_local_energies, energy_statistics, energy_gradient, streamed_gradient,
+                        accumulated_gradient)
+from optimizers import Optimizer, SGD, StepDecay
 
 # ----------------- Classe RBM -----------------
-class RBM:
+class RBM(BatchRBMMixin):
 
     """Summary
     """
@@ -49,7 +58,7 @@ class RBM:
         """
         a_dot = np.dot(self.a, sigma)
         preactivation = self.b + np.dot(sigma, self.W)
-        cosh_terms = np.log(2 * np.cosh(preactivation))
+        cosh_terms = log_cosh(preactivation) + LOG2
         return a_dot + np.sum(cosh_terms)
 
 
@@ -72,155 +81,192 @@ class RBM:
         return sigma, tanh_h, np.outer(sigma, tanh_h)
 
 # ----------------- Geração de configurações -----------------
-def generate_configurations(n_sites, n_electrons):
+def generate_configurations(n_sites, n_electrons, packed=False):
     """Summary
+
+    Com ``packed=True`` devolve os códigos uint64 do setor (1 bit por
+    sítio), que as funções de treino aceitam no lugar das ocupações.
     """
-    configs = []
-    for occ in combinations(range(n_sites), n_electrons):
-        config = np.zeros(n_sites)
-        config[list(occ)] = 1
-        configs.append(config)
-    return np.array(configs)
+    codes = sector_codes(n_sites, n_electrons)
+    return codes if packed else unpack_codes(codes, n_sites)
 
 # ----------------- Treinamento variacional -----------------
-def train_rbm_variacional(rbm, configs, H_jw, epochs=100, lr=0.05):
+def train_rbm_variacional(rbm, configs, H_jw, epochs=100, lr=0.05, sampler=None, n_samples=1000,
+                          parallel=None, checkpoint=None, callbacks=None, profiler=None, optimizer=None,
+                          accumulate=1):
     """Summary
-    """
-    energia_por_epoca = []
-    # Novo: armazenar a jornada dos parâmetros
-    a_hist = []
-    b_hist = []
-    W_hist = []
-    initial_lr = lr
-    gamma = 0.9         # fator de decaimento
-    decay_interval = 2 # a cada 10 épocas
-
-    for epoch in range(epochs):
-        # Dentro do loop for epoch in range(epochs):
-        lr = initial_lr * (gamma ** (epoch // decay_interval))
-        psi_vals = np.array([rbm.psi(cfg) for cfg in configs])
-        norm = np.sum(np.abs(psi_vals)**2)
-
-        E_total = 0
-        if () in H_jw.terms:
-            E_total += H_jw.terms[()] * norm
-
-        E_locals = []
-        for i, sigma in enumerate(configs):
-            psi_sigma = psi_vals[i]
-            E_loc = 0
-            for term, coeff in H_jw.terms.items():
-                if term == (): continue
-                new_sigma = sigma.copy()
-                phase = 1.0 + 0j
-                for qubit, op in term:
-                    if op == 'Z':
-                        phase *= (-1)**int(new_sigma[qubit])
-                    elif op in ('X', 'Y'):
-                        new_sigma[qubit] = 1 - new_sigma[qubit]
-                        if op == 'Y':
-                            phase *= 1j if sigma[qubit] == 0 else -1j
-                try:
-                    j = configs.tolist().index(new_sigma.tolist())
-                    psi_sp = psi_vals[j]
-                    contrib = coeff * phase * np.conj(psi_sigma) * psi_sp
-                    E_total += contrib
-                    E_loc += contrib
-                except ValueError:
-                    continue
-            E_locals.append(E_loc.real)
-
-        E_mean = (E_total / norm).real
-        energia_por_epoca.append(E_mean)
-
-        if epoch == 0:
-            print(f"[Check] Energia inicial (sem treino): {E_mean:.6f} Ha")
-
-
-        # zera o valor dos gradientes
-        grad_a = np.zeros_like(rbm.a)
-        grad_b = np.zeros_like(rbm.b)
-        grad_W = np.zeros_like(rbm.W)
-
-        #         # Clipping de gradientes
-        # max_grad = 5.0
-        # grad_a = np.clip(grad_a, -max_grad, max_grad)
-        # grad_b = np.clip(grad_b, -max_grad, max_grad)
-        # grad_W = np.clip(grad_W, -max_grad, max_grad)
-
-
-        # calcula a probabilidade de P(psi) = |psi|ˆ2
-        probs = np.abs(psi_vals)**2
-        norm_probs = probs / norm
-
-        for i, sigma in enumerate(configs):
-            d_a, d_b, d_W = rbm.log_derivatives(sigma)
-            weight = norm_probs[i]
-            E_loc = E_locals[i]
-            grad_a += weight * (E_loc - E_mean) * d_a
-            grad_b += weight * (E_loc - E_mean) * d_b
-            grad_W += weight * (E_loc - E_mean) * d_W
-
-        rbm.a -= lr * grad_a
-        rbm.b -= lr * grad_b
-        rbm.W -= lr * grad_W
-
-        if epoch % 1 == 0:  # muda o intervalo de rastreio se quiser
-            delta_a = lr * grad_a
-            delta_b = lr * grad_b
-            delta_W = lr * grad_W
-
-            print(f"\n🔍 >>>>>>>>> Epoch {epoch+1}")
-            print("🔹 W max:", np.max(np.abs(rbm.W)))
-            print("🔹 psi[0]:", rbm.psi(configs[0]))
-
-            print("\n--- Bias Visíveis (a) ---")
-            print("a        =", rbm.a)
-            print("grad_a   =", grad_a)
-            print("Δa       =", delta_a)
-            print("a (nova) =", rbm.a - delta_a)
-
-            print("\n--- Bias Ocultos (b) ---")
-            print("b        =", rbm.b)
-            print("grad_b   =", grad_b)
-            print("Δb       =", delta_b)
-            print("b (nova) =", rbm.b - delta_b)
-
-            print("\n--- Pesos (W) ---")
-            print("W        =\n", rbm.W)
-            print("grad_W   =\n", grad_W)
-            print("ΔW       =\n", delta_W)
-            print("W (nova) =\n", rbm.W - delta_W)
-
-            print(f"\n⚡ Energia média ⟨H⟩: {E_mean:.6f} Ha")
-            print("-" * 50)
-
-        max_norm = 2.0  # limite para os pesos
-        rbm.W = np.clip(rbm.W, -max_norm, max_norm)
-        rbm.a = np.clip(rbm.a, -max_norm, max_norm)
-        rbm.b = np.clip(rbm.b, -max_norm, max_norm)
-        a_hist.append(rbm.a.copy())
-        b_hist.append(rbm.b.copy())
-        W_hist.append(rbm.W.copy())
-        print(f"Epoch {epoch+1:03d} → ⟨H⟩: {E_mean:.6f} Ha")
- 
 
+    Com ``sampler`` (ex.: MetropolisSampler) as médias são estimadas com
+    ``n_samples`` amostras de |Ψ|² por época e ``configs`` pode ser None;
+    sem ele, a soma é exata sobre ``configs`` (ocupações ou códigos uint64,
+    ex.: ``generate_configurations(..., packed=True)``). Com um
+    ``config_index.Sector`` a soma exata é feita em blocos gerados por
+    unranking, sem guardar o setor inteiro na memória.
+
+    ``H_jw`` pode ser um QubitOperator, um CompiledPauliHamiltonian ou um
+    SlaterCondonHamiltonian (conexões geradas direto de h1/eri).
+
+    ``parallel`` (ParallelEstimator ou número de processos) distribui E_loc e
+    o gradiente entre workers com memória compartilhada.
+
+    ``checkpoint`` (Checkpointer ou caminho) grava o estado periodicamente;
+    com ``Checkpointer(..., resume=True)`` retoma do checkpoint existente.
+
+    ``callbacks`` (telemetry.Callback ou lista) recebem as métricas escalares
+    de cada época; por padrão, progresso no terminal com taxa limitada e
+    cópias dos parâmetros em todas as épocas (até 1000, buffer circular).
+    O histórico (a_hist, b_hist, W_hist) devolvido vem do primeiro
+    ParameterSnapshots da lista.
+
+    ``profiler`` (profiling.Profiler ou True) mede o tempo de cada fase e
+    os contadores do código quente e imprime um resumo no fim; desligado
+    por padrão.
+
+    ``optimizer`` (optimizers.Optimizer ou nome: 'sgd', 'momentum',
+    'rmsprop', 'adam', 'amsgrad') atualiza in-place o vetor de parâmetros
+    da RBM; o padrão é SGD com passo ``lr`` decaindo 0.9× a cada 2 épocas.
+
+    ``accumulate`` divide as ``n_samples`` amostras de cada época em
+    minilotes cujas somas são acumuladas antes do passo, de modo que só
+    as O_k de um minilote ficam na memória.
+    """
+    telemetry = Telemetry.coerce(callbacks, [ConsoleProgress()])
+    profiler = Profiler.coerce(profiler).start()
+    snapshots = telemetry.find(ParameterSnapshots)
+    if snapshots is None:
+        snapshots = ParameterSnapshots(stride=1, capacity=1000)
+        telemetry.callbacks.append(snapshots)
+    if optimizer is None:
+        optimizer = SGD(lr, schedule=StepDecay(lr, gamma=0.9, interval=2))
+    optimizer = Optimizer.coerce(optimizer, lr, epochs)
+    checkpoint = Checkpointer.coerce(checkpoint)
+    start_epoch, history = 0, {}
+    if checkpoint is not None:
+        start_epoch, _, history = checkpoint.restore(rbm, sampler=sampler, optimizer=optimizer)
+        snapshots.load(history)
+    energia_por_epoca = list(history.get("energies", []))
+    params = rbm.parameter_vector()
+    H = CompiledPauliHamiltonian.coerce(H_jw, rbm.n_visible)
+    streamed = sampler is None and parallel is None and isinstance(configs, Sector)
+    accumulated = sampler is not None and accumulate > 1
+    if accumulated and parallel is not None:
+        raise ValueError("accumulate > 1 não é suportado com parallel (os workers já dividem as amostras)")
+    with profiler.phase("setup"):
+        if isinstance(parallel, int):
+            parallel = ParallelEstimator(rbm, H, configs if sampler is None else None, n_workers=parallel,
+                                         max_samples=max(n_samples, 1))
+            own_pool = True
+        else:
+            own_pool = False
+        if sampler is None and parallel is None and not streamed:
+            # As conexões σ → σ' e os elementos de matriz não mudam entre épocas
+            j, mels = connected_indices(H, ConfigIndex(configs, rbm.n_visible))
+
+    if checkpoint is not None:
+        checkpoint.open()
+    try:
+        for epoch in range(start_epoch, epochs):
+            start = time.perf_counter()
+            profiler.begin_epoch(epoch)
+            if parallel is not None:
+                # E_loc e O ficam nos workers; só as somas parciais voltam
+                with profiler.phase("sampling"):
+                    batch = configs if sampler is None else sampler.sample(n_samples, packed=True)
+                with profiler.phase("parallel_gradient"):
+                    grad, E_mean, E_var, _ = parallel.gradient(rbm, None if sampler is None else batch)
+            elif streamed:
+                # Soma exata bloco a bloco: E_loc e O não ficam na memória
+                with profiler.phase("gradient"):
+                    grad, E_mean, E_var, _, _ = streamed_gradient(rbm, H, configs)
+            elif accumulated:
+                grad, E_mean, E_var = accumulated_gradient(rbm, H, sampler, n_samples, accumulate, profiler)[:3]
+            elif sampler is None:
+                # Tudo em log Ψ: p(σ) por log-sum-exp e E_loc por razões Ψ(σ')/Ψ(σ)
+                batch = configs
+                with profiler.phase("log_psi"):
+                    log_psi = rbm.log_psi_batch(batch)
+                    norm_probs = born_probabilities(log_psi)
+                with profiler.phase("local_energy"):
+                    E_locals = local_energies(log_psi, log_psi[j], mels, H.constant).real
+            else:
+                with profiler.phase("sampling"):
+                    batch = sampler.sample(n_samples, packed=True)
+                norm_probs = None
+                with profiler.phase("local_energy"):
+                    E_locals = sampled_local_energies(rbm, H, batch).real
+
+            if parallel is None and not streamed and not accumulated:
+                E_mean, E_var = energy_statistics(E_locals, norm_probs)
+            energia_por_epoca.append(E_mean)
+
+            if epoch == 0:
+                print(f"[Check] Energia inicial (sem treino): {E_mean:.6f} Ha")
+
+
+            #         # Clipping de gradientes
+            # max_grad = 5.0
+            # grad_a = np.clip(grad_a, -max_grad, max_grad)
+            # grad_b = np.clip(grad_b, -max_grad, max_grad)
+            # grad_W = np.clip(grad_W, -max_grad, max_grad)
+
+
+            # gradiente = Σ_σ p(σ) (E_loc − ⟨H⟩) O_k(σ), com O em um único lote
+            if parallel is None and not streamed and not accumulated:
+                with profiler.phase("log_derivatives"):
+                    O = rbm.log_derivatives_batch(batch)
+                with profiler.phase("gradient"):
+                    grad, _, _ = energy_gradient(E_locals, O, norm_probs)
+            n_v, n_h = rbm.n_visible, rbm.n_hidden
+            grad_a = grad[:n_v]
+            grad_b = grad[n_v:n_v + n_h]
+            grad_W = grad[n_v + n_h:].reshape(n_v, n_h)
+
+            # a, b e W são views de ``params``: o passo é in-place
+            optimizer.step(params, grad, epoch)
+            optimizer.observe(E_mean)
+            lr = optimizer.lr
+            profiler.end_epoch(epoch)
+
+            # Só escalares a cada época; cópias dos parâmetros no ParameterSnapshots
+            metrics = {"energy": E_mean, "variance": E_var, "lr": lr,
+                       "grad_norm": np.linalg.norm(grad), "grad_a_norm": np.linalg.norm(grad_a),
+                       "grad_b_norm": np.linalg.norm(grad_b), "grad_W_norm": np.linalg.norm(grad_W),
+                       "max_abs_W": np.max(np.abs(rbm.W)), "step_time": time.perf_counter() - start}
+            if sampler is not None:
+                metrics["acceptance"] = sampler.acceptance_rate
+            telemetry.on_epoch(epoch, metrics, rbm)
+
+            if checkpoint is not None and checkpoint.step(epoch, rbm, lr, sampler=sampler, optimizer=optimizer,
+                                                          energies=energia_por_epoca,
+                                                          **snapshots.state()):
+                break
+        if checkpoint is not None and not checkpoint.stop_requested and energia_por_epoca:
+            checkpoint.finish(len(energia_por_epoca) - 1, rbm, optimizer.lr, sampler=sampler, optimizer=optimizer,
+                              energies=energia_por_epoca, **snapshots.state())
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+        if own_pool:
+            parallel.close()
+        telemetry.close()
+        profiler.stop()
+    profiler.report()
+
+    _, a_hist, b_hist, W_hist = snapshots.history()
     return energia_por_epoca, a_hist, b_hist, W_hist
 
 # ----------------- Gráfico -----------------
-def plot_energia(energia_por_epoca):
-    """Summary
+def plot_energia(energia_por_epoca, path=None):
+    """Curva de ⟨H⟩ por época numa figura Agg (sem janela); com ``path`` grava a imagem.
+
+    Para relatórios completos a partir de um log, ver reporting.py.
     """
-    plt.figure(figsize=(10, 5))
-    plt.plot(energia_por_epoca, label="⟨H⟩ durante o treino", color='mediumblue')
-    plt.axhline(energia_por_epoca[-1], linestyle='--', color='gray', label='Energia final')
-    plt.xlabel("Época")
-    plt.ylabel("Energia ⟨H⟩ (Ha)")
-    plt.title("Convergência da Energia com RBM Variacional")
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+    from reporting import plot_energia_avancada
+
+    fig = plot_energia_avancada(energia_por_epoca, title="Convergência da Energia com RBM Variacional")
+    if path is not None:
+        fig.savefig(path)
+    return fig
 
 
 
@@ -0,0 +1,294 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+"""Relatórios do treino da RBM, desacoplados do treino.
+
+Os drivers só gravam o log (``save_training_log``: histórico de energia,
+cópias dos parâmetros e referências como E_FCI e repulsão nuclear). As
+figuras são geradas depois, a partir do log, com o backend Agg (sem
+janela, sem ``plt.show``), por outro processo:
+
+    python reporting.py logs/main_h2.npz --out figuras
+
+ou, de dentro de um driver, ``render_in_background(log)``, que dispara
+esse mesmo comando sem esperar a renderização terminar.
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+import numpy as np
+
+FIGURE_FORMATS = ("png", "pdf", "svg")
+
+
+# ----------------- Log de treino -----------------
+def save_training_log(path, energies, a_hist=None, b_hist=None, W_hist=None, **meta):
+    """Grava o log de um treino (escrita atômica).
+
+    Args:
+        path (str): Arquivo ``.npz``.
+        energies (array_like): ⟨H⟩ por época (eletrônica, sem a repulsão nuclear).
+        a_hist, b_hist, W_hist (array_like, optional): Cópias dos parâmetros,
+            shapes (K, n_v), (K, n_h) e (K, n_v, n_h).
+        **meta: Escalares/strings serializáveis em JSON (ex.: e_fci, e_nuc,
+            molecule, title, threshold, window).
+
+    Returns:
+        str: ``path``.
+    """
+    arrays = {"energies": np.asarray(energies, dtype=float).reshape(-1)}
+    for name, hist in (("a_hist", a_hist), ("b_hist", b_hist), ("W_hist", W_hist)):
+        if hist is not None and np.size(hist):
+            arrays[name] = np.asarray(hist, dtype=float)
+    meta = {key: value.item() if isinstance(value, np.generic) else value for key, value in meta.items()}
+    arrays["meta"] = np.array(json.dumps(meta))
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+    return path
+
+
+def load_training_log(path):
+    """Lê um log gravado com ``save_training_log``.
+
+    Returns:
+        dict: ``energies``, ``a_hist``/``b_hist``/``W_hist`` (ou None) e ``meta``.
+    """
+    with np.load(path) as data:
+        log = {name: data[name] if name in data.files else None
+               for name in ("energies", "a_hist", "b_hist", "W_hist")}
+        log["meta"] = json.loads(str(data["meta"])) if "meta" in data.files else {}
+    return log
+
+
+# ----------------- Análise -----------------
+def find_sustained_chemical_accuracy(energies, threshold=1e-3, window=10):
+    """Primeira época a partir da qual |E_{i+1} − E_i| < threshold por ``window`` passos seguidos.
+
+    Returns:
+        int or None: Época encontrada ou None se a energia não estabilizou.
+    """
+    stable = np.abs(np.diff(np.asarray(energies, dtype=float))) < threshold
+    if len(stable) < window:
+        return None
+    runs = np.convolve(stable, np.ones(window, dtype=int), mode="valid")
+    hits = np.flatnonzero(runs == window)
+    return int(hits[0]) if len(hits) else None
+
+
+# ----------------- Figuras -----------------
+def _figure(figsize):
+    """Figura ligada direto a um canvas Agg (não passa pelo pyplot).
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def plot_energia_avancada(energia_por_epoca, energia_fci=None, energia_nuc=0.0, threshold=1.6e-3,
+                          title="Convergência da energia com RBM"):
+    """Energia total ⟨H⟩ + E_nuc por época, com a referência FCI e a convergência.
+
+    A época de convergência é a primeira com |E − E_FCI| < ``threshold``
+    (precisão química); sem E_FCI, a de ``find_sustained_chemical_accuracy``.
+
+    Returns:
+        matplotlib.figure.Figure: Figura pronta para ``savefig``.
+    """
+    energia_total = np.asarray(energia_por_epoca, dtype=float) + energia_nuc
+    energia_final = energia_total[-1]
+    if energia_fci is not None:
+        hits = np.flatnonzero(np.abs(energia_total - (energia_fci + energia_nuc)) < threshold)
+        epoca_convergencia = int(hits[0]) if len(hits) else None
+    else:
+        epoca_convergencia = find_sustained_chemical_accuracy(energia_total, threshold)
+
+    fig = _figure((10, 6))
+    ax = fig.add_subplot()
+    ax.plot(energia_total, label=f"⟨H⟩ durante o treino (final = {energia_final:.6f} Ha)", color="steelblue")
+    if energia_fci is not None:
+        energia_fci_total = energia_fci + energia_nuc
+        ax.axhline(energia_fci_total, linestyle="--", color="gray",
+                   label=f"Energia FCI + nuclear ({energia_fci_total:.6f} Ha)")
+    if epoca_convergencia is not None:
+        ax.axvline(epoca_convergencia, linestyle=":", color="black",
+                   label=f"Convergência (época {epoca_convergencia})")
+        ax.annotate(f"{energia_total[epoca_convergencia]:.6f} Ha",
+                    xy=(epoca_convergencia, energia_total[epoca_convergencia]), xytext=(-60, -40),
+                    textcoords="offset points", arrowprops=dict(arrowstyle="->", color="black"), fontsize=10)
+    ax.set_title(title)
+    ax.set_xlabel("Época")
+    ax.set_ylabel("Energia Total (Ha)")
+    ax.grid(True)
+    ax.legend()
+    fig.tight_layout()
+    return fig
+
+
+def plot_parametros(a_hist, b_hist, W_hist, max_weights=6):
+    """Evolução dos bias visíveis, dos bias ocultos e de alguns pesos.
+
+    Returns:
+        matplotlib.figure.Figure: Figura pronta para ``savefig``.
+    """
+    a_hist = np.asarray(a_hist)
+    b_hist = np.asarray(b_hist)
+    W_hist = np.asarray(W_hist)  # shape: (épocas, n_v, n_h)
+
+    fig = _figure((14, 6))
+    axes = fig.subplots(1, 3)
+    axes[0].plot(a_hist)
+    axes[0].set_title("Evolução dos Bias Visíveis (a)")
+    axes[1].plot(b_hist)
+    axes[1].set_title("Evolução dos Bias Ocultos (b)")
+    # só os primeiros pesos, na ordem de W.flatten()
+    axes[2].plot(W_hist.reshape(len(W_hist), -1)[:, :max_weights])
+    axes[2].set_title("Evolução dos Pesos (W)")
+    for ax in axes:
+        ax.set_xlabel("Época")
+        ax.grid(True)
+    fig.tight_layout()
+    return fig
+
+
+def plot_energy_convergence(energies, fci_energy=None, threshold=1e-3, window=10,
+                            title="RBM energy convergence with Stochastic Reconfiguration"):
+    """Curva de energia com a referência FCI e a faixa de estabilização.
+
+    Returns:
+        matplotlib.figure.Figure: Figura pronta para ``savefig``.
+    """
+    energies = np.asarray(energies, dtype=float)
+    chem_epoch = find_sustained_chemical_accuracy(energies, threshold, window)
+
+    fig = _figure((8, 5))
+    ax = fig.add_subplot()
+    ax.plot(energies, label="Energy ⟨H⟩", color="royalblue")
+    if fci_energy is not None:
+        ax.axhline(fci_energy, color="gray", linestyle="--", label="FCI Energy")
+        ax.text(max(len(energies) - 50, 0), fci_energy + 0.01, f"FCI = {fci_energy:.6f} Ha", color="gray",
+                fontsize=9)
+    if chem_epoch is not None:
+        stable = energies[chem_epoch:]
+        ax.fill_between([chem_epoch, len(energies) - 1], stable.min(), stable.max(), color="orange", alpha=0.2,
+                        label=f"Stabilization band (ΔE < {threshold:.0e})")
+        ax.axvline(chem_epoch, color="purple", linestyle="--", label="Chemical accuracy reached")
+        ax.text(chem_epoch + 10, energies[chem_epoch] + 0.01, f"ΔE < {threshold:.0e} at epoch {chem_epoch}",
+                color="purple", fontsize=9)
+    ax.set_title(title)
+    ax.set_xlabel("Epoch")
+    ax.set_ylabel("Energy (Ha)")
+    ax.legend()
+    ax.grid(True)
+    fig.tight_layout()
+    return fig
+
+
+# ----------------- Relatório -----------------
+def render_report(log_path, out_dir=None, fmt="png"):
+    """Gera as figuras de um log de treino.
+
+    Figuras: ``<log>_energia`` (energia total e convergência),
+    ``<log>_parametros`` (se o log tiver cópias dos parâmetros) e
+    ``<log>_fci`` (se o log tiver ``e_fci``).
+
+    Args:
+        log_path (str): Log de ``save_training_log``.
+        out_dir (str, optional): Pasta das figuras (padrão: a do log).
+        fmt (str, optional): Formato das imagens.
+
+    Returns:
+        list: Caminhos das figuras gravadas.
+    """
+    if fmt not in FIGURE_FORMATS:
+        raise ValueError(f"Formato '{fmt}' não suportado (opções: {FIGURE_FORMATS})")
+    log = load_training_log(log_path)
+    meta = log["meta"]
+    energies = log["energies"]
+    if energies is None or len(energies) == 0:
+        raise ValueError(f"{log_path} não tem histórico de energia")
+    out_dir = out_dir or os.path.dirname(log_path) or "."
+    os.makedirs(out_dir, exist_ok=True)
+    stem = os.path.join(out_dir, os.path.splitext(os.path.basename(log_path))[0])
+    title = meta.get("title", "Convergência da energia com RBM")
+
+    figures = {"energia": plot_energia_avancada(energies, meta.get("e_fci"), meta.get("e_nuc") or 0.0,
+                                                title=title)}
+    if all(log[name] is not None for name in ("a_hist", "b_hist", "W_hist")):
+        figures["parametros"] = plot_parametros(log["a_hist"], log["b_hist"], log["W_hist"])
+    if meta.get("e_fci") is not None:
+        figures["fci"] = plot_energy_convergence(energies, meta["e_fci"], meta.get("threshold", 1e-3),
+                                                 meta.get("window", 10), title=title)
+
+    paths = []
+    for name, fig in figures.items():
+        path = f"{stem}_{name}.{fmt}"
+        fig.savefig(path)
+        paths.append(path)
+    return paths
+
+
+def render_in_background(log_path, out_dir=None, fmt="png"):
+    """Renderiza o relatório num processo separado, sem esperar.
+
+    O processo filho roda a linha de comando deste módulo numa sessão
+    própria, então o driver pode terminar antes das figuras.
+
+    Returns:
+        subprocess.Popen: Processo de renderização.
+    """
+    command = [sys.executable, os.path.abspath(__file__), log_path, "--format", fmt]
+    if out_dir is not None:
+        command += ["--out", out_dir]
+    env = dict(os.environ, MPLBACKEND="Agg")
+    return subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, start_new_session=True)
+
+
+# ----------------- Linha de comando -----------------
+def parse_args(argv=None):
+    """Summary
+    """
+    parser = argparse.ArgumentParser(description="Figuras de convergência a partir de logs de treino da RBM.")
+    parser.add_argument("logs", nargs="+", help="logs .npz gravados com save_training_log")
+    parser.add_argument("--out", default=None, help="pasta das figuras (padrão: a do log)")
+    parser.add_argument("--format", default="png", choices=FIGURE_FORMATS)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Summary
+    """
+    args = parse_args(argv)
+    for log_path in args.logs:
+        for path in render_report(log_path, args.out, args.format):
+            print(f"🖼️ {path}")
+
+
+if __name__ == "__main__":
+    main()
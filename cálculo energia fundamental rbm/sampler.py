@@ -0,0 +1,224 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import numpy as np
+from config_index import as_configs, unpack_codes
+from symmetry import SymmetrySector
+
+# ----------------- Amostrador de Metropolis -----------------
+class MetropolisSampler:
+
+    """Metropolis–Hastings em |Ψ(σ)|² que conserva o número de partículas.
+
+    Cada passo propõe, para todas as cadeias de uma vez, mover um elétron
+    de um sítio ocupado para um sítio vazio (troca 1 ↔ 0). Com
+    ``spin_conserving=True`` a troca é feita dentro do mesmo canal de spin,
+    assumindo a ordem intercalada do OpenFermion (sítios pares = α,
+    ímpares = β), o que conserva N_α e N_β separadamente.
+
+    Com ``orbsym`` (irreps abelianas dos orbitais espaciais, ver
+    symmetry.load_orbsym) as cadeias ficam num irrep fixo: as trocas já
+    conservam o spin, metade dos passos move um elétron α e um β ao mesmo
+    tempo (trocas simples só ligam orbitais do mesmo irrep) e propostas
+    que mudam o irrep são rejeitadas. As propostas continuam simétricas.
+
+    Attributes:
+        rbm (RBM): Modelo com ``log_psi_batch``.
+        n_electrons (int): Número de partículas.
+        n_chains (int): Número de cadeias avançadas em paralelo.
+        n_burn_in (int): Passos descartados após (re)inicializar as cadeias.
+        thin (int): Passos entre duas amostras guardadas.
+        spin_conserving (bool): Restringe trocas ao mesmo spin.
+        sector (SymmetrySector or None): Setor de simetria com ``orbsym``.
+        cache (AngleCache): Estado das cadeias com os ângulos efetivos θ; a
+            razão de aceitação de cada troca custa O(n_hidden).
+    """
+
+    def __init__(self, rbm, n_electrons, n_chains=16, n_burn_in=100, thin=None,
+                 spin_conserving=False, n_alpha=None, seed=None, orbsym=None, irrep=None):
+        """Summary
+
+        Args:
+            orbsym (np.ndarray, optional): Irreps dos orbitais espaciais.
+            irrep (int, optional): Irrep das cadeias (padrão: o da referência).
+        """
+        self.rbm = rbm
+        self.n_visible = rbm.n_visible
+        self.n_electrons = int(n_electrons)
+        self.n_chains = int(n_chains)
+        self.n_burn_in = int(n_burn_in)
+        self.thin = int(thin) if thin is not None else self.n_visible
+        self.spin_conserving = spin_conserving
+        self.n_alpha = n_alpha if n_alpha is not None else (self.n_electrons + 1) // 2
+        self.rng = np.random.default_rng(seed)
+        self.sector = None
+        if orbsym is not None:
+            self.spin_conserving = True
+            self.sector = SymmetrySector(self.n_visible // 2, self.n_alpha, self.n_electrons - self.n_alpha,
+                                         orbsym, irrep)
+            self._site_irreps = np.repeat(self.sector.orbsym, 2)
+
+        self.n_proposed = 0
+        self.n_accepted = 0
+        self.cache = None
+        self._burned_in = False
+
+    # ----------------- Estado das cadeias -----------------
+    def random_configurations(self, n):
+        """Configurações aleatórias uniformes dentro do setor.
+        """
+        if self.sector is not None:
+            return unpack_codes(self.sector.random(n, self.rng), self.n_visible)
+        configs = np.zeros((n, self.n_visible))
+        if self.spin_conserving:
+            alpha = np.arange(0, self.n_visible, 2)
+            beta = np.arange(1, self.n_visible, 2)
+            n_beta = self.n_electrons - self.n_alpha
+            for row in configs:
+                row[self.rng.choice(alpha, self.n_alpha, replace=False)] = 1
+                row[self.rng.choice(beta, n_beta, replace=False)] = 1
+        else:
+            for row in configs:
+                row[self.rng.choice(self.n_visible, self.n_electrons, replace=False)] = 1
+        return configs
+
+    def reset(self, initial=None):
+        """(Re)inicializa as cadeias; o burn-in volta a ser aplicado.
+
+        Args:
+            initial (np.ndarray, optional): Estados iniciais (n_chains, n_visible).
+        """
+        if initial is None:
+            initial = self.random_configurations(self.n_chains)
+        initial = np.array(initial, dtype=float).reshape(self.n_chains, self.n_visible)
+        self.cache = self.rbm.angle_cache(initial)
+        self._burned_in = False
+
+    @property
+    def state(self):
+        """Configurações atuais das cadeias, (n_chains, n_visible).
+        """
+        return None if self.cache is None else self.cache.configs
+
+    def refresh(self):
+        """Recalcula θ do estado atual (após alterar os parâmetros da RBM).
+        """
+        self.cache.refresh()
+
+    @property
+    def acceptance_rate(self):
+        """Fração de propostas aceitas desde a criação.
+        """
+        return self.n_accepted / self.n_proposed if self.n_proposed else 0.0
+
+    # ----------------- Movimentos -----------------
+    def _pick(self, mask):
+        """Escolhe, por cadeia, um índice uniforme entre as posições True de ``mask``.
+
+        Returns:
+            tuple: (índices, válido) — válido é False se a cadeia não tem opção.
+        """
+        scores = np.where(mask, self.rng.random(mask.shape), -1.0)
+        idx = np.argmax(scores, axis=1)
+        return idx, mask[np.arange(len(mask)), idx]
+
+    def propose(self, channel=None):
+        """Propõe uma troca ocupado → vazio para cada cadeia.
+
+        Args:
+            channel (np.ndarray, optional): Canal de spin (0 = α, 1 = β) de
+                cada cadeia; sorteado quando ``spin_conserving``.
+
+        Returns:
+            tuple: (src, dst, valid) com os sítios de origem/destino.
+        """
+        occupied = self.state > 0.5
+        empty = ~occupied
+        if self.spin_conserving:
+            if channel is None:
+                channel = self.rng.integers(0, 2, size=self.n_chains)
+            same_spin = (np.arange(self.n_visible)[None, :] % 2) == np.reshape(channel, (-1, 1))
+            occupied = occupied & same_spin
+            empty = empty & same_spin
+        src, ok_src = self._pick(occupied)
+        dst, ok_dst = self._pick(empty)
+        return src, dst, ok_src & ok_dst
+
+    def _propose_flips(self):
+        """Sítios invertidos (n_chains, k) e validade das propostas do passo.
+        """
+        if self.sector is None or self.rng.random() < 0.5:
+            src, dst, valid = self.propose()
+            flips = np.stack([src, dst], axis=1)
+        else:
+            src_a, dst_a, ok_a = self.propose(np.zeros(self.n_chains, dtype=int))
+            src_b, dst_b, ok_b = self.propose(np.ones(self.n_chains, dtype=int))
+            flips = np.stack([src_a, dst_a, src_b, dst_b], axis=1)
+            valid = ok_a & ok_b
+        if self.sector is not None:
+            valid &= np.bitwise_xor.reduce(self._site_irreps[flips], axis=1) == 0
+        return flips, valid
+
+    def step(self):
+        """Um passo de Metropolis em todas as cadeias.
+        """
+        if self.cache is None:
+            self.reset()
+        flips, valid = self._propose_flips()
+        log_ratio = self.cache.log_ratio(np.arange(self.n_chains), flips)
+        log_accept = 2.0 * np.real(log_ratio)
+        accept = valid & (np.log(self.rng.random(self.n_chains)) < log_accept)
+
+        rows = np.flatnonzero(accept)
+        self.cache.accept(rows, flips[rows])
+
+        self.n_proposed += int(np.sum(valid))
+        self.n_accepted += int(np.sum(accept))
+
+    def sample(self, n_samples, packed=False):
+        """Gera ``n_samples`` configurações distribuídas segundo |Ψ|².
+
+        Os ângulos θ das cadeias são recalculados no início (os parâmetros
+        podem ter mudado desde a última chamada) e o burn-in só é aplicado na primeira
+        chamada após ``reset``.
+
+        As amostras são guardadas como códigos uint64 (1 bit por sítio, já
+        mantidos pelo AngleCache); só são desempacotadas se ``packed=False``.
+
+        Returns:
+            np.ndarray: Códigos (n_samples,) — ou (n_samples, n_words) acima
+            de 64 sítios — se ``packed``; senão ocupações (n_samples, n_visible).
+        """
+        if self.cache is None:
+            self.reset()
+        else:
+            self.refresh()
+        if not self._burned_in:
+            for _ in range(self.n_burn_in):
+                self.step()
+            self._burned_in = True
+
+        n_rounds = -(-n_samples // self.n_chains)
+        word_shape = self.cache.codes.shape[1:]
+        samples = np.empty((n_rounds, self.n_chains) + word_shape, dtype=np.uint64)
+        for k in range(n_rounds):
+            for _ in range(self.thin):
+                self.step()
+            samples[k] = self.cache.codes
+        samples = samples.reshape((-1,) + word_shape)[:n_samples]
+        return samples if packed else as_configs(samples, self.n_visible)
@@ -0,0 +1,223 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import numpy as np
+from itertools import combinations
+from pauli_hamiltonian import popcount
+import profiling
+
+# ----------------- Sinais fermiônicos -----------------
+def _below(k):
+    """Máscara uint64 dos modos abaixo de k (os que dão o sinal de Jordan–Wigner).
+    """
+    return np.left_shift(np.uint64(1), k.astype(np.uint64)) - np.uint64(1)
+
+
+def _ladder(codes, k, create):
+    """Aplica a†_k (create=True) ou a_k a determinantes; devolve (novo código, paridade).
+
+    Assume que a operação é permitida (k vazio para a†, ocupado para a).
+    A paridade é o número de elétrons nos modos abaixo de k, como em
+    a†_k = Z_{<k} (X − iY)/2.
+    """
+    k = np.asarray(k)
+    bit = np.left_shift(np.uint64(1), k.astype(np.uint64))
+    return codes ^ bit, popcount(codes & _below(k))
+
+
+# ----------------- Hamiltoniano por Slater–Condon -----------------
+class SlaterCondonHamiltonian:
+
+    """Hamiltoniano eletrônico aplicado direto a determinantes (sem Jordan–Wigner).
+
+    Representa o mesmo operador de ``build_qubit_hamiltonian``,
+
+        H = c₀ + Σ_pq h1[p,q] a†_p a_q + ½ Σ_pqrs eri[p,q,r,s] a†_p a†_q a_s a_r,
+
+    mas gera as conexões de cada determinante |D⟩ pelas regras de
+    Slater–Condon: o próprio D, as simples q → p e as duplas (r, s) → (p, q),
+    com sinais fermiônicos por popcount dos modos abaixo de cada índice.
+    O custo por configuração é O(n_occ²·n_virt²), sem termos de Pauli que
+    saem do setor.
+
+    Com A[p,q,r,s] = ½(v_pqrs − v_qprs − v_pqsr + v_qpsr) (v = eri), os
+    elementos de matriz são
+
+        ⟨D|H|D⟩         = Σ_{i∈D} h_ii + ½ Σ_{i,j∈D} A_ijij
+        ⟨D_q^p|H|D⟩     = ± (h_pq + Σ_{k∈D} A_pkqk)
+        ⟨D_rs^pq|H|D⟩   = ± A_pqrs          (p < q, r < s)
+
+    Tem a mesma interface usada pelos estimadores (``apply``,
+    ``connections``, ``diagonal``, ``constant``, ``n_qubits``), então pode
+    substituir o CompiledPauliHamiltonian nos ``train_rbm_*``.
+
+    Attributes:
+        n_qubits (int): Número de sítios das configurações.
+        n_orb (int): Número de modos com integrais (os demais ficam inertes).
+        constant (complex): Termo constante.
+        h1 (np.ndarray): Integrais de um elétron.
+        A (np.ndarray): Integrais de dois elétrons antissimetrizadas.
+    """
+
+    def __init__(self, h1, eri, n_qubits=None, constant=0.0, tol=1e-12):
+        """Summary
+        """
+        h1 = np.asarray(h1)
+        eri = np.asarray(eri.full_eri() if hasattr(eri, "full_eri") else eri)
+        self.n_orb = h1.shape[0]
+        self.n_qubits = int(self.n_orb if n_qubits is None else n_qubits)
+        if self.n_qubits > 64:
+            raise ValueError(f"SlaterCondonHamiltonian suporta até 64 sítios (recebeu {self.n_qubits})")
+        if self.n_qubits < self.n_orb:
+            raise ValueError(f"n_qubits = {self.n_qubits} é menor que o número de orbitais ({self.n_orb})")
+        self.constant = complex(constant)
+        self.tol = tol
+
+        # mesma triagem dos drivers: |h1| > tol e |½ eri| > tol
+        self.h1 = np.where(np.abs(h1) > tol, h1, 0)
+        v = np.where(np.abs(0.5 * eri) > tol, eri, 0)
+        self.A = 0.5 * (v - v.transpose(1, 0, 2, 3) - v.transpose(0, 1, 3, 2) + v.transpose(1, 0, 3, 2))
+
+        n = self.n_orb
+        idx = np.arange(n)
+        # J[p, q, k] = A[p, k, q, k] (termo de campo médio das simples)
+        self._J = np.einsum("pkqk->pqk", self.A)
+        # D[i, j] = A[i, j, i, j] (parte de dois corpos da diagonal)
+        self._D = self.A[idx[:, None], idx[None, :], idx[:, None], idx[None, :]]
+        self._h_diag = np.diag(self.h1)
+        self.dtype = np.result_type(self.h1, self.A, float)
+
+    # ----------------- Ocupações -----------------
+    def _occupations(self, codes):
+        """Ocupações 0/1 dos modos ativos, shape (N, n_orb).
+        """
+        shifts = np.arange(self.n_orb, dtype=np.uint64)
+        return ((codes[:, None] >> shifts) & np.uint64(1)).astype(np.int64)
+
+    def max_connections(self, n_electrons):
+        """Largura da tabela de ``apply`` para um setor de ``n_electrons`` (diagonal + simples + duplas).
+        """
+        n_o = min(n_electrons, self.n_orb)
+        widths = []
+        for occ in range(max(0, n_o - (self.n_qubits - self.n_orb)), n_o + 1):
+            virt = self.n_orb - occ
+            widths.append(1 + occ * virt + (occ * (occ - 1) // 2) * (virt * (virt - 1) // 2))
+        return max(widths)
+
+    def diagonal(self, codes):
+        """Elementos diagonais ⟨D|H|D⟩ (incluindo o termo constante).
+        """
+        codes = np.asarray(codes, dtype=np.uint64).reshape(-1)
+        occ = self._occupations(codes)
+        diag = occ @ self._h_diag + 0.5 * np.einsum("ni,ij,nj->n", occ, self._D, occ)
+        return self.constant + diag
+
+    def _excitations(self, codes, occ):
+        """Conexões de um bloco de determinantes com o mesmo número de elétrons ativos.
+
+        Returns:
+            tuple: (conn, mels) com shape (M, 1 + n_simples + n_duplas).
+        """
+        M = len(codes)
+        n_o = int(occ[0].sum()) if M else 0
+        order = np.argsort(-occ, axis=1, kind="stable")
+        occ_idx = order[:, :n_o]                    # modos ocupados (M, n_o)
+        virt_idx = order[:, n_o:]                   # modos vazios (M, n_v)
+        n_v = self.n_orb - n_o
+
+        diag = occ @ self._h_diag + 0.5 * np.einsum("ni,ij,nj->n", occ, self._D, occ)
+        conns, mels = [codes[:, None]], [diag[:, None].astype(self.dtype)]
+
+        # Simples q → p: ± (h_pq + Σ_k∈D A_pkqk)
+        if n_o and n_v:
+            i, a = np.divmod(np.arange(n_o * n_v), n_v)
+            q = occ_idx[:, i]
+            p = virt_idx[:, a]
+            fock = occ @ self._J.reshape(-1, self.n_orb).T        # (M, n²)
+            value = self.h1[p, q] + np.take_along_axis(fock, p * self.n_orb + q, axis=1)
+            c = np.repeat(codes[:, None], len(i), axis=1)
+            c, s1 = _ladder(c, q, create=False)
+            c, s2 = _ladder(c, p, create=True)
+            conns.append(c)
+            mels.append(value * (1 - 2 * ((s1 + s2) & 1)))
+
+        # Duplas (r, s) → (p, q) com r < s, p < q: ± A_pqrs
+        if n_o >= 2 and n_v >= 2:
+            occ_pairs = np.array(list(combinations(range(n_o), 2)))
+            virt_pairs = np.array(list(combinations(range(n_v), 2)))
+            io, iv = np.divmod(np.arange(len(occ_pairs) * len(virt_pairs)), len(virt_pairs))
+            r = occ_idx[:, occ_pairs[io, 0]]
+            s = occ_idx[:, occ_pairs[io, 1]]
+            p = virt_idx[:, virt_pairs[iv, 0]]
+            q = virt_idx[:, virt_pairs[iv, 1]]
+            value = self.A[p, q, r, s]
+            # a†_p a†_q a_s a_r: aplica da direita para a esquerda
+            c = np.repeat(codes[:, None], len(io), axis=1)
+            c, s1 = _ladder(c, r, create=False)
+            c, s2 = _ladder(c, s, create=False)
+            c, s3 = _ladder(c, q, create=True)
+            c, s4 = _ladder(c, p, create=True)
+            conns.append(c)
+            mels.append(value * (1 - 2 * ((s1 + s2 + s3 + s4) & 1)))
+
+        return np.concatenate(conns, axis=1), np.concatenate(mels, axis=1)
+
+    # ----------------- Interface dos estimadores -----------------
+    def apply(self, codes, chunk_size=4096):
+        """Tabelas (conn, mels) de H|D⟩ sem o termo constante (como CompiledPauliHamiltonian.apply).
+
+        Determinantes com o mesmo número de elétrons ativos têm o mesmo
+        número de conexões; quando o lote mistura setores as linhas mais
+        curtas são completadas com o próprio D e elemento zero.
+
+        Returns:
+            tuple: (conn, mels) com shape (N, W).
+        """
+        codes = np.asarray(codes, dtype=np.uint64).reshape(-1)
+        occ = self._occupations(codes)
+        counts = occ.sum(axis=1)
+        blocks = []
+        for n_o in np.unique(counts):
+            rows = np.flatnonzero(counts == n_o)
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start:start + chunk_size]
+                blocks.append((chunk,) + self._excitations(codes[chunk], occ[chunk]))
+
+        width = max((b[1].shape[1] for b in blocks), default=1)
+        conn = np.repeat(codes[:, None], width, axis=1)
+        mels = np.zeros((len(codes), width), dtype=self.dtype)
+        for chunk, c, m in blocks:
+            conn[chunk, :c.shape[1]] = c
+            mels[chunk, :m.shape[1]] = m
+        return conn, mels
+
+    def connections(self, codes, tol=1e-14, chunk_size=4096, particle_conserving=True):
+        """Lista esparsa (COO) de H|D⟩ sem o termo constante.
+
+        As conexões já conservam o número de partículas; o argumento
+        ``particle_conserving`` existe só para manter a interface.
+
+        Returns:
+            tuple: (rows, conn, mels).
+        """
+        conn, mels = self.apply(codes, chunk_size)
+        keep = np.abs(mels) > tol
+        rows = np.nonzero(keep)[0]
+        profiling.count("connections_generated", len(rows))
+        profiling.count("connections_discarded", keep.size - len(rows))
+        return rows, conn[keep], mels[keep]
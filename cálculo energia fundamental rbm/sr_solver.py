@@ -0,0 +1,186 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import inspect
+import numpy as np
+
+# ----------------- Stochastic Reconfiguration sem formar S -----------------
+def centered_jacobian(O, weights=None):
+    """Ō = √p (O − ⟨O⟩), de modo que S = ŌᴴŌ.
+
+    Args:
+        O (np.ndarray): Derivadas logarítmicas (N, n_params).
+        weights (np.ndarray, optional): Pesos normalizados; uniformes se omitidos.
+
+    Returns:
+        np.ndarray: Matriz (N, n_params) centrada e ponderada.
+    """
+    if weights is None:
+        weights = np.full(len(O), 1.0 / len(O))
+    return np.sqrt(weights)[:, None] * (O - weights @ O)
+
+
+def _krylov(method, A, b, x0, tol, maxiter, callback):
+    """Chama cg/minres do SciPy aceitando tanto ``rtol`` (novo) quanto ``tol`` (antigo).
+    """
+    kwargs = dict(x0=x0, maxiter=maxiter, callback=callback)
+    if "rtol" in inspect.signature(method).parameters:
+        kwargs["rtol"] = tol
+    else:
+        kwargs["tol"] = tol
+    return method(A, b, **kwargs)
+
+
+class SRSolver:
+
+    """Resolve (S + λI) δ = g sem montar S explicitamente.
+
+    Métodos disponíveis:
+        - 'cg' / 'minres': Krylov com S·v = Ōᴴ(Ō v) + λv, custo O(N·n_params)
+          por iteração e memória O(N·n_params); parte da solução da época
+          anterior (warm start).
+        - 'minsr': truque do kernel, resolve no espaço das amostras
+          δ = Ōᴴ (ŌŌᴴ + λI)⁻¹ ε, com ε = √p (E_loc − ⟨H⟩); indicado quando
+          n_amostras < n_params.
+        - 'dense': forma S (n_params²), como no código original.
+
+    Attributes:
+        method (str): Um de 'cg', 'minres', 'minsr', 'dense'.
+        diag_shift (float): Deslocamento diagonal λ.
+        tol (float): Tolerância relativa dos métodos de Krylov.
+        maxiter (int or None): Máximo de iterações de Krylov.
+        warm_start (bool): Usa o δ anterior como chute inicial.
+        x0 (np.ndarray or None): Último δ (ponto de partida da próxima chamada).
+        last_iterations (int): Iterações gastas na última chamada.
+    """
+
+    METHODS = ("cg", "minres", "minsr", "dense")
+
+    def __init__(self, method="cg", diag_shift=1e-4, tol=1e-8, maxiter=None, warm_start=True):
+        """Summary
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Método SR desconhecido: {method!r} (opções: {', '.join(self.METHODS)})")
+        self.method = method
+        self.diag_shift = diag_shift
+        self.tol = tol
+        self.maxiter = maxiter
+        self.warm_start = warm_start
+        self.x0 = None
+        self.last_iterations = 0
+
+    def solve(self, O, grad, weights=None, E_loc=None):
+        """Calcula δ = (S + λI)⁻¹ g.
+
+        Args:
+            O (np.ndarray): Derivadas logarítmicas (N, n_params).
+            grad (np.ndarray): Gradiente da energia, shape (n_params,).
+            weights (np.ndarray, optional): Pesos normalizados (enumeração exata).
+            E_loc (np.ndarray, optional): Energias locais; obrigatórias para 'minsr'.
+
+        Returns:
+            np.ndarray: Atualização δ, shape (n_params,).
+        """
+        O_bar = centered_jacobian(O, weights)
+        if self.method == "dense":
+            S = np.conj(O_bar.T) @ O_bar + self.diag_shift * np.eye(O_bar.shape[1])
+            delta = np.linalg.solve(S, grad)
+            self.last_iterations = 0
+        elif self.method == "minsr":
+            delta = self._solve_minsr(O_bar, weights, E_loc)
+        else:
+            delta = self._solve_krylov(O_bar, grad)
+        delta = np.real_if_close(delta)
+        self.x0 = delta.copy()
+        return delta
+
+    def solve_matvec(self, matvec, grad, s_matrix=None):
+        """Calcula δ = (S + λI)⁻¹ g com S disponível só como produto S·v.
+
+        Usado quando as derivadas estão distribuídas (ver ParallelEstimator):
+        'cg'/'minres' chamam ``matvec`` a cada iteração; 'dense' pede a
+        matriz completa a ``s_matrix()``. 'minsr' precisa de todas as
+        amostras num só lugar e não é suportado aqui.
+
+        Args:
+            matvec (callable): v ↦ S·v (sem o deslocamento λ).
+            grad (np.ndarray): Gradiente da energia, shape (n_params,).
+            s_matrix (callable, optional): Devolve S (n_params × n_params).
+
+        Returns:
+            np.ndarray: Atualização δ, shape (n_params,).
+        """
+        if self.method == "minsr":
+            raise ValueError("O método 'minsr' não funciona com S distribuída; use 'cg', 'minres' ou 'dense'")
+        if self.method == "dense":
+            if s_matrix is None:
+                raise ValueError("O método 'dense' precisa de s_matrix()")
+            S = s_matrix() + self.diag_shift * np.eye(len(grad))
+            delta = np.linalg.solve(S, grad)
+            self.last_iterations = 0
+        else:
+            delta = self._krylov_solve(matvec, grad, np.result_type(grad, float))
+        delta = np.real_if_close(delta)
+        self.x0 = delta.copy()
+        return delta
+
+    def _solve_minsr(self, O_bar, weights, E_loc):
+        """Resolve no espaço das amostras (N × N) em vez de n_params × n_params.
+        """
+        if E_loc is None:
+            raise ValueError("O método 'minsr' precisa das energias locais (E_loc)")
+        if weights is None:
+            weights = np.full(len(E_loc), 1.0 / len(E_loc))
+        eps = np.sqrt(weights) * (E_loc - np.sum(weights * E_loc))
+        T = O_bar @ np.conj(O_bar.T) + self.diag_shift * np.eye(len(O_bar))
+        self.last_iterations = 0
+        return np.conj(O_bar.T) @ np.linalg.solve(T, eps)
+
+    def _solve_krylov(self, O_bar, grad):
+        """CG/MINRES com o produto S·v aplicado como Ōᴴ(Ō v).
+        """
+        O_bar_h = np.conj(O_bar.T)
+        return self._krylov_solve(lambda v: O_bar_h @ (O_bar @ v), grad, np.result_type(O_bar, grad))
+
+    def _krylov_solve(self, s_matvec, grad, dtype):
+        """CG/MINRES em (S + λI) δ = g dado o produto v ↦ S·v.
+        """
+        # o scipy.sparse.linalg só é importado quando um solver de Krylov roda
+        from scipy.sparse.linalg import LinearOperator, cg, minres
+
+        n_params = len(grad)
+
+        def matvec(v):
+            return s_matvec(v) + self.diag_shift * v
+
+        S = LinearOperator((n_params, n_params), matvec=matvec, dtype=dtype)
+        x0 = self.x0 if self.warm_start and self.x0 is not None and self.x0.shape == grad.shape else None
+
+        iterations = [0]
+
+        def count(_):
+            iterations[0] += 1
+
+        method = cg if self.method == "cg" else minres
+        delta, info = _krylov(method, S, grad, x0, self.tol, self.maxiter, count)
+        self.last_iterations = iterations[0]
+        if info > 0:
+            print(f"⚠️ SR ({self.method}) não convergiu em {info} iterações")
+        elif info < 0:
+            raise np.linalg.LinAlgError(f"SR ({self.method}) falhou (info = {info})")
+        return delta
@@ -0,0 +1,486 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import numpy as np
+from config_index import Sector, sector_codes, rank_ranges, as_codes, unpack_codes
+from pauli_hamiltonian import popcount
+from rbm_batch import BatchRBMMixin, AngleCache
+from integral_store import IntegralStore, spin_orbital_block
+
+# Sítios pares = α, ímpares = β (ordem intercalada do OpenFermion)
+EVEN_BITS = np.uint64(0x5555555555555555)
+
+
+# ----------------- Integrais em spin-orbitais -----------------
+def spin_orbital_integrals(h1, eri):
+    """Expande integrais de orbitais espaciais para spin-orbitais intercalados.
+
+    Os arquivos de integrais guardam ``eri`` na notação química (pq|rs) do
+    PySCF (``ao2mo.restore(1, ...)``); os construtores de Hamiltoniano usam
+    o coeficiente de ½ a†_p a†_q a_s a_r, isto é, ⟨pq|rs⟩ = (pr|qs). O
+    spin-orbital 2p é α e 2p+1 é β:
+
+        h1_so[2p+σ, 2q+σ]               = h1[p, q]
+        eri_so[2p+σ, 2q+τ, 2r+σ, 2s+τ]  = (pr|qs)
+
+    Args:
+        h1 (np.ndarray): Integrais de um elétron (n_orb, n_orb).
+        eri (np.ndarray | IntegralStore): Integrais de dois elétrons (pq|rs),
+            (n_orb,)*4, ou o arquivo empacotado (desempacotado aqui).
+
+    Returns:
+        tuple: (h1_so, eri_so) com 2·n_orb modos.
+    """
+    h1_so = np.kron(np.asarray(h1), np.eye(2))
+    eri_so = spin_orbital_block(eri.full_eri() if hasattr(eri, "full_eri") else eri)
+    return h1_so, eri_so
+
+
+# ----------------- Irreps dos orbitais -----------------
+def _gf2_nullspace(rows, n):
+    """Base do núcleo em GF(2) das restrições ``rows`` (máscaras de bits sobre n variáveis).
+    """
+    pivots = {}
+    for row in rows:
+        row = int(row)
+        for bit, pivot_row in pivots.items():
+            if row >> bit & 1:
+                row ^= pivot_row
+        if row:
+            bit = row.bit_length() - 1
+            for other in pivots:
+                if pivots[other] >> bit & 1:
+                    pivots[other] ^= row
+            pivots[bit] = row
+    basis = []
+    for free in range(n):
+        if free in pivots:
+            continue
+        vector = 1 << free
+        for bit, row in pivots.items():
+            if row >> free & 1:
+                vector |= 1 << bit
+        basis.append(vector)
+    return basis
+
+
+def infer_orbsym(h1, eri, tol=1e-10):
+    """Irreps abelianas dos orbitais deduzidas da esparsidade das integrais.
+
+    Procura o maior grupo Z₂ × … × Z₂ em que todas as integrais não nulas
+    são totalmente simétricas: h1[p,q] ≠ 0 exige g_p = g_q e (pq|rs) ≠ 0
+    exige g_p ⊕ g_q ⊕ g_r ⊕ g_s = 0. Cada vetor da base do núcleo desse
+    sistema em GF(2) é um gerador; a paridade do número de partículas
+    (todos os orbitais com o mesmo bit) é descartada por ser trivial num
+    setor de N fixo, e o primeiro orbital recebe o rótulo 0. Os rótulos seguem a convenção do PySCF para D2h e
+    subgrupos: o irrep de um produto é o XOR dos rótulos.
+
+    Returns:
+        np.ndarray: Rótulo inteiro de cada orbital, shape (n_orb,).
+    """
+    h1 = np.asarray(h1)
+    eri = np.asarray(eri)
+    n = h1.shape[0]
+    bit = np.left_shift(np.uint64(1), np.arange(n, dtype=np.uint64))
+    p, q = np.nonzero(np.abs(h1) > tol)
+    masks = [bit[p] ^ bit[q]]
+    p, q, r, s = np.nonzero(np.abs(eri) > tol)
+    masks.append(bit[p] ^ bit[q] ^ bit[r] ^ bit[s])
+    rows = np.unique(np.concatenate(masks))
+    # descarta a paridade (todos os bits iguais): só geradores independentes dela
+    span = {n - 1: (1 << n) - 1}
+    generators = []
+    for vector in _gf2_nullspace(rows[rows != 0], n):
+        reduced = vector
+        for bit in sorted(span, reverse=True):
+            if reduced >> bit & 1:
+                reduced ^= span[bit]
+        if reduced:
+            span[reduced.bit_length() - 1] = reduced
+            generators.append(vector)
+    orbsym = np.zeros(n, dtype=np.int64)
+    for k, vector in enumerate(generators):
+        orbsym |= np.array([(vector >> i & 1) << k for i in range(n)], dtype=np.int64)
+    # o primeiro orbital fica no irrep totalmente simétrico (0)
+    return orbsym ^ orbsym[0]
+
+
+def load_orbsym(path, infer=True, tol=1e-10):
+    """Irreps dos orbitais de um arquivo de integrais.
+
+    Usa a chave ``orbsym`` quando existe (ex.: ``scf.hf_symm.get_orbsym``
+    do PySCF); senão, com ``infer``, deduz os rótulos das integrais.
+
+    Returns:
+        np.ndarray or None: Rótulos (n_orb,) ou None.
+    """
+    store = IntegralStore(path)
+    if store.orbsym is not None:
+        return store.orbsym
+    if infer:
+        return infer_orbsym(store.h1, store.full_eri(), tol)
+    return None
+
+
+def string_irreps(codes, orbsym):
+    """Irrep (XOR dos rótulos ocupados) de cada código, bit i ↔ orbsym[i].
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    out = np.zeros(codes.shape, dtype=np.int64)
+    for i, label in enumerate(np.asarray(orbsym, dtype=np.int64)):
+        if label:
+            out ^= np.where((codes >> np.uint64(i)) & np.uint64(1), label, 0)
+    return out
+
+
+# ----------------- Canais de spin -----------------
+def interleave_spins(alpha, beta, n_orb):
+    """Códigos de spin-orbitais (bit 2p = α_p, bit 2p+1 = β_p) a partir das strings α e β.
+    """
+    alpha = np.asarray(alpha, dtype=np.uint64)
+    beta = np.asarray(beta, dtype=np.uint64)
+    codes = np.zeros(np.broadcast(alpha, beta).shape, dtype=np.uint64)
+    one = np.uint64(1)
+    for p in range(n_orb):
+        shift = np.uint64(p)
+        codes |= ((alpha >> shift) & one) << np.uint64(2 * p)
+        codes |= ((beta >> shift) & one) << np.uint64(2 * p + 1)
+    return codes
+
+
+def split_spins(codes, n_orb):
+    """Strings (α, β) de códigos de spin-orbitais intercalados.
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    alpha = np.zeros(codes.shape, dtype=np.uint64)
+    beta = np.zeros(codes.shape, dtype=np.uint64)
+    one = np.uint64(1)
+    for p in range(n_orb):
+        alpha |= ((codes >> np.uint64(2 * p)) & one) << np.uint64(p)
+        beta |= ((codes >> np.uint64(2 * p + 1)) & one) << np.uint64(p)
+    return alpha, beta
+
+
+def spin_flip_codes(codes):
+    """Troca α ↔ β em cada orbital: σ → σ̄ e o sinal fermiônico.
+
+    Com a ordem intercalada, U a†_{pα} U† = a†_{pβ} leva |D⟩ em
+    (−1)^{n_duplos} |D̄⟩: só orbitais duplamente ocupados trocam a ordem
+    dos dois operadores de criação.
+
+    Returns:
+        tuple: (códigos de σ̄, sinal ±1).
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    flipped = ((codes & EVEN_BITS) << np.uint64(1)) | ((codes >> np.uint64(1)) & EVEN_BITS)
+    doubles = popcount(codes & (codes >> np.uint64(1)) & EVEN_BITS)
+    return flipped, 1 - 2 * (np.asarray(doubles) % 2)
+
+
+# ----------------- Setor de simetria -----------------
+class SymmetrySector(Sector):
+
+    """Determinantes com N_α e N_β fixos, opcionalmente num irrep e numa paridade de spin-flip.
+
+    O setor é o produto das strings α (C(n_orb, N_α)) e β (C(n_orb, N_β)),
+    agrupado pelo irrep da string α: para cada irrep g entram as strings β
+    de irrep g ⊕ ``irrep``. Só as strings de cada canal são guardadas (a
+    raiz quadrada do tamanho do setor); os determinantes são montados por
+    rank, bloco a bloco, como no Sector. Para LiH em 12 spin-orbitais,
+    S_z = 0 reduz C(12, 4) = 495 determinantes a 225.
+
+    Com ``spin_parity`` (±1, exige N_α = N_β) os determinantes com σ̄ = σ
+    são excluídos na paridade −1, em que a amplitude projetada é
+    identicamente nula (ver SpinFlipProjectedRBM).
+
+    Attributes:
+        n_orb (int): Número de orbitais espaciais.
+        n_alpha, n_beta (int): Elétrons em cada canal de spin.
+        orbsym (np.ndarray or None): Irreps dos orbitais espaciais.
+        irrep (int or None): Irrep do setor.
+        spin_parity (int or None): Autovalor de spin-flip.
+    """
+
+    def __init__(self, n_orb, n_alpha, n_beta, orbsym=None, irrep=None, spin_parity=None, block_size=65536):
+        """Summary
+
+        Args:
+            irrep (int, optional): Irrep alvo; por padrão o do determinante
+                de referência (orbitais mais baixos ocupados em cada canal).
+        """
+        if 2 * n_orb > 64:
+            raise ValueError(f"SymmetrySector suporta até 32 orbitais espaciais (recebeu {n_orb})")
+        if spin_parity is not None and n_alpha != n_beta:
+            raise ValueError("A paridade de spin-flip só é definida com N_α = N_β")
+        self.n_orb = int(n_orb)
+        self.n_alpha = int(n_alpha)
+        self.n_beta = int(n_beta)
+        self.n_sites = 2 * self.n_orb
+        self.n_electrons = self.n_alpha + self.n_beta
+        self.block_size = int(block_size)
+        self.spin_parity = spin_parity
+        self.orbsym = None if orbsym is None else np.asarray(orbsym, dtype=np.int64)
+
+        alpha = sector_codes(self.n_orb, self.n_alpha)
+        beta = sector_codes(self.n_orb, self.n_beta)
+        if self.orbsym is None:
+            self.irrep = None
+            groups = [(alpha, beta)]
+        else:
+            if irrep is None:
+                irrep = int(np.bitwise_xor.reduce(self.orbsym[:self.n_alpha], initial=0)
+                            ^ np.bitwise_xor.reduce(self.orbsym[:self.n_beta], initial=0))
+            self.irrep = int(irrep)
+            g_alpha = string_irreps(alpha, self.orbsym)
+            g_beta = string_irreps(beta, self.orbsym)
+            groups = [(alpha[g_alpha == g], beta[g_beta == g ^ self.irrep]) for g in np.unique(g_alpha)]
+        # σ = σ̄ (α = β) tem amplitude projetada nula na paridade ímpar
+        self._skip_diagonal = spin_parity == -1
+        self._groups = []
+        for a, b in groups:
+            if len(a) == 0 or len(b) == 0:
+                continue
+            diagonal = self._skip_diagonal and np.array_equal(a, b)
+            size = len(a) * (len(b) - 1) if diagonal else len(a) * len(b)
+            if size:
+                self._groups.append((a, b, diagonal))
+        sizes = [len(a) * (len(b) - 1) if d else len(a) * len(b) for a, b, d in self._groups]
+        self._offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+
+    def __len__(self):
+        return int(self._offsets[-1])
+
+    def __getitem__(self, key):
+        """Códigos por rank: inteiro, fatia ou array de ranks.
+        """
+        if isinstance(key, slice):
+            key = np.arange(*key.indices(len(self)), dtype=np.int64)
+        elif np.ndim(key) == 0:
+            key = int(key) + len(self) if int(key) < 0 else int(key)
+            return self[np.array([key])][0]
+        ranks = np.asarray(key, dtype=np.int64)
+        if np.any((ranks < 0) | (ranks >= len(self))):
+            raise IndexError(f"Rank fora do setor (0 ≤ rank < {len(self)})")
+        group = np.searchsorted(self._offsets, ranks, side="right") - 1
+        codes = np.empty(ranks.shape, dtype=np.uint64)
+        for g in np.unique(group):
+            a, b, diagonal = self._groups[g]
+            sel = group == g
+            local = ranks[sel] - self._offsets[g]
+            width = len(b) - 1 if diagonal else len(b)
+            i, j = local // width, local % width
+            if diagonal:
+                j = j + (j >= i)
+            codes[sel] = interleave_spins(a[i], b[j], self.n_orb)
+        return codes
+
+    def blocks(self, block_size=None, start=0, stop=None):
+        """Blocos (primeiro rank, códigos) dos ranks [start, stop).
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        step = block_size or self.block_size
+        for lo in range(start, stop, step):
+            yield lo, self[lo:min(lo + step, stop)]
+
+    def split(self, n_parts):
+        """Intervalos de ranks para dividir o setor entre ``n_parts`` workers.
+        """
+        return rank_ranges(len(self), n_parts)
+
+    def rank(self, codes):
+        """Rank de cada código (−1 fora do setor).
+        """
+        codes = np.asarray(codes, dtype=np.uint64)
+        alpha, beta = split_spins(codes, self.n_orb)
+        ranks = np.full(codes.shape, -1, dtype=np.int64)
+        for g, (a, b, diagonal) in enumerate(self._groups):
+            order_a, order_b = np.argsort(a), np.argsort(b)
+            pos_a = np.minimum(np.searchsorted(a, alpha, sorter=order_a), len(a) - 1)
+            pos_b = np.minimum(np.searchsorted(b, beta, sorter=order_b), len(b) - 1)
+            i, j = order_a[pos_a], order_b[pos_b]
+            found = (a[i] == alpha) & (b[j] == beta)
+            if diagonal:
+                found &= i != j
+                j = j - (j > i)
+            width = len(b) - 1 if diagonal else len(b)
+            ranks = np.where(found, self._offsets[g] + i * width + j, ranks)
+        return ranks
+
+    def random(self, n, rng):
+        """``n`` determinantes uniformes no setor.
+        """
+        return self[rng.integers(0, len(self), size=n)]
+
+
+# ----------------- RBM projetada -----------------
+class SpinFlipProjectedRBM(BatchRBMMixin):
+
+    """RBM com amplitude projetada na paridade de spin-flip:
+
+        Ψ_P(σ) = Ψ(σ) + p · s(σ) · Ψ(σ̄),
+
+    com σ̄ a configuração com α ↔ β e s(σ) = (−1)^{N_α} vezes o sinal de
+    spin_flip_codes. Com N_α = N_β, p = +1 seleciona spin total par
+    (singletos, o estado fundamental das moléculas de camada fechada) e
+    p = −1 spin ímpar (tripletos). Os parâmetros são os mesmos da RBM ([a, b, W])
+    e log Ψ_P é complexo (parte imaginária 0 ou π). Funciona com as somas
+    exatas, com o MetropolisSampler (ProjectedAngleCache) e com os
+    ``train_rbm_*``, até 64 spin-orbitais intercalados.
+
+    Attributes:
+        parity (int): p = ±1.
+    """
+
+    def __init__(self, n_visible, n_hidden, parity=1):
+        """Summary
+        """
+        if n_visible > 64 or n_visible % 2:
+            raise ValueError(f"SpinFlipProjectedRBM precisa de um número par de sítios ≤ 64 (recebeu {n_visible})")
+        if parity not in (1, -1):
+            raise ValueError(f"Paridade de spin-flip deve ser ±1 (recebeu {parity})")
+        self.n_visible = n_visible
+        self.n_hidden = n_hidden
+        self.parity = parity
+        self.a = np.random.randn(n_visible) * 0.01
+        self.b = np.random.randn(n_hidden) * 0.01
+        self.W = np.random.randn(n_visible, n_hidden) * 0.01
+
+    @staticmethod
+    def flip(codes):
+        """(σ̄, s(σ)) com o fator (−1)^{N_α} incluído no sinal.
+        """
+        flipped, sign = spin_flip_codes(codes)
+        n_alpha = popcount(np.asarray(codes, dtype=np.uint64) & EVEN_BITS)
+        return flipped, sign * (1 - 2 * (np.asarray(n_alpha) % 2))
+
+    def _combine(self, log_direct, log_flipped, sign):
+        """log(Ψ(σ) + p·s·Ψ(σ̄)) a partir dos dois log Ψ reais.
+        """
+        shift = np.maximum(log_direct, log_flipped)
+        with np.errstate(divide="ignore"):
+            return shift + np.log((np.exp(log_direct - shift)
+                                   + self.parity * sign * np.exp(log_flipped - shift)).astype(complex))
+
+    def log_psi_batch(self, configs, chunk_size=None):
+        """log Ψ_P(σ) (complexo) para um lote de configurações.
+        """
+        codes = as_codes(configs)
+        flipped, sign = self.flip(codes)
+        return self._combine(BatchRBMMixin.log_psi_batch(self, codes, chunk_size),
+                             BatchRBMMixin.log_psi_batch(self, flipped, chunk_size), sign)
+
+    def iter_log_derivatives(self, configs, chunk_size=None):
+        """Blocos (rows, O) de ∂ log Ψ_P = [Ψ(σ) O(σ) + p·s·Ψ(σ̄) O(σ̄)] / Ψ_P.
+        """
+        codes = as_codes(configs)
+        for rows, O in BatchRBMMixin.iter_log_derivatives(self, codes, chunk_size):
+            flipped, sign = self.flip(codes[rows])
+            _, O_flipped = next(BatchRBMMixin.iter_log_derivatives(self, flipped, len(flipped)))
+            log_direct = BatchRBMMixin.log_psi_batch(self, codes[rows])
+            log_flipped = BatchRBMMixin.log_psi_batch(self, flipped)
+            log_total = self._combine(log_direct, log_flipped, sign)
+            w_direct = np.exp(log_direct - log_total).real
+            w_flipped = (self.parity * sign * np.exp(log_flipped - log_total)).real
+            yield rows, w_direct[:, None] * O + w_flipped[:, None] * O_flipped
+
+    def angle_cache(self, configs):
+        """Cria um ProjectedAngleCache para ``configs``.
+        """
+        return ProjectedAngleCache(self, configs)
+
+
+class ProjectedAngleCache:
+
+    """Par de AngleCache (σ e σ̄) para a RBM projetada por spin-flip.
+
+    Inverter o sítio i de σ inverte o sítio i ⊕ 1 de σ̄, então cada
+    movimento custa duas razões O(k·n_hidden); log Ψ_P é recombinado com o
+    sinal da configuração de destino.
+    """
+
+    def __init__(self, rbm, configs):
+        """Summary
+        """
+        self.rbm = rbm
+        self.direct = AngleCache(rbm, configs)
+        flipped, _ = spin_flip_codes(self.direct.codes)
+        self.flipped = AngleCache(rbm, unpack_codes(flipped, rbm.n_visible))
+        self._update_log_psi()
+
+    def __len__(self):
+        return len(self.direct)
+
+    @property
+    def configs(self):
+        return self.direct.configs
+
+    @property
+    def codes(self):
+        return self.direct.codes
+
+    def _update_log_psi(self):
+        self._log_direct = self.direct.log_psi()
+        self._log_flipped = self.flipped.log_psi()
+        _, sign = self.rbm.flip(self.codes)
+        self._log_psi = self.rbm._combine(self._log_direct, self._log_flipped, sign)
+
+    def refresh(self):
+        """Recalcula θ das duas metades a partir dos parâmetros atuais.
+        """
+        self.direct.refresh()
+        self.flipped.refresh()
+        self._update_log_psi()
+
+    def log_psi(self):
+        return self._log_psi
+
+    def _log_ratio(self, rows, codes, ratio_direct, ratio_flipped):
+        _, sign = self.rbm.flip(codes)
+        log_new = self.rbm._combine(self._log_direct[rows] + ratio_direct,
+                                    self._log_flipped[rows] + ratio_flipped, sign)
+        return log_new - self._log_psi[rows]
+
+    def log_ratio(self, rows, flip_sites):
+        """log Ψ_P(σ') − log Ψ_P(σ) invertendo k bits por linha.
+        """
+        rows = np.asarray(rows)
+        flip_sites = np.asarray(flip_sites).reshape(len(rows), -1)
+        masks = np.bitwise_or.reduce(np.left_shift(np.uint64(1), flip_sites.astype(np.uint64)), axis=1,
+                                     initial=np.uint64(0))
+        return self._log_ratio(rows, self.codes[rows] ^ masks, self.direct.log_ratio(rows, flip_sites),
+                               self.flipped.log_ratio(rows, flip_sites ^ 1))
+
+    def log_ratio_codes(self, rows, codes):
+        """Como log_ratio, mas com as configurações de destino empacotadas.
+        """
+        rows = np.asarray(rows)
+        codes = np.asarray(codes, dtype=np.uint64)
+        flipped, _ = spin_flip_codes(codes)
+        return self._log_ratio(rows, codes, self.direct.log_ratio_codes(rows, codes),
+                               self.flipped.log_ratio_codes(rows, flipped))
+
+    def accept(self, rows, flip_sites):
+        """Aplica os movimentos aceitos nas duas metades.
+        """
+        rows = np.asarray(rows)
+        if len(rows) == 0:
+            return
+        flip_sites = np.asarray(flip_sites).reshape(len(rows), -1)
+        self.direct.accept(rows, flip_sites)
+        self.flipped.accept(rows, flip_sites ^ 1)
+        self._update_log_psi()
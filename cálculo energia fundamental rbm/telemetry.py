@@ -0,0 +1,295 @@
+"""=================================================================================================================================================
+**                                                   Copyright © 2025 Chanah Yocheved Bat Sarah                                                   **
+**                                                                                                                                                **
+**                                                       Author: Chanah Yocheved Bat Sarah                                                        **
+**                                                          Contact: contact@chanah.dev                                                           **
+**                                                                Date: 2025-05-25                                                                **
+**                                                      License: Custom Attribution License                                                       **
+**                                                                                                                                                **
+**    Este projeto reúne temas da pesquisa de mestrado em física de materiais, com o objetivo de conseguir descrever a matéria usando métodos     **
+**                                 computacionais do estado da arte, como computação quântica e machine learning.                                 **
+**                                                                                                                                                **
+**   Permission is granted to use, copy, modify, and distribute this file, provided that this notice is retained in full and that the origin of   **
+**    the software is clearly and explicitly attributed to the original author. Such attribution must be preserved not only within the source     **
+**       code, but also in any accompanying documentation, public display, distribution, or derived work, in both digital or printed form.        **
+**                                                  For licensing inquiries: contact@chanah.dev                                                   **
+====================================================================================================================================================
+"""
+
+import os
+import json
+import time
+import numpy as np
+
+# ----------------- Callbacks de treino -----------------
+class Callback:
+
+    """Interface dos callbacks chamados ao fim de cada época.
+
+    ``metrics`` é um dicionário de escalares (energia, variância, normas do
+    gradiente, taxa de aceitação, tempo da época, ...). Nada de arrays
+    grandes passa por aqui: quem precisa dos parâmetros lê de ``rbm``.
+    """
+
+    def on_epoch(self, epoch, metrics, rbm):
+        """Summary
+        """
+
+    def close(self):
+        """Summary
+        """
+
+
+class JSONLLogger(Callback):
+
+    """Grava uma linha JSON por época num arquivo só de acréscimo.
+
+    As linhas ficam num buffer e vão para o disco a cada ``flush_every``
+    épocas (e no ``close``), então o custo por época é só formatar os
+    escalares. Retomar um treino continua o mesmo arquivo.
+
+    Attributes:
+        path (str): Arquivo ``.jsonl``.
+        flush_every (int): Épocas entre gravações.
+    """
+
+    def __init__(self, path, flush_every=20):
+        """Summary
+        """
+        self.path = str(path)
+        self.flush_every = max(1, int(flush_every))
+        self._buffer = []
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def on_epoch(self, epoch, metrics, rbm):
+        """Summary
+        """
+        record = {"epoch": int(epoch)}
+        record.update({key: float(value) for key, value in metrics.items()})
+        self._buffer.append(json.dumps(record))
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Escreve as linhas pendentes.
+        """
+        if not self._buffer:
+            return
+        with open(self.path, "a") as f:
+            f.write("\n".join(self._buffer) + "\n")
+        self._buffer = []
+
+    def close(self):
+        """Summary
+        """
+        self.flush()
+
+
+def read_jsonl(path):
+    """Lê um log de JSONLLogger como dicionário de arrays por métrica.
+
+    Se o treino foi retomado, épocas repetidas ficam com o último valor.
+    """
+    records = {}
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                records[record["epoch"]] = record
+    epochs = sorted(records)
+    keys = sorted({key for record in records.values() for key in record})
+    return {key: np.array([records[e].get(key, np.nan) for e in epochs]) for key in keys}
+
+
+class ConsoleProgress(Callback):
+
+    """Uma linha de progresso no terminal, com taxa limitada.
+
+    Imprime no máximo a cada ``every`` épocas e nunca mais de uma vez a
+    cada ``min_interval`` segundos; a última época recebida é sempre
+    impressa no ``close``.
+    """
+
+    def __init__(self, every=1, min_interval=0.5):
+        """Summary
+        """
+        self.every = max(1, int(every))
+        self.min_interval = float(min_interval)
+        self._last_time = -np.inf
+        self._pending = None
+
+    @staticmethod
+    def format(epoch, metrics):
+        """Linha de texto de uma época.
+        """
+        line = f"Epoch {epoch + 1:03d} → ⟨H⟩ = {metrics['energy']:.6f} Ha"
+        if "variance" in metrics:
+            line += f" | σ²(E) = {metrics['variance']:.2e}"
+        if "grad_norm" in metrics:
+            line += f" | |g| = {metrics['grad_norm']:.2e}"
+        if "acceptance" in metrics:
+            line += f" | aceitação = {metrics['acceptance']:.2f}"
+        if "step_time" in metrics:
+            line += f" | {1e3 * metrics['step_time']:.1f} ms"
+        return line
+
+    def on_epoch(self, epoch, metrics, rbm):
+        """Summary
+        """
+        now = time.perf_counter()
+        if (epoch + 1) % self.every == 0 and now - self._last_time >= self.min_interval:
+            print(self.format(epoch, metrics))
+            self._last_time = now
+            self._pending = None
+        else:
+            self._pending = (epoch, dict(metrics))
+
+    def close(self):
+        """Summary
+        """
+        if self._pending is not None:
+            print(self.format(*self._pending))
+            self._pending = None
+
+
+class ParameterSnapshots(Callback):
+
+    """Cópias de (a, b, W) a cada ``stride`` épocas num buffer circular.
+
+    O buffer (capacity × n_params) é alocado uma vez na primeira época;
+    com ``path`` ele é um ``.npy`` mapeado em memória, que o sistema
+    operacional descarrega para o disco. Quando enche, as cópias mais
+    antigas são sobrescritas, então a memória não cresce com as épocas.
+
+    Attributes:
+        stride (int): Épocas entre duas cópias.
+        capacity (int): Número máximo de cópias mantidas.
+        path (str or None): Arquivo do memmap (None: memória).
+    """
+
+    def __init__(self, stride=1, capacity=1000, path=None):
+        """Summary
+        """
+        self.stride = max(1, int(stride))
+        self.capacity = max(1, int(capacity))
+        self.path = path
+        self.shape = None
+        self._params = None
+        self._epochs = np.full(self.capacity, -1, dtype=np.int64)
+        self._count = 0
+
+    def _allocate(self, n_visible, n_hidden):
+        """Summary
+        """
+        self.shape = (n_visible, n_hidden)
+        n_params = n_visible + n_hidden + n_visible * n_hidden
+        if self.path is None:
+            self._params = np.zeros((self.capacity, n_params))
+        else:
+            self._params = np.lib.format.open_memmap(self.path, mode="w+", dtype=float,
+                                                     shape=(self.capacity, n_params))
+
+    def append(self, epoch, a, b, W):
+        """Guarda uma cópia dos parâmetros da época ``epoch``.
+        """
+        if self._params is None:
+            self._allocate(len(a), len(b))
+        slot = self._count % self.capacity
+        n_v, n_h = self.shape
+        row = self._params[slot]
+        row[:n_v] = a
+        row[n_v:n_v + n_h] = b
+        row[n_v + n_h:] = np.ravel(W)
+        self._epochs[slot] = epoch
+        self._count += 1
+
+    def on_epoch(self, epoch, metrics, rbm):
+        """Summary
+        """
+        if epoch % self.stride == 0:
+            self.append(epoch, rbm.a, rbm.b, rbm.W)
+
+    def __len__(self):
+        """Número de cópias guardadas.
+        """
+        return min(self._count, self.capacity)
+
+    def history(self):
+        """Cópias em ordem cronológica.
+
+        Returns:
+            tuple: (epochs, a_hist, b_hist, W_hist) com shapes (K,),
+            (K, n_v), (K, n_h) e (K, n_v, n_h).
+        """
+        if self._params is None:
+            empty = np.zeros((0, 0))
+            return np.zeros(0, dtype=np.int64), empty, empty, np.zeros((0, 0, 0))
+        order = (np.arange(len(self)) + max(0, self._count - self.capacity)) % self.capacity
+        params = np.array(self._params[order])
+        n_v, n_h = self.shape
+        return (self._epochs[order].copy(), params[:, :n_v], params[:, n_v:n_v + n_h],
+                params[:, n_v + n_h:].reshape(-1, n_v, n_h))
+
+    def state(self):
+        """Histórico como arrays nomeados (para o Checkpointer).
+        """
+        epochs, a_hist, b_hist, W_hist = self.history()
+        return {"snapshot_epochs": epochs, "a_hist": a_hist, "b_hist": b_hist, "W_hist": W_hist}
+
+    def load(self, history):
+        """Restaura o histórico gravado por ``state``.
+        """
+        for epoch, a, b, W in zip(history.get("snapshot_epochs", []), history.get("a_hist", []),
+                                  history.get("b_hist", []), history.get("W_hist", [])):
+            self.append(int(epoch), a, b, W)
+
+    def close(self):
+        """Summary
+        """
+        if isinstance(self._params, np.memmap):
+            self._params.flush()
+
+
+class Telemetry(Callback):
+
+    """Repassa cada época a uma lista de callbacks.
+
+    Attributes:
+        callbacks (list): Callbacks na ordem de chamada.
+    """
+
+    def __init__(self, callbacks=()):
+        """Summary
+        """
+        self.callbacks = list(callbacks)
+
+    @classmethod
+    def coerce(cls, callbacks, default=None):
+        """Aceita None (usa ``default``), um callback ou uma lista de callbacks.
+        """
+        if callbacks is None:
+            callbacks = default if default is not None else []
+        if isinstance(callbacks, cls):
+            return callbacks
+        if isinstance(callbacks, Callback):
+            callbacks = [callbacks]
+        return cls(callbacks)
+
+    def find(self, kind):
+        """Primeiro callback do tipo ``kind`` (ou None).
+        """
+        return next((callback for callback in self.callbacks if isinstance(callback, kind)), None)
+
+    def on_epoch(self, epoch, metrics, rbm):
+        """Summary
+        """
+        for callback in self.callbacks:
+            callback.on_epoch(epoch, metrics, rbm)
+
+    def close(self):
+        """Summary
+        """
+        for callback in self.callbacks:
+            callback.close()
@@ -16,15 +16,21 @@
 ====================================================================================================================================================
 """
 
+import os
+import sys
 from pyscf import gto, scf, ao2mo
 import numpy as np
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from integral_store import save_integrals
+
 # Define a molécula H₂ (distância internuclear ~0.74 Å)
 mol = gto.Mole()
 mol.atom = 'H 0 0 0; H 0 0 0.734'
 mol.basis = 'sto-3g'
 mol.spin = 0  # número de elétrons alfa - beta
 mol.charge = 0
+mol.symmetry = True  # grupo pontual abeliano para os irreps dos orbitais
 mol.build()
 
 # SCF (Hartree-Fock) calculation
@@ -37,11 +43,17 @@ n_orb = mf.mo_coeff.shape[1]
 # Matriz de um elétron no espaço de orbitais moleculares (MO)
 h1_mo = mf.mo_coeff.T @ mf.get_hcore() @ mf.mo_coeff
 
-# Integrais de dois elétrons transformados para base MO (antisymmetrized physicist notation)
+# Integrais de dois elétrons transformados para base MO, (pq|rs) com simetria 8 empacotada
 eri = ao2mo.kernel(mol, mf.mo_coeff)
-eri = ao2mo.restore(1, eri, n_orb)  # (pq|rs)
+eri = ao2mo.restore(8, eri, n_orb)
 
 # Salva resultados
-np.savez("h2_integrals.npz", h1=h1_mo, eri=eri, n_orb=n_orb, nelec=mol.nelectron)
+# Irreps dos orbitais (IDs do PySCF: o irrep de um produto é o XOR dos IDs)
+orbsym = scf.hf_symm.get_orbsym(mol, mf.mo_coeff)
+
+# Repulsão nuclear, energia HF e orbitais vão junto: os drivers não refazem o SCF
+save_integrals("h2_integrals.npz", h1_mo, eri, mol.nelectron, mol.energy_nuc(), basis=mol.basis,
+               geometry=mol.atom, orbsym=orbsym, e_nuc=mol.energy_nuc(), e_hf=mf.e_tot,
+               mo_energy=mf.mo_energy, mo_coeff=mf.mo_coeff, mo_occ=mf.mo_occ)
 
 print(f"Integrals salvos: {n_orb} orbitais, {mol.nelectron} elétrons.")
\ No newline at end of file
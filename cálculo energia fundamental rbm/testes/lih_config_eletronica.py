@@ -16,14 +16,20 @@
 ====================================================================================================================================================
 """
 
+import os
+import sys
 import numpy as np
 from pyscf import gto, scf, ao2mo
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from integral_store import save_integrals
+
 # 1. Define a molécula de LiH
 mol = gto.Mole()
 mol.atom = 'Li 0 0 0; H 0 0 1.6'  # distância típica em angstroms
 mol.basis = 'sto-3g'
 mol.spin = 0  # número de elétrons alfa - beta
+mol.symmetry = True  # grupo pontual abeliano para os irreps dos orbitais
 mol.build()
 
 # 2. Hartree-Fock
@@ -34,11 +40,16 @@ mf.kernel()
 n_orb = mf.mo_coeff.shape[1]  # número de orbitais moleculares
 h1 = mf.mo_coeff.T @ mf.get_hcore() @ mf.mo_coeff  # integrais 1-elétron
 eri = ao2mo.kernel(mol, mf.mo_coeff)              # 2-elétrons (formato compactado)
-eri = ao2mo.restore(1, eri, n_orb)                 # restaurar formato (pqrs)
+eri = ao2mo.restore(8, eri, n_orb)                 # (pq|rs) com simetria 8 empacotada
 
 # 4. Número de elétrons
 nelec = mol.nelectron
 
-# 5. Salva os dados
-np.savez("lih_integrals.npz", h1=h1, eri=eri, n_orb=n_orb, nelec=nelec)
+# 5. Irreps dos orbitais (IDs do PySCF: o irrep de um produto é o XOR dos IDs)
+orbsym = scf.hf_symm.get_orbsym(mol, mf.mo_coeff)
+
+# 6. Salva os dados (com repulsão nuclear, energia HF e orbitais: os drivers não refazem o SCF)
+save_integrals("lih_integrals.npz", h1, eri, nelec, mol.energy_nuc(), basis=mol.basis, geometry=mol.atom,
+               orbsym=orbsym, e_nuc=mol.energy_nuc(), e_hf=mf.e_tot, mo_energy=mf.mo_energy,
+               mo_coeff=mf.mo_coeff, mo_occ=mf.mo_occ)
 print(f"✔️ Integrais de LiH (STO-3G) salvos em 'lih_integrals.npz'")
\ No newline at end of file